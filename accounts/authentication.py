@@ -0,0 +1,88 @@
+"""
+JWT 인증 (사용자 캐시)
+
+기본 JWTAuthentication 은 인증된 요청마다 사용자 행을 조회합니다.
+CachedJWTAuthentication 은 짧은 TTL 의 공유 캐시에서 사용자를 꺼내 쓰고,
+User 저장/삭제 시그널에서 캐시를 지웁니다.
+
+뷰에 claims_user_on_read = True 를 지정하면 읽기 요청(GET/HEAD/OPTIONS)에서는
+DB/캐시 조회 없이 토큰 클레임(user_id, username, email, role)만으로 만든
+ClaimsUser 를 request.user 로 사용합니다. 이런 뷰의 읽기 경로에서는 사용자
+객체 대신 request.user.pk 로 필터링해야 합니다.
+"""
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+# 캐시에 저장하는 User 구조가 바뀌면 올려서 기존 항목을 무시
+USER_CACHE_VERSION = 1
+
+
+def user_cache_key(user_id):
+    return f'auth:user:{USER_CACHE_VERSION}:{user_id}'
+
+
+def invalidate_user(user_id):
+    cache.delete(user_cache_key(user_id))
+
+
+class ClaimsUser(TokenUser):
+    """토큰 클레임 기반 사용자 (DB 행 없음, 읽기 전용 요청용)"""
+
+    def __eq__(self, other):
+        if isinstance(other, (TokenUser, get_user_model())):
+            return self.pk == other.pk
+        return NotImplemented
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __hash__(self):
+        return hash(self.pk)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """사용자 캐시 + 읽기 전용 뷰의 클레임 사용자를 지원하는 JWT 인증"""
+
+    def authenticate(self, request):
+        self.request = request
+        return super().authenticate(request)
+
+    def _claims_only(self):
+        request = getattr(self, 'request', None)
+        if request is None or request.method not in SAFE_METHODS:
+            return False
+        view = getattr(request, 'parser_context', {}).get('view')
+        return getattr(view, 'claims_user_on_read', False)
+
+    def get_user(self, validated_token):
+        if api_settings.USER_ID_CLAIM not in validated_token:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        if self._claims_only():
+            return ClaimsUser(validated_token)
+
+        key = user_cache_key(validated_token[api_settings.USER_ID_CLAIM])
+        user = cache.get(key)
+        if user is None:
+            # 미스: 기본 조회 + 검증 후 캐시에 저장
+            user = super().get_user(validated_token)
+            cache.set(key, user, settings.AUTH_USER_CACHE_SECONDS)
+            return user
+
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code='password_changed')
+
+        return user
@@ -0,0 +1,26 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from . import hashing
+
+
+class PooledPasswordBackend(ModelBackend):
+    """비밀번호 검증을 해싱 프로세스 풀에서 실행하는 ModelBackend"""
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        UserModel = get_user_model()
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        try:
+            user = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # 존재하지 않는 사용자도 해싱 비용을 들여 응답 시간 차이를 줄임 (ModelBackend 와 동일)
+            hashing.make_password(password)
+            return None
+
+        if hashing.check_password(user, password) and self.user_can_authenticate(user):
+            return user
+        return None
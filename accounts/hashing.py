@@ -0,0 +1,175 @@
+"""
+비밀번호 해싱 프로세스 풀
+
+PBKDF2 해싱/검증은 요청당 수백 ms 의 CPU 를 쓰므로 요청 스레드 대신
+제한된 크기의 프로세스 풀에서 실행합니다.
+
+- 동시 작업 수(실행 + 대기)가 PASSWORD_HASH_MAX_PENDING 을 넘으면 즉시
+  PasswordHasherBusy (429) 로 거절해, 로그인 폭주가 다른 요청을 막지 않게 합니다.
+  PASSWORD_HASH_TIMEOUT_SECONDS 안에 결과가 없을 때도 429 로 응답하며, 이때 작업은
+  풀에서 계속 실행되므로 자리는 작업이 실제로 끝난 뒤에 반환합니다.
+- 검증 시 해시 알고리즘/반복 횟수가 현재 설정보다 오래되었으면 새 해시로
+  투명하게 갱신합니다. (Django check_password 의 setter 와 같은 동작)
+- PASSWORD_HASH_WORKERS=0 이면 요청 스레드에서 바로 실행합니다. (개발/테스트)
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.contrib.auth import hashers
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+_lock = threading.Lock()
+_executor = None
+_slots = None
+
+
+class PasswordHasherBusy(APIException):
+    """해싱 풀 포화"""
+
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_detail = '요청이 많아 잠시 후 다시 시도해주세요.'
+    default_code = 'password_hasher_busy'
+
+
+def _init_worker():
+    import django
+    django.setup()
+
+
+def _hash(raw_password):
+    return hashers.make_password(raw_password)
+
+
+def _verify(raw_password, encoded):
+    """(일치 여부, 재해싱 필요 여부)"""
+    if not hashers.check_password(raw_password, encoded):
+        return False, False
+    hasher = hashers.identify_hasher(encoded)
+    preferred = hashers.get_hasher('default')
+    return True, hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def _get_executor():
+    global _executor, _slots
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _slots = threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING)
+                _executor = ProcessPoolExecutor(
+                    max_workers=settings.PASSWORD_HASH_WORKERS,
+                    initializer=_init_worker
+                )
+    return _executor
+
+
+def _discard_executor(executor):
+    """워커가 죽은 풀은 버리고 다음 요청에서 새로 만듦"""
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+
+
+def _submit(func, *args):
+    """
+    풀에 작업 제출 → (풀, future), 풀이 깨졌으면 None
+
+    자리가 없으면 PasswordHasherBusy. 자리는 작업이 실제로 끝날 때 반환합니다.
+    """
+    executor = _get_executor()
+    slots = _slots
+    if not slots.acquire(blocking=False):
+        raise PasswordHasherBusy()
+    try:
+        future = executor.submit(func, *args)
+    except BrokenProcessPool:
+        slots.release()
+        _discard_executor(executor)
+        return None
+    except BaseException:
+        slots.release()
+        raise
+    # 시간 초과로 기다리기를 멈춰도 워커는 계속 실행 중이므로 작업이 끝날 때 자리 반환
+    future.add_done_callback(lambda _: slots.release())
+    return executor, future
+
+
+def _result(submitted, func, *args):
+    """제출한 작업의 결과 (시간 초과면 PasswordHasherBusy, 풀이 깨졌으면 직접 실행)"""
+    if submitted is None:
+        return func(*args)
+    executor, future = submitted
+    try:
+        return future.result(timeout=settings.PASSWORD_HASH_TIMEOUT_SECONDS)
+    except FuturesTimeoutError:
+        raise PasswordHasherBusy()
+    except BrokenProcessPool:
+        _discard_executor(executor)
+        return func(*args)
+
+
+def _run(func, *args):
+    """풀에서 실행 (대기열이 가득 차거나 시간 안에 끝나지 않으면 PasswordHasherBusy)"""
+    if not settings.PASSWORD_HASH_WORKERS:
+        return func(*args)
+    return _result(_submit(func, *args), func, *args)
+
+
+def make_password(raw_password):
+    """비밀번호 해시 생성"""
+    return _run(_hash, raw_password)
+
+
+def set_password(user, raw_password):
+    """user.set_password 와 동일 (해싱만 풀에서 실행, 저장은 호출자가)"""
+    user.password = make_password(raw_password)
+    user._password = raw_password
+
+
+def check_password(user, raw_password):
+    """비밀번호 검증 (오래된 해시는 새 해시로 갱신)"""
+    if raw_password is None or not user.has_usable_password():
+        return False
+
+    valid, must_update = _run(_verify, raw_password, user.password)
+    if valid and must_update:
+        set_password(user, raw_password)
+        user.save(update_fields=['password'])
+    return valid
+
+
+def make_passwords(raw_passwords, workers=None, shared=False):
+    """
+    비밀번호 목록 일괄 해싱 (일괄 가입용)
+
+    관리 명령에서는 요청용 풀과 별도로 작업 동안만 프로세스 풀을 만들어 모든 코어를
+    사용합니다. workers=0 이면 현재 프로세스에서 실행합니다.
+    shared=True (API 요청) 이면 요청용 풀에 PASSWORD_HASH_WORKERS 개씩 나눠 제출해
+    PASSWORD_HASH_MAX_PENDING 제한을 함께 따릅니다. (자리가 없으면 PasswordHasherBusy)
+    """
+    raw_passwords = list(raw_passwords)
+    if shared:
+        return _make_passwords_shared(raw_passwords)
+    if workers == 0 or len(raw_passwords) < 2:
+        return [_hash(raw) for raw in raw_passwords]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+        chunksize = max(1, len(raw_passwords) // (pool._max_workers * 4))
+        return list(pool.map(_hash, raw_passwords, chunksize=chunksize))
+
+
+def _make_passwords_shared(raw_passwords):
+    """요청용 풀에서 일괄 해싱 (동시에 최대 PASSWORD_HASH_WORKERS 개)"""
+    if not settings.PASSWORD_HASH_WORKERS:
+        return [_hash(raw) for raw in raw_passwords]
+
+    window = min(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_PENDING)
+    hashed = []
+    for start in range(0, len(raw_passwords), window):
+        batch = raw_passwords[start:start + window]
+        submitted = [_submit(_hash, raw) for raw in batch]
+        hashed.extend(_result(item, _hash, raw) for item, raw in zip(submitted, batch))
+    return hashed
@@ -0,0 +1,89 @@
+"""
+마지막 로그인 시각 기록 (쓰기 병합)
+
+토큰 발급마다 User 를 UPDATE 하는 대신 프로세스 메모리에 모아 두고,
+백그라운드 스레드가 LAST_LOGIN_FLUSH_SECONDS 마다 bulk_update 한 번으로 저장합니다.
+저장에 실패하면 모은 값을 되돌려 다음 주기에 다시 시도합니다.
+저장된 값이 LAST_LOGIN_GRANULARITY_SECONDS 이내로 최근이면 기록하지 않습니다.
+"""
+import atexit
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from analytics.background import PeriodicFlusher
+
+from .authentication import user_cache_key
+from .models import User
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pending = {}
+
+
+def get_flush_interval():
+    return settings.LAST_LOGIN_FLUSH_SECONDS
+
+
+def record_login(user):
+    """로그인 시각 기록 (user.last_login 은 바로 갱신, DB 는 백그라운드 스레드가 저장)"""
+    now = timezone.now()
+    granularity = timedelta(seconds=settings.LAST_LOGIN_GRANULARITY_SECONDS)
+    if user.last_login and now - user.last_login < granularity:
+        return
+
+    user.last_login = now
+    with _lock:
+        _pending[user.pk] = now
+    flusher.ensure_started()
+
+
+def _requeue(pending):
+    """저장하지 못한 시각을 메모리에 되돌림 (사용자별로 더 최근 시각 유지)"""
+    with _lock:
+        for pk, last_login in pending.items():
+            current = _pending.get(pk)
+            if current is None or current < last_login:
+                _pending[pk] = last_login
+
+
+def flush():
+    """모인 로그인 시각을 배치 UPDATE 로 저장"""
+    global _pending
+
+    with _lock:
+        pending, _pending = _pending, {}
+
+    if not pending:
+        return 0
+
+    try:
+        User.objects.bulk_update(
+            [User(pk=pk, last_login=last_login) for pk, last_login in sorted(pending.items())],
+            ['last_login'],
+            batch_size=500
+        )
+    except Exception:
+        _requeue(pending)
+        raise
+    # 시그널 없이 저장했으므로 인증 사용자 캐시 직접 무효화
+    cache.delete_many([user_cache_key(pk) for pk in pending])
+    return len(pending)
+
+
+flusher = PeriodicFlusher('last-login', flush, get_flush_interval)
+
+
+@atexit.register
+def _flush_on_exit():
+    if not _pending:
+        return
+    try:
+        flush()
+    except Exception:
+        logger.exception('마지막 로그인 시각 저장 실패')
@@ -0,0 +1,56 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.contrib.auth import hashers
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from accounts import hashing
+
+
+class Command(BaseCommand):
+    help = (
+        '로그인 비밀번호 검증 처리량을 측정합니다. 요청 스레드 수(--concurrency)만큼 동시에 '
+        '검증을 실행해 요청 스레드 직접 실행과 프로세스 풀 실행의 처리량/지연/거절(429) 수를 비교합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200, help='총 로그인 시도 수')
+        parser.add_argument('--concurrency', type=int, default=16, help='동시 요청 스레드 수')
+
+    def _login(self, encoded):
+        started = time.perf_counter()
+        try:
+            valid, _ = hashing._run(hashing._verify, 'benchmark-password', encoded)
+            assert valid
+            return time.perf_counter() - started, False
+        except hashing.PasswordHasherBusy:
+            return time.perf_counter() - started, True
+
+    def _measure(self, label, encoded, total, concurrency):
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(lambda _: self._login(encoded), range(total)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for latency, rejected in results if not rejected)
+        rejected = sum(1 for _, rejected in results if rejected)
+        p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0
+        self.stdout.write(
+            f'{label:<10} 처리 {len(latencies)}건 / 거절 {rejected}건, '
+            f'{len(latencies) / elapsed:.1f} req/s, '
+            f'p50 {statistics.median(latencies) * 1000 if latencies else 0:.0f}ms, p95 {p95 * 1000:.0f}ms'
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        encoded = hashers.make_password('benchmark-password')
+        total, concurrency = options['requests'], options['concurrency']
+
+        with override_settings(PASSWORD_HASH_WORKERS=0):
+            self._measure('inline', encoded, total, concurrency)
+        if settings.PASSWORD_HASH_WORKERS:
+            hashing._get_executor()
+            self._measure(f'pool({settings.PASSWORD_HASH_WORKERS})', encoded, total, concurrency)
@@ -0,0 +1,37 @@
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.onboarding import detect_format, import_users, read_rows, write_results
+
+
+class Command(BaseCommand):
+    help = 'CSV/JSONL 파일의 사용자를 일괄 가입시키고 행별 결과를 CSV 로 기록합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='사용자 파일 (username,email,password,role,first_name,last_name)')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], default=None, help='파일 형식 (기본값: 확장자로 판단)')
+        parser.add_argument('--result', default=None, help='결과 파일 경로 (기본값: <path>.result.csv)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='조회/삽입 청크 크기')
+        parser.add_argument('--workers', type=int, default=None, help='해싱 프로세스 수 (기본값: CPU 수, 0 이면 현재 프로세스)')
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        if not path.exists():
+            raise CommandError(f'파일을 찾을 수 없습니다: {path}')
+
+        started = time.perf_counter()
+        with path.open(encoding='utf-8-sig', newline='') as stream:
+            rows = read_rows(stream, options['format'] or detect_format(path.name))
+        results = import_users(rows, chunk_size=options['chunk_size'], workers=options['workers'])
+
+        result_path = Path(options['result'] or f'{path}.result.csv')
+        with result_path.open('w', encoding='utf-8', newline='') as stream:
+            write_results(results, stream)
+
+        created = sum(1 for result in results if result['status'] == 'created')
+        self.stdout.write(self.style.SUCCESS(
+            f'{len(results)}행 중 {created}명 가입, {len(results) - created}행 오류 '
+            f'({time.perf_counter() - started:.1f}초). 결과: {result_path}'
+        ))
@@ -0,0 +1,37 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from accounts.tokens import purge_expired_tokens
+
+
+class Command(BaseCommand):
+    help = '만료된 리프레시 토큰(OutstandingToken/BlacklistedToken)을 청크 단위로 삭제합니다. --loop 옵션으로 주기 실행할 수 있습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='한 번에 삭제할 토큰 수'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 주기적으로 정리합니다.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=3600.0,
+            help='--loop 실행 시 정리 간격 (초)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            deleted = purge_expired_tokens(options['chunk_size'])
+            self.stdout.write(f'만료된 토큰 {deleted}개를 삭제했습니다.')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
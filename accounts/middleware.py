@@ -0,0 +1,17 @@
+from .relationships import RelationshipResolver
+
+
+class RelationshipMiddleware:
+    """응답 렌더링 직전 요청 단위 관계 상태(is_following / follows_you)를 일괄로 채우는 미들웨어"""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_template_response(self, request, response):
+        resolver = getattr(request, RelationshipResolver.REQUEST_ATTR, None)
+        if resolver is not None:
+            resolver.resolve()
+        return response
@@ -0,0 +1,206 @@
+"""
+수강생 일괄 가입
+
+CSV/JSONL 로 받은 사용자 목록을 한 번에 가입시킵니다.
+
+1. 행 단위 검증 (필수 값, 이메일/사용자명 형식, 컬럼 길이, 역할, 비밀번호 정책)
+2. 파일 내 중복과 DB 중복을 집합 단위 IN 쿼리로 확인
+3. 비밀번호를 프로세스 풀에서 일괄 해싱 (비밀번호가 없는 행은 사용 불가 비밀번호)
+4. bulk_create(ignore_conflicts=True) 로 청크 단위 삽입 후, 동시 가입 등으로
+   들어가지 않은 행을 다시 확인해 오류로 표시
+
+행마다 {'row', 'username', 'status', 'errors'} 결과를 반환합니다.
+"""
+import csv
+import io
+import json
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.password_validation import validate_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from .models import User
+from . import hashing
+
+FIELDS = ['username', 'email', 'password', 'role', 'first_name', 'last_name']
+ROLES = {value for value, _ in User.ROLE_CHOICES}
+RESULT_FIELDS = ['row', 'username', 'status', 'errors']
+# 길이 제한이 있는 컬럼 (넘으면 bulk_create 가 청크 전체를 실패시키므로 행 오류로 처리)
+MAX_LENGTHS = {
+    field: User._meta.get_field(field).max_length
+    for field in ['username', 'email', 'first_name', 'last_name']
+}
+
+
+def read_rows(stream, fmt):
+    """CSV/JSONL 텍스트 스트림 → 행 dict 목록"""
+    if fmt == 'csv':
+        return [dict(row) for row in csv.DictReader(stream)]
+
+    rows = []
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError:
+            row = None
+        rows.append(row if isinstance(row, dict) else {'_invalid': line})
+    return rows
+
+
+def detect_format(filename):
+    return 'jsonl' if filename.lower().endswith(('.jsonl', '.json', '.ndjson')) else 'csv'
+
+
+def write_results(results, stream):
+    """결과를 CSV 로 기록"""
+    writer = csv.DictWriter(stream, fieldnames=RESULT_FIELDS)
+    writer.writeheader()
+    for result in results:
+        writer.writerow(dict(result, errors='; '.join(result['errors'])))
+
+
+def _clean_row(raw):
+    """행 정규화 + 단일 행 검증 (오류 메시지 목록 반환)"""
+    if '_invalid' in raw:
+        return {}, ['JSON 형식이 올바르지 않습니다.']
+
+    row = {field: str(raw.get(field) or '').strip() for field in FIELDS}
+    row['password'] = str(raw.get('password') or '')
+    row['role'] = row['role'] or 'student'
+    errors = []
+
+    if not row['username']:
+        errors.append('사용자명이 없습니다.')
+    else:
+        row['username'] = User.normalize_username(row['username'])
+        try:
+            User.username_validator(row['username'])
+        except ValidationError as e:
+            errors.extend(e.messages)
+
+    if not row['email']:
+        errors.append('이메일이 없습니다.')
+    else:
+        row['email'] = User.objects.normalize_email(row['email'])
+        try:
+            validate_email(row['email'])
+        except ValidationError as e:
+            errors.extend(e.messages)
+
+    for field, max_length in MAX_LENGTHS.items():
+        if len(row[field]) > max_length:
+            errors.append(f'{field} 는 {max_length}자 이하여야 합니다.')
+
+    if row['role'] not in ROLES:
+        errors.append(f"역할은 {', '.join(sorted(ROLES))} 중 하나여야 합니다.")
+
+    if row['password'] and not errors:
+        try:
+            validate_password(row['password'], user=User(username=row['username'], email=row['email']))
+        except ValidationError as e:
+            errors.extend(e.messages)
+
+    return row, errors
+
+
+def _existing(field, values, chunk_size):
+    """DB 에 이미 있는 값 집합 (청크 단위 IN 쿼리)"""
+    values = list(values)
+    found = set()
+    for start in range(0, len(values), chunk_size):
+        found.update(
+            User.objects.filter(**{f'{field}__in': values[start:start + chunk_size]})
+            .values_list(field, flat=True)
+        )
+    return found
+
+
+def import_users(raw_rows, chunk_size=1000, workers=None, shared_pool=False):
+    """사용자 일괄 가입 (행별 결과 목록 반환, shared_pool 은 hashing.make_passwords 의 shared)"""
+    results = []
+    candidates = []
+    seen_usernames, seen_emails = set(), set()
+
+    for number, raw in enumerate(raw_rows, start=1):
+        row, errors = _clean_row(raw)
+        username = row.get('username', '')
+        if not errors:
+            if username in seen_usernames:
+                errors.append('파일 안에 같은 사용자명이 있습니다.')
+            if row['email'] in seen_emails:
+                errors.append('파일 안에 같은 이메일이 있습니다.')
+            seen_usernames.add(username)
+            seen_emails.add(row['email'])
+
+        result = {'row': number, 'username': username, 'status': 'error', 'errors': errors}
+        results.append(result)
+        if not errors:
+            candidates.append((result, row))
+
+    # DB 중복 확인 (집합 단위)
+    taken_usernames = _existing('username', (row['username'] for _, row in candidates), chunk_size)
+    taken_emails = _existing('email', (row['email'] for _, row in candidates), chunk_size)
+    valid = []
+    for result, row in candidates:
+        if row['username'] in taken_usernames:
+            result['errors'].append('이미 사용 중인 사용자명입니다.')
+        if row['email'] in taken_emails:
+            result['errors'].append('이미 사용 중인 이메일입니다.')
+        if not result['errors']:
+            valid.append((result, row))
+
+    # 비밀번호 일괄 해싱 (없는 경우 사용 불가 비밀번호)
+    with_password = [row['password'] for _, row in valid if row['password']]
+    hashed = iter(hashing.make_passwords(with_password, workers=workers, shared=shared_pool))
+
+    users = []
+    for result, row in valid:
+        password = next(hashed) if row['password'] else make_password(None)
+        users.append(User(
+            username=row['username'],
+            email=row['email'],
+            role=row['role'],
+            first_name=row['first_name'],
+            last_name=row['last_name'],
+            password=password,
+        ))
+
+    # 청크 단위 삽입 후 실제로 들어간 행 확인
+    for start in range(0, len(users), chunk_size):
+        chunk = users[start:start + chunk_size]
+        with transaction.atomic():
+            User.objects.bulk_create(chunk, ignore_conflicts=True)
+        created = set(
+            User.objects.filter(
+                username__in=[user.username for user in chunk],
+                password__in=[user.password for user in chunk]
+            ).values_list('username', flat=True)
+        )
+        # 들어가지 않은 행은 동시 가입과 겹친 값을 다시 확인해 알맞은 메시지로 표시
+        skipped = [(result, row) for result, row in valid[start:start + chunk_size] if result['username'] not in created]
+        taken_usernames = _existing('username', (row['username'] for _, row in skipped), chunk_size)
+        taken_emails = _existing('email', (row['email'] for _, row in skipped), chunk_size)
+        for result, row in valid[start:start + chunk_size]:
+            if result['username'] in created:
+                result['status'] = 'created'
+                continue
+            if row['username'] in taken_usernames:
+                result['errors'].append('이미 사용 중인 사용자명입니다.')
+            if row['email'] in taken_emails:
+                result['errors'].append('이미 사용 중인 이메일입니다.')
+            if not result['errors']:
+                result['errors'].append('다른 가입과 겹쳐 생성되지 않았습니다.')
+
+    return results
+
+
+def read_upload(uploaded_file, fmt=None):
+    """업로드된 파일 → 행 dict 목록 (UTF-8, BOM 허용)"""
+    fmt = fmt or detect_format(uploaded_file.name)
+    stream = io.StringIO(uploaded_file.read().decode('utf-8-sig'))
+    return read_rows(stream, fmt)
@@ -0,0 +1,82 @@
+"""
+공개 프로필 캐시
+
+프로필 응답(사용자 카드 + 강사 요약 + 최근 업로드)을 통째로 캐시해
+조회를 캐시 GET 한 번으로 처리합니다. 사용자 저장이나 강사 요약의 구조적
+변경 시 커밋 후 키를 지우고, 조회수처럼 자주 바뀌는 값은 PROFILE_CACHE_SECONDS
+TTL 안에서만 늦게 반영됩니다. 보는 사람마다 다른 is_following/follows_you 는
+캐시하지 않고 응답 직전에 RelationshipResolver 가 채웁니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import User
+
+# 캐시에 저장하는 응답 구조가 바뀌면 올려서 기존 항목을 무시
+PROFILE_CACHE_VERSION = 1
+
+
+def profile_cache_key(user_id):
+    return f'profile:{PROFILE_CACHE_VERSION}:{user_id}'
+
+
+def invalidate_profile(user_id):
+    cache.delete(profile_cache_key(user_id))
+
+
+def _instructor_stats(user):
+    from videos.models import InstructorStats, Video
+
+    try:
+        stats = user.instructor_stats
+    except InstructorStats.DoesNotExist:
+        if user.role not in ('instructor', 'admin'):
+            return None
+        stats = InstructorStats(instructor=user)
+
+    recent = {
+        video['id']: video
+        for video in Video.objects.filter(pk__in=stats.recent_video_ids, is_public=True).values(
+            'id', 'title', 'thumbnail', 'view_count', 'rating_avg', 'created_at'
+        )
+    }
+    recent_videos = []
+    for pk in stats.recent_video_ids:
+        video = recent.get(pk)
+        if video is None:
+            continue
+        video['thumbnail'] = f"{settings.MEDIA_URL}{video['thumbnail']}" if video['thumbnail'] else None
+        video['rating_avg'] = float(video['rating_avg'])
+        recent_videos.append(video)
+
+    return {
+        'videos_count': stats.videos_count,
+        'total_views': stats.total_views,
+        'ratings_count': stats.ratings_count,
+        'rating_avg': stats.rating_avg,
+        'recent_videos': recent_videos,
+    }
+
+
+def _build(user_id):
+    from .serializers import UserSerializer
+
+    user = User.objects.select_related('instructor_stats').filter(pk=user_id, is_active=True).first()
+    if user is None:
+        return None
+
+    data = dict(UserSerializer(user).data)
+    data['instructor_stats'] = _instructor_stats(user)
+    return data
+
+
+def get_profile(user_id):
+    """공개 프로필 응답 dict (없으면 None). 호출자가 수정해도 되는 사본을 반환"""
+    key = profile_cache_key(user_id)
+    profile = cache.get(key)
+    if profile is None:
+        profile = _build(user_id)
+        if profile is None:
+            return None
+        cache.set(key, profile, settings.PROFILE_CACHE_SECONDS)
+    return dict(profile)
@@ -0,0 +1,100 @@
+"""
+요청 단위 관계 상태 (is_following / follows_you) 일괄 조회
+
+UserSerializer 계열은 직렬화 시점에 사용자 ID와 출력 dict 를 요청 단위
+RelationshipResolver 에 등록만 하고, 응답 렌더링 직전
+RelationshipMiddleware 가 등록된 모든 사용자에 대해 Follow 를 IN 쿼리
+한 번으로 조회해 값을 채웁니다. 응답에 사용자가 몇 명 포함되든
+관계 상태 조회 비용은 쿼리 1회로 고정됩니다.
+"""
+from django.db.models import Q
+
+
+class RelationshipResolver:
+    """요청 단위 관계 상태 수집/일괄 조회기"""
+
+    REQUEST_ATTR = '_relationship_resolver'
+
+    def __init__(self, viewer):
+        self.viewer = viewer
+        self._pending = []
+
+    @classmethod
+    def for_request(cls, request):
+        """요청에 연결된 resolver (로그인하지 않았으면 None)"""
+        if request is None:
+            return None
+
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return None
+
+        # DRF Request 가 감싸고 있는 HttpRequest 에 보관 (미들웨어에서 접근)
+        http_request = getattr(request, '_request', request)
+        resolver = getattr(http_request, cls.REQUEST_ATTR, None)
+        if resolver is None or resolver.viewer.pk != user.pk:
+            resolver = cls(user)
+            setattr(http_request, cls.REQUEST_ATTR, resolver)
+        return resolver
+
+    def register(self, user_id, data):
+        """직렬화 결과 dict 를 나중에 채울 대상으로 등록"""
+        self._pending.append((user_id, data))
+
+    def resolve(self):
+        """등록된 모든 dict 에 관계 상태를 채움 (Follow 쿼리 1회)"""
+        if not self._pending:
+            return
+
+        from social.models import Follow
+
+        viewer_id = self.viewer.pk
+        user_ids = {user_id for user_id, _ in self._pending} - {viewer_id}
+
+        following_ids, follower_ids = set(), set()
+        if user_ids:
+            relations = Follow.objects.filter(
+                Q(follower_id=viewer_id, following_id__in=user_ids) |
+                Q(following_id=viewer_id, follower_id__in=user_ids)
+            ).values_list('follower_id', 'following_id')
+
+            for follower_id, following_id in relations:
+                if follower_id == viewer_id:
+                    following_ids.add(following_id)
+                else:
+                    follower_ids.add(follower_id)
+
+        for user_id, data in self._pending:
+            data['is_following'] = user_id in following_ids
+            data['follows_you'] = user_id in follower_ids
+        self._pending = []
+
+
+class RelationshipStateMixin:
+    """UserSerializer 계열에 is_following / follows_you 를 일괄 조회로 채워주는 Mixin"""
+
+    def get_is_following(self, obj):
+        # 응답 렌더링 직전 RelationshipResolver 가 채움
+        return None
+
+    def get_follows_you(self, obj):
+        # 응답 렌더링 직전 RelationshipResolver 가 채움
+        return None
+
+    def _register_relationship(self, instance, data):
+        resolver = RelationshipResolver.for_request(self.context.get('request'))
+        if resolver is not None:
+            resolver.register(instance.pk, data)
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        self._register_relationship(instance, data)
+        return data
+
+    @property
+    def data(self):
+        # 최상위 Serializer 의 .data 는 복사본(ReturnDict)이므로 함께 등록
+        data = super().data
+        if self.parent is None and self.instance is not None and not isinstance(data, list):
+            self._register_relationship(self.instance, data)
+        return data
@@ -1,19 +1,26 @@
 from rest_framework import serializers
-from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError as DjangoValidationError
 from .models import User
+from .relationships import RelationshipStateMixin
+from .tokens import BloomRefreshToken
+from . import hashing, last_login
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(RelationshipStateMixin, serializers.ModelSerializer):
     """기본 사용자 Serializer"""
 
+    is_following = serializers.SerializerMethodField()
+    follows_you = serializers.SerializerMethodField()
+
     class Meta:
         model = User
         fields = [
             'id', 'username', 'email', 'role', 'is_premium',
             'profile_image', 'bio',
             'followers_count', 'following_count', 'videos_count',
+            'is_following', 'follows_you',
             'date_joined'
         ]
         read_only_fields = [
@@ -22,6 +29,25 @@ class UserSerializer(serializers.ModelSerializer):
         ]
 
 
+# 사용자 카드에 필요한 모델 필드 (목록 조회 시 .only() 에도 사용)
+USER_CARD_MODEL_FIELDS = [
+    'id', 'username', 'role', 'is_premium',
+    'profile_image', 'followers_count'
+]
+
+
+class UserCardSerializer(RelationshipStateMixin, serializers.ModelSerializer):
+    """목록용 간단한 사용자 카드 Serializer"""
+
+    is_following = serializers.SerializerMethodField()
+    follows_you = serializers.SerializerMethodField()
+
+    class Meta:
+        model = User
+        fields = USER_CARD_MODEL_FIELDS + ['is_following', 'follows_you']
+        read_only_fields = USER_CARD_MODEL_FIELDS
+
+
 class UserRegistrationSerializer(serializers.ModelSerializer):
     """회원가입 Serializer"""
 
@@ -83,10 +109,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         validated_data.pop('password_confirm')
         password = validated_data.pop('password')
 
-        user = User.objects.create_user(
-            password=password,
-            **validated_data
-        )
+        # create_user 와 동일 (이메일/사용자명 정규화는 User.clean), 해싱만 프로세스 풀에서
+        user = User(**validated_data)
+        hashing.set_password(user, password)
+        user.save()
         return user
 
 
@@ -111,6 +137,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
 class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     """커스텀 JWT 토큰 Serializer"""
 
+    token_class = BloomRefreshToken
+
     @classmethod
     def get_token(cls, user):
         token = super().get_token(user)
@@ -125,6 +153,9 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     def validate(self, attrs):
         data = super().validate(attrs)
 
+        # 마지막 로그인 시각 (UPDATE_LAST_LOGIN 대신 모아서 저장)
+        last_login.record_login(self.user)
+
         # 응답에 사용자 정보 포함
         data['user'] = UserSerializer(self.user).data
 
@@ -150,7 +181,7 @@ class ChangePasswordSerializer(serializers.Serializer):
     def validate_old_password(self, value):
         """현재 비밀번호 확인"""
         user = self.context['request'].user
-        if not user.check_password(value):
+        if not hashing.check_password(user, value):
             raise serializers.ValidationError('현재 비밀번호가 올바르지 않습니다.')
         return value
 
@@ -174,6 +205,12 @@ class ChangePasswordSerializer(serializers.Serializer):
     def save(self, **kwargs):
         """비밀번호 변경"""
         user = self.context['request'].user
-        user.set_password(self.validated_data['new_password'])
+        hashing.set_password(user, self.validated_data['new_password'])
         user.save()
         return user
+
+
+class CustomTokenRefreshSerializer(TokenRefreshSerializer):
+    """토큰 갱신 Serializer (블랙리스트 확인 앞단에 Bloom filter)"""
+
+    token_class = BloomRefreshToken
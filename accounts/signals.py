@@ -0,0 +1,30 @@
+"""
+사용자 인증/프로필 캐시 무효화, 토큰 블랙리스트 필터 갱신
+
+User 저장/삭제 시 커밋 후 캐시된 사용자와 공개 프로필을 지웁니다.
+BlacklistedToken 이 생성되면 커밋 후 블랙리스트 필터와 공유 버전에 반영합니다.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import invalidate_user
+from .profiles import invalidate_profile
+from .tokens import blacklist_filter
+from .models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    transaction.on_commit(partial(invalidate_user, instance.pk))
+    transaction.on_commit(partial(invalidate_profile, instance.pk))
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def track_blacklisted_token(sender, instance, created, **kwargs):
+    if created:
+        transaction.on_commit(partial(blacklist_filter.added, instance.token.jti))
@@ -0,0 +1,195 @@
+"""
+리프레시 토큰 블랙리스트 Bloom filter
+
+토큰 갱신 시 simplejwt 는 BlacklistedToken 테이블에서 JTI 를 조회합니다.
+대부분의 토큰은 블랙리스트에 없으므로, 프로세스 메모리의 Bloom filter 가
+"확실히 없음" 을 판정하면 DB 조회를 건너뜁니다. ("있을 수도 있음" 이면 DB 확인)
+
+- BlacklistedToken 이 생성되면(경로와 무관하게 post_save 시그널) 커밋 후 로컬 필터에
+  추가하고 공유 캐시의 버전 카운터를 올림
+- 판정마다 버전 카운터를 한 번 읽어(캐시 조회 1회, DB 조회 없음) 바뀌었으면
+  id 가 마지막으로 읽은 값보다 큰 행만 읽어 증분 반영
+- 카운터는 임의의 값에서 시작하므로, 캐시에서 사라졌다 다시 만들어져도 이전 값과
+  겹치지 않아 모든 프로세스가 변경으로 보고 반영함
+- 만료 토큰 정리(purge_expired_tokens) 후나 용량 초과 시 전체 재구성
+- 버전 카운터를 프로세스끼리 공유할 수 없는 캐시(LocMemCache, DummyCache)에서는
+  필터를 쓰지 않고 항상 DB 를 조회 (운영에서는 Redis 등 공유 캐시 사용)
+"""
+import hashlib
+import math
+import secrets
+import threading
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+VERSION_KEY = 'token_blacklist:version'
+GENERATION_KEY = 'token_blacklist:generation'
+
+# 오탐률 1%, 최소 용량
+FALSE_POSITIVE_RATE = 0.01
+MIN_CAPACITY = 10000
+
+# 프로세스 사이에 공유되지 않는 캐시 백엔드 (필터 사용 안 함)
+LOCAL_CACHE_BACKENDS = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+# 증분 반영 시 다시 읽는 id 구간 (동시 트랜잭션이 id 순서와 다르게 커밋되는 경우 대비)
+RELOAD_OVERLAP = 64
+
+
+class BloomFilter:
+    """NumPy 비트 배열 기반 Bloom filter (blake2b 이중 해싱)"""
+
+    def __init__(self, capacity, false_positive_rate=FALSE_POSITIVE_RATE):
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hash_count)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class BlacklistFilter:
+    """블랙리스트 JTI Bloom filter 와 동기화 상태"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bloom = None
+        self.last_id = 0
+        self.recent_ids = set()
+        self.state = None
+
+    def _shared_state(self):
+        state = cache.get_many([VERSION_KEY, GENERATION_KEY])
+        if VERSION_KEY not in state:
+            _reset_version()
+            state[VERSION_KEY] = cache.get(VERSION_KEY)
+        return (state[VERSION_KEY], state.get(GENERATION_KEY))
+
+    def _rebuild(self):
+        now = timezone.now()
+        rows = BlacklistedToken.objects.filter(token__expires_at__gt=now).order_by('id')
+        capacity = max(MIN_CAPACITY, rows.count() * 2)
+        self.bloom = BloomFilter(capacity)
+        self.last_id = 0
+        self.recent_ids = set()
+        self._load(rows)
+
+    def _load(self, rows):
+        for pk, jti in rows.values_list('id', 'token__jti').iterator():
+            if pk in self.recent_ids:
+                continue
+            self.bloom.add(jti)
+            self.recent_ids.add(pk)
+            self.last_id = max(self.last_id, pk)
+        floor = self.last_id - RELOAD_OVERLAP
+        self.recent_ids = {pk for pk in self.recent_ids if pk > floor}
+
+    def sync(self):
+        """공유 버전이 바뀌었으면 새로 추가된 행 반영"""
+        state = self._shared_state()
+        if self.bloom is not None and state == self.state:
+            return
+
+        with self.lock:
+            generation = self.state[1] if self.state else None
+            if self.bloom is None or state[1] != generation:
+                self._rebuild()
+            else:
+                self._load(BlacklistedToken.objects.filter(id__gt=self.last_id - RELOAD_OVERLAP).order_by('id'))
+                if self.bloom.count > self.bloom.capacity:
+                    self._rebuild()
+            self.state = state
+
+    def might_contain(self, jti):
+        self.sync()
+        return jti in self.bloom
+
+    def added(self, jti):
+        """커밋된 블랙리스트 추가를 로컬 필터와 공유 버전에 반영"""
+        with self.lock:
+            if self.bloom is not None:
+                self.bloom.add(jti)
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            _reset_version()
+
+
+blacklist_filter = BlacklistFilter()
+
+
+def _reset_version():
+    """버전 카운터가 없으면 임의의 값으로 생성 (유실 전 값과 겹치지 않도록)"""
+    cache.add(VERSION_KEY, secrets.randbits(62), timeout=None)
+
+
+def filter_enabled():
+    """공유 캐시를 쓰는 경우에만 필터 사용"""
+    return settings.CACHES['default']['BACKEND'] not in LOCAL_CACHE_BACKENDS
+
+
+def invalidate_blacklist_filter():
+    """모든 프로세스의 필터를 다음 조회 때 전체 재구성"""
+    cache.set(GENERATION_KEY, timezone.now().timestamp(), timeout=None)
+
+
+class BloomRefreshToken(RefreshToken):
+    """블랙리스트 확인 전에 Bloom filter 로 음성 판정을 먼저 하는 리프레시 토큰"""
+
+    def check_blacklist(self):
+        if filter_enabled() and not blacklist_filter.might_contain(self.payload[api_settings.JTI_CLAIM]):
+            return
+        super().check_blacklist()
+
+
+def purge_expired_tokens(chunk_size=1000):
+    """
+    만료된 OutstandingToken/BlacklistedToken 을 청크 단위로 삭제
+
+    토큰 수명이 일정하므로 만료 토큰은 id 앞쪽에 몰려 있습니다.
+    id 순으로 chunk_size 개씩 지워 긴 잠금 없이 정리합니다.
+    """
+    now = timezone.now()
+    last_id = 0
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(id__gt=last_id, expires_at__lte=now)
+            .order_by('id')
+            .values_list('id', flat=True)[:chunk_size]
+        )
+        if not ids:
+            break
+
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=ids).delete()
+            OutstandingToken.objects.filter(id__in=ids).delete()
+        deleted += len(ids)
+        last_id = ids[-1]
+
+    if deleted:
+        invalidate_blacklist_filter()
+    return deleted
@@ -5,7 +5,8 @@ from .views import (
     CustomTokenObtainPairView,
     ProfileView,
     ChangePasswordView,
-    UserDetailView
+    UserDetailView,
+    UserImportView
 )
 
 app_name = 'accounts'
@@ -28,4 +29,7 @@ urlpatterns = [
 
     # 사용자 프로필 조회 (공개)
     path('users/<int:pk>/', UserDetailView.as_view(), name='user_detail'),
+
+    # 사용자 일괄 가입 (관리자)
+    path('users/import/', UserImportView.as_view(), name='user_import'),
 ]
@@ -1,8 +1,12 @@
 from rest_framework import generics, status, permissions
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework.parsers import MultiPartParser
+from django.http import Http404
 from rest_framework_simplejwt.views import TokenObtainPairView
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse, inline_serializer
+from rest_framework import serializers
+from django.conf import settings
 from .serializers import (
     UserRegistrationSerializer,
     UserProfileSerializer,
@@ -11,6 +15,8 @@ from .serializers import (
     UserSerializer
 )
 from .models import User
+from . import onboarding, profiles
+from .relationships import RelationshipResolver
 
 
 @extend_schema(
@@ -111,7 +117,10 @@ class ChangePasswordView(APIView):
 @extend_schema(
     tags=['사용자'],
     summary='사용자 프로필 조회',
-    description='특정 사용자의 공개 프로필을 조회합니다.',
+    description=(
+        '특정 사용자의 공개 프로필을 조회합니다. 강사는 instructor_stats 에 공개 영상 수, '
+        '총 조회수, 평균 평점, 최근 업로드가 포함됩니다. (조회수는 최대 수십 초 늦게 반영)'
+    ),
     responses={
         200: OpenApiResponse(
             response=UserSerializer,
@@ -121,7 +130,107 @@ class ChangePasswordView(APIView):
     }
 )
 class UserDetailView(generics.RetrieveAPIView):
-    """사용자 프로필 조회 View (공개)"""
+    """사용자 프로필 조회 View (공개, 프로필 캐시에서 제공)"""
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [permissions.AllowAny]
+    claims_user_on_read = True
+
+    def retrieve(self, request, *args, **kwargs):
+        profile = profiles.get_profile(kwargs['pk'])
+        if profile is None:
+            raise Http404('사용자를 찾을 수 없습니다.')
+
+        # 보는 사람 기준 팔로우 상태는 캐시하지 않고 응답 직전에 채움
+        resolver = RelationshipResolver.for_request(request)
+        if resolver is not None:
+            resolver.register(profile['id'], profile)
+        return Response(profile)
+
+
+class IsAdminRole(permissions.BasePermission):
+    """관리자(is_staff 또는 role=admin)만 허용"""
+
+    def has_permission(self, request, view):
+        user = request.user
+        return bool(user and user.is_authenticated and (user.is_staff or user.role == 'admin'))
+
+
+@extend_schema(
+    tags=['사용자'],
+    summary='사용자 일괄 가입',
+    description=(
+        'CSV/JSONL 파일(username, email, password, role, first_name, last_name)로 사용자를 일괄 가입시킵니다. '
+        '비밀번호가 없는 행은 사용 불가 비밀번호로 생성됩니다. (관리자만 가능) '
+        '요청 안에서 처리하므로 USER_IMPORT_MAX_BYTES/USER_IMPORT_MAX_ROWS 를 넘는 파일은 '
+        'import_users 관리 명령으로 가입시켜야 합니다.'
+    ),
+    request=inline_serializer(
+        name='UserImportRequest',
+        fields={
+            'file': serializers.FileField(),
+            'format': serializers.ChoiceField(choices=['csv', 'jsonl'], required=False),
+        }
+    ),
+    responses={
+        200: OpenApiResponse(description='처리 결과 (가입 수, 오류 행 목록)'),
+        400: OpenApiResponse(description='파일 없음 또는 행 수 초과'),
+        403: OpenApiResponse(description='권한 없음'),
+        413: OpenApiResponse(description='파일 크기 초과'),
+        429: OpenApiResponse(description='비밀번호 해싱 풀 포화')
+    }
+)
+class UserImportView(APIView):
+    """사용자 일괄 가입 View (관리자)"""
+    permission_classes = [IsAdminRole]
+    parser_classes = [MultiPartParser]
+
+    def post(self, request):
+        uploaded = request.FILES.get('file')
+        if uploaded is None:
+            return Response(
+                {'error': '가입시킬 사용자 파일을 첨부해주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        fmt = request.data.get('format') or None
+        if fmt not in (None, 'csv', 'jsonl'):
+            return Response(
+                {'error': 'format 은 csv 또는 jsonl 이어야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if uploaded.size > settings.USER_IMPORT_MAX_BYTES:
+            return Response(
+                {'error': f'파일은 최대 {settings.USER_IMPORT_MAX_BYTES}바이트까지 올릴 수 있습니다. '
+                          '더 큰 파일은 import_users 명령으로 가입시켜주세요.'},
+                status=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+            )
+
+        try:
+            rows = onboarding.read_upload(uploaded, fmt)
+        except UnicodeDecodeError:
+            return Response(
+                {'error': '파일은 UTF-8 로 인코딩되어야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(rows) > settings.USER_IMPORT_MAX_ROWS:
+            return Response(
+                {'error': f'한 번에 최대 {settings.USER_IMPORT_MAX_ROWS}명까지 가입시킬 수 있습니다. '
+                          '더 큰 파일은 import_users 명령으로 가입시켜주세요.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # 요청 처리 중에는 로그인과 같은 해싱 풀을 사용 (풀이 가득 차면 429)
+        results = onboarding.import_users(rows, shared_pool=True)
+
+        created = sum(1 for result in results if result['status'] == 'created')
+        return Response(
+            {
+                'total': len(results),
+                'created': created,
+                'failed': len(results) - created,
+                'errors': [result for result in results if result['status'] != 'created'],
+            },
+            status=status.HTTP_200_OK
+        )
@@ -1,3 +1,53 @@
 from django.contrib import admin
+from .models import CompactedSegment, PlaybackDaily, RetentionCurve, VideoStatsRollup, ViewerSketch
 
-# Register your models here.
+
+@admin.register(ViewerSketch)
+class ViewerSketchAdmin(admin.ModelAdmin):
+    """고유 방문자 스케치 Admin"""
+
+    list_display = ['target_type', 'target_id', 'estimate', 'updated_at']
+    list_filter = ['target_type']
+    exclude = ['registers']
+    readonly_fields = ['estimate', 'updated_at']
+
+
+@admin.register(PlaybackDaily)
+class PlaybackDailyAdmin(admin.ModelAdmin):
+    """일간 재생 집계 Admin"""
+
+    list_display = ['video', 'date', 'plays', 'completes', 'watch_seconds', 'updated_at']
+    list_filter = ['date']
+    search_fields = ['video__title']
+    raw_id_fields = ['video']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(CompactedSegment)
+class CompactedSegmentAdmin(admin.ModelAdmin):
+    """압축된 세그먼트 Admin"""
+
+    list_display = ['name', 'events', 'compacted_at']
+    readonly_fields = ['compacted_at']
+
+
+@admin.register(VideoStatsRollup)
+class VideoStatsRollupAdmin(admin.ModelAdmin):
+    """영상 기간 집계 Admin"""
+
+    list_display = ['video', 'period', 'start', 'views', 'completions', 'ratings', 'comments', 'updated_at']
+    list_filter = ['period']
+    search_fields = ['video__title']
+    raw_id_fields = ['video']
+    readonly_fields = ['updated_at']
+
+
+@admin.register(RetentionCurve)
+class RetentionCurveAdmin(admin.ModelAdmin):
+    """시청 유지 곡선 Admin"""
+
+    list_display = ['video', 'bucket_seconds', 'sessions', 'updated_at']
+    search_fields = ['video__title']
+    raw_id_fields = ['video']
+    exclude = ['counts']
+    readonly_fields = ['bucket_seconds', 'sessions', 'updated_at']
@@ -0,0 +1,48 @@
+"""
+백그라운드 주기 플러시
+
+요청 처리 중에 메모리에 모아 둔 값(방문자 스케치, 집계 증분 등)을 요청 경로가 아닌
+프로세스별 데몬 스레드에서 주기적으로 저장합니다. 스레드는 첫 기록 때 시작하고,
+fork 된 자식 프로세스에서는 다시 시작합니다. 플러시 오류는 로그만 남기고
+다음 주기에 재시도합니다. (데이터 보존은 각 flush 함수가 실패 시 되돌려 놓는 방식)
+"""
+import logging
+import os
+import threading
+import time
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicFlusher:
+    """interval() 초마다 flush() 를 호출하는 프로세스별 데몬 스레드"""
+
+    def __init__(self, name, flush, interval):
+        self.name = name
+        self.flush = flush
+        self.interval = interval
+        self.lock = threading.Lock()
+        self.pid = None
+
+    def ensure_started(self):
+        pid = os.getpid()
+        if self.pid == pid:
+            return
+        with self.lock:
+            if self.pid == pid:
+                return
+            self.pid = pid
+            threading.Thread(target=self._run, name=self.name, daemon=True).start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.interval())
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception('%s 주기 저장 실패', self.name)
+            finally:
+                close_old_connections()
@@ -0,0 +1,128 @@
+"""
+재생 이벤트 WAL 압축
+
+봉인된 세그먼트를 읽어 (영상, 날짜)별 이벤트 수와 시청 시간을 메모리에서 합산한 뒤
+트랜잭션 하나로 PlaybackDaily 와 시청 유지 곡선(retention)에 더합니다.
+같은 트랜잭션에서 CompactedSegment 를 기록하므로, 커밋 후 파일 삭제 전에 죽어도
+다음 실행에서 중복 집계하지 않습니다. 반영 중 DB 연결 외의 오류가 난 세그먼트는
+격리 디렉터리(wal.QUARANTINE_DIR)로 옮기고 다음 세그먼트를 계속 처리합니다.
+
+시청 시간은 같은 세션/영상에서 연속한 재생 위치의 증가분을 더합니다.
+(seek 는 기준 위치만 옮기고, MAX_PROGRESS_GAP 보다 큰 증가분은 건너뜀으로 봅니다.
+세그먼트 경계에서는 기준 위치가 없어 progress 간격 하나만큼 덜 집계될 수 있습니다.)
+"""
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.db import IntegrityError, InterfaceError, OperationalError, transaction
+from django.utils import timezone
+
+from videos.models import Video
+
+from . import retention, wal
+from .events import COMPLETE, MAX_PROGRESS_GAP, PAUSE, PLAY, PROGRESS, SEEK, decode_record
+from .models import CompactedSegment, PlaybackDaily
+from .rollups import add_to_rows
+
+logger = logging.getLogger(__name__)
+
+COUNT_FIELDS = {
+    PLAY: 'plays',
+    PAUSE: 'pauses',
+    SEEK: 'seeks',
+    PROGRESS: 'progress_events',
+    COMPLETE: 'completes',
+}
+ROLLUP_FIELDS = list(COUNT_FIELDS.values()) + ['watch_seconds']
+
+# CompactedSegment 기록 보관 기간
+COMPACTED_RETENTION = timedelta(days=7)
+
+
+def read_segment(path):
+    """세그먼트 → 레코드 목록 (비정상 종료로 잘린 줄은 건너뜀)"""
+    records = []
+    with open(path, 'rb') as segment:
+        for number, line in enumerate(segment, start=1):
+            try:
+                records.append(decode_record(line))
+            except ValueError:
+                logger.warning('재생 이벤트 세그먼트 %s 의 %d번째 줄을 읽을 수 없습니다.', path.name, number)
+    return records
+
+
+def aggregate(records):
+    """레코드 → {(영상 ID, 날짜): {필드: 값}}"""
+    totals = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+    positions = {}
+    for received_at, _user_id, session, events in records:
+        date = timezone.localdate(datetime.fromtimestamp(received_at, tz=dt_timezone.utc))
+        for code, video_id, position in events:
+            row = totals[(video_id, date)]
+            row[COUNT_FIELDS[code]] += 1
+
+            key = (session, video_id)
+            if code in (PLAY, SEEK):
+                positions[key] = position
+                continue
+            previous = positions.get(key)
+            if previous is not None and 0 < position - previous <= MAX_PROGRESS_GAP:
+                row['watch_seconds'] += position - previous
+            if code == PAUSE:
+                positions.pop(key, None)
+            else:
+                positions[key] = position
+    return totals
+
+
+def apply_totals(totals):
+    """집계를 PlaybackDaily 에 더함 (트랜잭션 안에서 호출)"""
+    video_ids = set(
+        Video.objects.filter(id__in={video_id for video_id, _ in totals}).values_list('id', flat=True)
+    )
+    return add_to_rows(
+        PlaybackDaily,
+        {key: row for key, row in totals.items() if key[0] in video_ids},
+        ('video_id', 'date')
+    )
+
+
+def compact_segment(path):
+    """세그먼트 하나를 DB 에 반영하고 삭제 (반영한 이벤트 수 반환)"""
+    records = read_segment(path)
+    event_count = sum(len(events) for *_, events in records)
+
+    try:
+        with transaction.atomic():
+            CompactedSegment.objects.create(name=path.name, events=event_count)
+            apply_totals(aggregate(records))
+            retention.apply_records(records)
+    except IntegrityError:
+        if not CompactedSegment.objects.filter(name=path.name).exists():
+            raise
+        # 이미 반영된 세그먼트 (이전 실행이 삭제 전에 종료)
+        event_count = 0
+
+    path.unlink(missing_ok=True)
+    return event_count
+
+
+def compact_pending(limit=None):
+    """봉인된 세그먼트를 오래된 순으로 압축 (세그먼트 수, 이벤트 수)"""
+    wal.seal_abandoned()
+    segments = wal.sealed_segments()[:limit]
+    events = 0
+    for path in segments:
+        try:
+            events += compact_segment(path)
+        except (OperationalError, InterfaceError):
+            # DB 연결 문제는 세그먼트 문제가 아니므로 다음 실행에서 재시도
+            raise
+        except Exception:
+            logger.exception('재생 이벤트 세그먼트 %s 를 반영할 수 없어 격리합니다.', path.name)
+            wal.quarantine(path)
+
+    CompactedSegment.objects.filter(compacted_at__lt=timezone.now() - COMPACTED_RETENTION).delete()
+    retention.purge_sessions()
+    return len(segments), events
@@ -0,0 +1,160 @@
+"""
+강사 대시보드
+
+강사의 모든 영상에 대한 영상별/전체 지표를 GROUP BY 쿼리 4번으로 계산합니다.
+(영상 목록, 평가, 완강, 미답변 질문)
+
+결과는 ANALYTICS_DASHBOARD_CACHE_SECONDS 동안 캐시하고, 캐시가 비었을 때는
+공유 캐시의 잠금 키(cache.add)를 얻은 요청 하나만 계산합니다(single-flight).
+나머지 요청은 결과가 채워질 때까지 잠시 기다렸다가 읽고, 계산한 요청이
+DASHBOARD_LOCK_SECONDS 안에 끝내지 못하면 직접 계산합니다.
+잠금 값은 요청마다 다른 토큰이라, 잠금이 만료된 뒤 끝난 요청이 다른 요청의 잠금을
+지우지 않습니다.
+"""
+import time
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q, Sum
+from django.utils import timezone
+
+from community.models import Question
+from social.models import VideoRating
+from videos.models import Video, VideoCompletion
+
+# 캐시에 저장하는 결과 구조가 바뀌면 올려서 기존 항목을 무시
+DASHBOARD_CACHE_VERSION = 1
+
+# 계산 잠금 유지 시간과 대기 요청의 확인 간격 (초)
+DASHBOARD_LOCK_SECONDS = 10
+DASHBOARD_POLL_SECONDS = 0.05
+
+# 지표별 상위 영상 수, 평점 순위에 들기 위한 최소 평가 수
+TOP_VIDEOS = 5
+TOP_RATING_MIN_COUNT = 3
+
+
+def dashboard_cache_key(instructor_id):
+    return f'dashboard:{DASHBOARD_CACHE_VERSION}:{instructor_id}'
+
+
+def _ratio(numerator, denominator, digits=4):
+    return round(numerator / denominator, digits) if denominator else None
+
+
+def _top(rows, key):
+    """지표 상위 영상 ID (동률은 조회수 순)"""
+    ranked = sorted(
+        (row for row in rows if row[key] is not None),
+        key=lambda row: (row[key], row['view_count']),
+        reverse=True
+    )
+    return [row['id'] for row in ranked[:TOP_VIDEOS]]
+
+
+def compute(instructor_id):
+    """강사 대시보드 계산 (쿼리 4회)"""
+    videos = list(
+        Video.objects.filter(instructor_id=instructor_id)
+        .order_by('-created_at')
+        .values('id', 'title', 'is_public', 'view_count', 'unique_viewers', 'created_at')
+    )
+
+    ratings = {
+        row['video_id']: row
+        for row in VideoRating.objects.filter(video__instructor_id=instructor_id)
+        .values('video_id').annotate(count=Count('id'), total=Sum('rating'))
+    }
+    completions = dict(
+        VideoCompletion.objects.filter(video__instructor_id=instructor_id, is_completed=True)
+        .values('video_id').annotate(count=Count('id')).values_list('video_id', 'count')
+    )
+    questions = {
+        row['video_id']: row
+        for row in Question.objects.filter(video__instructor_id=instructor_id)
+        .values('video_id').annotate(count=Count('id'), open=Count('id', filter=Q(is_answered=False)))
+    }
+
+    totals = dict.fromkeys(
+        ['views', 'unique_viewers', 'ratings', 'rating_sum', 'completions', 'questions', 'open_questions'], 0
+    )
+    rows = []
+    for video in videos:
+        rating = ratings.get(video['id'], {'count': 0, 'total': 0})
+        question = questions.get(video['id'], {'count': 0, 'open': 0})
+        completed = completions.get(video['id'], 0)
+        # 완강률 = 완강 수 / 고유 시청자 수 (추정치이므로 1 을 넘지 않게 제한)
+        viewers = video['unique_viewers'] or video['view_count']
+        row = {
+            **video,
+            'ratings': rating['count'],
+            'rating_avg': _ratio(rating['total'], rating['count'], 2),
+            'completions': completed,
+            'completion_rate': min(1.0, _ratio(completed, viewers)) if viewers else None,
+            'questions': question['count'],
+            'open_questions': question['open'],
+        }
+        rows.append(row)
+
+        totals['views'] += video['view_count']
+        totals['unique_viewers'] += video['unique_viewers']
+        totals['ratings'] += rating['count']
+        totals['rating_sum'] += rating['total']
+        totals['completions'] += completed
+        totals['questions'] += question['count']
+        totals['open_questions'] += question['open']
+
+    totals.update(
+        videos=len(videos),
+        public_videos=sum(1 for video in videos if video['is_public']),
+        rating_avg=_ratio(totals.pop('rating_sum'), totals['ratings'], 2),
+        completion_rate=min(1.0, _ratio(totals['completions'], totals['unique_viewers']))
+        if totals['unique_viewers'] else None,
+    )
+
+    return {
+        'instructor': instructor_id,
+        'generated_at': timezone.now(),
+        'totals': totals,
+        'top': {
+            'views': _top(rows, 'view_count'),
+            'rating_avg': _top([row for row in rows if row['ratings'] >= TOP_RATING_MIN_COUNT], 'rating_avg'),
+            'completion_rate': _top(rows, 'completion_rate'),
+            'open_questions': _top([row for row in rows if row['open_questions']], 'open_questions'),
+        },
+        'videos': rows,
+    }
+
+
+def get_dashboard(instructor_id):
+    """캐시된 대시보드 (비었으면 요청 하나만 계산)"""
+    key = dashboard_cache_key(instructor_id)
+    dashboard = cache.get(key)
+    if dashboard is not None:
+        return dashboard
+
+    lock_key = f'{key}:lock'
+    deadline = time.monotonic() + DASHBOARD_LOCK_SECONDS
+    token = uuid4().hex
+    while not cache.add(lock_key, token, timeout=DASHBOARD_LOCK_SECONDS):
+        # 다른 요청이 계산 중: 결과가 채워질 때까지 대기
+        time.sleep(DASHBOARD_POLL_SECONDS)
+        dashboard = cache.get(key)
+        if dashboard is not None:
+            return dashboard
+        if time.monotonic() >= deadline:
+            return compute(instructor_id)
+
+    try:
+        # 잠금을 기다리는 사이 다른 요청이 채웠을 수 있음
+        dashboard = cache.get(key)
+        if dashboard is not None:
+            return dashboard
+        dashboard = compute(instructor_id)
+        cache.set(key, dashboard, settings.ANALYTICS_DASHBOARD_CACHE_SECONDS)
+    finally:
+        # 만료 후 다른 요청이 얻은 잠금은 지우지 않음 (확인과 삭제 사이의 짧은 경합은 허용)
+        if cache.get(lock_key) == token:
+            cache.delete(lock_key)
+    return dashboard
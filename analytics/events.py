@@ -0,0 +1,81 @@
+"""
+재생 이벤트 배치 검증
+
+클라이언트는 한 세션의 이벤트를 모아 한 번에 보냅니다.
+
+    {"session": "<재생 세션 ID>", "events": [
+        {"type": "play", "video": 12, "position": 0},
+        {"type": "progress", "video": 12, "position": 15.2},
+        ...
+    ]}
+
+요청마다 수백 개의 이벤트가 들어오므로 시리얼라이저 대신 타입/범위만
+확인하는 루프로 검증하고, 잘못된 이벤트는 배치 전체를 거절하지 않고 버립니다.
+영상 존재 여부는 압축(compaction) 단계에서 한 번에 확인합니다.
+"""
+import json
+
+# 이벤트 종류 → WAL 에 기록하는 코드
+EVENT_TYPES = ('play', 'pause', 'seek', 'progress', 'complete')
+EVENT_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+PLAY, PAUSE, SEEK, PROGRESS, COMPLETE = range(len(EVENT_TYPES))
+
+# 같은 세션에서 연속한 두 재생 위치 사이를 시청으로 인정하는 최대 간격 (초)
+MAX_PROGRESS_GAP = 60
+
+MAX_SESSION_LENGTH = 64
+MAX_POSITION_SECONDS = 24 * 60 * 60
+# 영상 ID 상한 (BigAutoField 범위, 넘으면 압축 단계에서 정수 변환 오류)
+MAX_VIDEO_ID = 2 ** 63 - 1
+
+
+class InvalidBatch(ValueError):
+    """배치 형식 오류 (요청 전체 거절)"""
+
+
+def parse_batch(data, max_events):
+    """
+    요청 본문 → (세션 ID, [[코드, 영상 ID, 위치(초)], ...], 버린 이벤트 수)
+
+    배치 자체가 잘못되었으면 InvalidBatch
+    """
+    if not isinstance(data, dict):
+        raise InvalidBatch('요청 본문은 객체여야 합니다.')
+
+    session = data.get('session')
+    if not isinstance(session, str) or not 0 < len(session) <= MAX_SESSION_LENGTH:
+        raise InvalidBatch(f'session 은 1~{MAX_SESSION_LENGTH}자 문자열이어야 합니다.')
+
+    events = data.get('events')
+    if not isinstance(events, list) or not events:
+        raise InvalidBatch('events 는 비어 있지 않은 목록이어야 합니다.')
+    if len(events) > max_events:
+        raise InvalidBatch(f'한 번에 최대 {max_events}개의 이벤트를 보낼 수 있습니다.')
+
+    accepted = []
+    for event in events:
+        if not isinstance(event, dict):
+            continue
+        code = EVENT_CODES.get(event.get('type'))
+        video = event.get('video')
+        position = event.get('position', 0)
+        if (
+            code is None
+            or type(video) is not int or not 0 < video <= MAX_VIDEO_ID
+            or type(position) not in (int, float) or not 0 <= position <= MAX_POSITION_SECONDS
+        ):
+            continue
+        accepted.append([code, video, round(position, 1)])
+
+    return session, accepted, len(events) - len(accepted)
+
+
+def encode_record(received_at, user_id, session, events):
+    """WAL 한 줄 (배치 1개 = 1줄)"""
+    return (json.dumps([round(received_at, 3), user_id, session, events], separators=(',', ':')) + '\n').encode()
+
+
+def decode_record(line):
+    """WAL 한 줄 → (수신 시각, 사용자 ID, 세션 ID, 이벤트 목록)"""
+    received_at, user_id, session, events = json.loads(line)
+    return received_at, user_id, session, events
@@ -0,0 +1,60 @@
+"""
+HyperLogLog 고유 방문자 추정
+
+정밀도 p=12 (레지스터 4096개, 1바이트씩 = 항목당 4KB 고정) 기준
+표준 오차는 약 1.04 / sqrt(4096) ≈ 1.6% 입니다.
+레지스터 배열끼리 원소별 최댓값을 취하면 합집합 스케치가 되므로
+프로세스별 스케치를 DB 스케치에 그대로 병합할 수 있습니다.
+"""
+import hashlib
+
+import numpy as np
+
+PRECISION = 12
+NUM_REGISTERS = 1 << PRECISION
+_HASH_BITS = 64
+_ALPHA = 0.7213 / (1 + 1.079 / NUM_REGISTERS)
+
+
+def _hash(value):
+    return int.from_bytes(
+        hashlib.blake2b(str(value).encode(), digest_size=8).digest(), 'big'
+    )
+
+
+class HyperLogLog:
+    """HyperLogLog 스케치"""
+
+    __slots__ = ('registers',)
+
+    def __init__(self, registers=None):
+        if registers is None:
+            self.registers = np.zeros(NUM_REGISTERS, dtype=np.uint8)
+        else:
+            self.registers = np.frombuffer(bytes(registers), dtype=np.uint8).copy()
+
+    def add(self, value):
+        hashed = _hash(value)
+        index = hashed >> (_HASH_BITS - PRECISION)
+        remainder = hashed & ((1 << (_HASH_BITS - PRECISION)) - 1)
+        # 남은 비트에서 첫 1 비트의 위치 (모두 0이면 최댓값)
+        rank = (_HASH_BITS - PRECISION) - remainder.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        registers = self.registers.astype(np.float64)
+        estimate = _ALPHA * NUM_REGISTERS * NUM_REGISTERS / np.sum(np.exp2(-registers))
+
+        # 작은 범위 보정 (linear counting)
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * NUM_REGISTERS and zeros:
+            estimate = NUM_REGISTERS * np.log(NUM_REGISTERS / zeros)
+        return int(round(estimate))
+
+    def to_bytes(self):
+        return self.registers.tobytes()
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from analytics.compaction import compact_pending
+
+
+class Command(BaseCommand):
+    help = '봉인된 재생 이벤트 WAL 세그먼트를 일간 집계로 압축합니다. --loop 옵션으로 주기 실행할 수 있습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--limit',
+            type=int,
+            default=None,
+            help='한 번에 처리할 최대 세그먼트 수'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 주기적으로 압축합니다.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=10.0,
+            help='--loop 실행 시 압축 간격 (초)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            segments, events = compact_pending(options['limit'])
+            if segments or not options['loop']:
+                self.stdout.write(f'세그먼트 {segments}개 (이벤트 {events}개)를 집계했습니다.')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
@@ -0,0 +1,39 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from analytics.rollups import RollupNotSettled, rebuild_day
+
+
+class Command(BaseCommand):
+    help = '일간 영상 집계를 원본(완강/평가/댓글)으로 보정하고 주간/월간 집계를 다시 만듭니다. (매일 새벽 cron 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            help='보정할 마지막 날짜 (YYYY-MM-DD, 기본값: 어제)'
+        )
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=1,
+            help='--date 부터 거슬러 올라가며 보정할 일수 (처음 도입 시 과거 데이터 채우기용)'
+        )
+
+    def handle(self, *args, **options):
+        if options['date']:
+            try:
+                last = date.fromisoformat(options['date'])
+            except ValueError:
+                raise CommandError('--date 는 YYYY-MM-DD 형식이어야 합니다.')
+        else:
+            last = timezone.localdate() - timedelta(days=1)
+
+        for offset in range(options['days']):
+            day = last - timedelta(days=offset)
+            try:
+                videos = rebuild_day(day)
+            except RollupNotSettled as exc:
+                raise CommandError(str(exc))
+            self.stdout.write(f'{day}: 영상 {videos}개의 집계를 보정했습니다.')
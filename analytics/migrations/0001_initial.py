@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViewerSketch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('target_type', models.CharField(choices=[('question', '질문'), ('video', '영상')], max_length=20, verbose_name='대상 종류')),
+                ('target_id', models.PositiveBigIntegerField(verbose_name='대상 ID')),
+                ('registers', models.BinaryField(verbose_name='HLL 레지스터')),
+                ('estimate', models.PositiveIntegerField(default=0, verbose_name='추정 고유 방문자 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '고유 방문자 스케치',
+                'verbose_name_plural': '고유 방문자 스케치 목록',
+                'unique_together': {('target_type', 'target_id')},
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0001_initial'),
+        ('videos', '0003_instructor_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CompactedSegment',
+            fields=[
+                ('name', models.CharField(max_length=100, primary_key=True, serialize=False, verbose_name='세그먼트 파일명')),
+                ('events', models.PositiveIntegerField(default=0, verbose_name='이벤트 수')),
+                ('compacted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': '압축된 세그먼트',
+                'verbose_name_plural': '압축된 세그먼트 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='PlaybackDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('plays', models.PositiveIntegerField(default=0, verbose_name='재생 수')),
+                ('pauses', models.PositiveIntegerField(default=0, verbose_name='일시정지 수')),
+                ('seeks', models.PositiveIntegerField(default=0, verbose_name='탐색 수')),
+                ('completes', models.PositiveIntegerField(default=0, verbose_name='끝까지 재생 수')),
+                ('progress_events', models.PositiveIntegerField(default=0, verbose_name='진행 이벤트 수')),
+                ('watch_seconds', models.FloatField(default=0, verbose_name='시청 시간(초)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='playback_daily', to='videos.video', verbose_name='영상')),
+            ],
+            options={
+                'verbose_name': '일간 재생 집계',
+                'verbose_name_plural': '일간 재생 집계 목록',
+                'ordering': ['-date'],
+                'unique_together': {('video', 'date')},
+            },
+        ),
+    ]
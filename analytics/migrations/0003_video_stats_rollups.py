@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:58
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0002_playback_rollups'),
+        ('videos', '0003_instructor_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='VideoStatsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', '일간'), ('week', '주간'), ('month', '월간')], max_length=10, verbose_name='기간 단위')),
+                ('start', models.DateField(verbose_name='기간 시작일')),
+                ('views', models.PositiveIntegerField(default=0, verbose_name='조회수')),
+                ('completions', models.PositiveIntegerField(default=0, verbose_name='완강 수')),
+                ('ratings', models.PositiveIntegerField(default=0, verbose_name='평가 수')),
+                ('rating_sum', models.PositiveIntegerField(default=0, verbose_name='평점 합계')),
+                ('comments', models.PositiveIntegerField(default=0, verbose_name='댓글 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stats_rollups', to='videos.video', verbose_name='영상')),
+            ],
+            options={
+                'verbose_name': '영상 기간 집계',
+                'verbose_name_plural': '영상 기간 집계 목록',
+                'ordering': ['period', '-start'],
+                'unique_together': {('video', 'period', 'start')},
+            },
+        ),
+    ]
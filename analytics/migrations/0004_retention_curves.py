@@ -0,0 +1,29 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_video_stats_rollups'),
+        ('videos', '0003_instructor_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RetentionCurve',
+            fields=[
+                ('video', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='retention_curve', serialize=False, to='videos.video', verbose_name='영상')),
+                ('bucket_seconds', models.PositiveSmallIntegerField(verbose_name='구간 길이(초)')),
+                ('sessions', models.PositiveIntegerField(default=0, verbose_name='시청 세션 수')),
+                ('counts', models.BinaryField(default=bytes, verbose_name='구간별 시청 세션 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '시청 유지 곡선',
+                'verbose_name_plural': '시청 유지 곡선 목록',
+            },
+        ),
+    ]
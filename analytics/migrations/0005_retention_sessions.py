@@ -0,0 +1,30 @@
+# Generated by Django 5.0.1 on 2026-10-19 09:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0004_retention_curves'),
+        ('videos', '0003_instructor_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RetentionSession',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session', models.CharField(max_length=64, verbose_name='재생 세션 ID')),
+                ('buckets', models.BinaryField(default=bytes, verbose_name='센 버킷 비트맵')),
+                ('updated_at', models.DateTimeField(auto_now=True, db_index=True)),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='retention_sessions', to='videos.video', verbose_name='영상')),
+            ],
+            options={
+                'verbose_name': '유지 곡선 세션',
+                'verbose_name_plural': '유지 곡선 세션 목록',
+                'unique_together': {('video', 'session')},
+            },
+        ),
+    ]
@@ -1,3 +1,222 @@
 from django.db import models
 
-# Create your models here.
+
+class ViewerSketch(models.Model):
+    """고유 방문자 HyperLogLog 스케치 (대상별 4KB 고정)"""
+
+    TARGET_TYPE_CHOICES = (
+        ('question', '질문'),
+        ('video', '영상'),
+    )
+
+    target_type = models.CharField(
+        max_length=20,
+        choices=TARGET_TYPE_CHOICES,
+        verbose_name='대상 종류'
+    )
+    target_id = models.PositiveBigIntegerField(
+        verbose_name='대상 ID'
+    )
+    registers = models.BinaryField(
+        verbose_name='HLL 레지스터'
+    )
+    estimate = models.PositiveIntegerField(
+        default=0,
+        verbose_name='추정 고유 방문자 수'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '고유 방문자 스케치'
+        verbose_name_plural = '고유 방문자 스케치 목록'
+        unique_together = [['target_type', 'target_id']]
+
+    def __str__(self):
+        return f"{self.target_type}:{self.target_id} ≈ {self.estimate}"
+
+
+class PlaybackDaily(models.Model):
+    """영상별 일간 재생 이벤트 집계 (WAL 세그먼트 압축 결과)"""
+
+    video = models.ForeignKey(
+        'videos.Video',
+        on_delete=models.CASCADE,
+        related_name='playback_daily',
+        verbose_name='영상'
+    )
+    date = models.DateField(
+        verbose_name='날짜'
+    )
+    plays = models.PositiveIntegerField(
+        default=0,
+        verbose_name='재생 수'
+    )
+    pauses = models.PositiveIntegerField(
+        default=0,
+        verbose_name='일시정지 수'
+    )
+    seeks = models.PositiveIntegerField(
+        default=0,
+        verbose_name='탐색 수'
+    )
+    completes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='끝까지 재생 수'
+    )
+    progress_events = models.PositiveIntegerField(
+        default=0,
+        verbose_name='진행 이벤트 수'
+    )
+    watch_seconds = models.FloatField(
+        default=0,
+        verbose_name='시청 시간(초)'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '일간 재생 집계'
+        verbose_name_plural = '일간 재생 집계 목록'
+        unique_together = [['video', 'date']]
+        ordering = ['-date']
+
+    def __str__(self):
+        return f"{self.video_id} {self.date} (재생 {self.plays})"
+
+
+class CompactedSegment(models.Model):
+    """DB 에 반영된 WAL 세그먼트 (같은 세그먼트를 두 번 집계하지 않도록 기록)"""
+
+    name = models.CharField(
+        max_length=100,
+        primary_key=True,
+        verbose_name='세그먼트 파일명'
+    )
+    events = models.PositiveIntegerField(
+        default=0,
+        verbose_name='이벤트 수'
+    )
+    compacted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '압축된 세그먼트'
+        verbose_name_plural = '압축된 세그먼트 목록'
+
+    def __str__(self):
+        return self.name
+
+
+class VideoStatsRollup(models.Model):
+    """영상별 기간 집계 (일간 행은 이벤트로 증분 갱신, 주간/월간은 같은 증분 + 일간 행에서 재계산)"""
+
+    PERIOD_CHOICES = (
+        ('day', '일간'),
+        ('week', '주간'),
+        ('month', '월간'),
+    )
+
+    video = models.ForeignKey(
+        'videos.Video',
+        on_delete=models.CASCADE,
+        related_name='stats_rollups',
+        verbose_name='영상'
+    )
+    period = models.CharField(
+        max_length=10,
+        choices=PERIOD_CHOICES,
+        verbose_name='기간 단위'
+    )
+    start = models.DateField(
+        verbose_name='기간 시작일'
+    )
+    views = models.PositiveIntegerField(
+        default=0,
+        verbose_name='조회수'
+    )
+    completions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='완강 수'
+    )
+    ratings = models.PositiveIntegerField(
+        default=0,
+        verbose_name='평가 수'
+    )
+    rating_sum = models.PositiveIntegerField(
+        default=0,
+        verbose_name='평점 합계'
+    )
+    comments = models.PositiveIntegerField(
+        default=0,
+        verbose_name='댓글 수'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '영상 기간 집계'
+        verbose_name_plural = '영상 기간 집계 목록'
+        unique_together = [['video', 'period', 'start']]
+        ordering = ['period', '-start']
+
+    def __str__(self):
+        return f"{self.video_id} {self.period} {self.start}"
+
+
+class RetentionCurve(models.Model):
+    """영상 시청 유지 곡선 (구간별 시청 세션 수, uint32 배열)"""
+
+    video = models.OneToOneField(
+        'videos.Video',
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='retention_curve',
+        verbose_name='영상'
+    )
+    bucket_seconds = models.PositiveSmallIntegerField(
+        verbose_name='구간 길이(초)'
+    )
+    sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='시청 세션 수'
+    )
+    counts = models.BinaryField(
+        default=bytes,
+        verbose_name='구간별 시청 세션 수'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '시청 유지 곡선'
+        verbose_name_plural = '시청 유지 곡선 목록'
+
+    def __str__(self):
+        return f"{self.video_id} (세션 {self.sessions})"
+
+
+class RetentionSession(models.Model):
+    """세션별로 이미 센 유지 곡선 버킷 (세그먼트 경계에서 같은 구간을 두 번 세지 않도록 보관)"""
+
+    video = models.ForeignKey(
+        'videos.Video',
+        on_delete=models.CASCADE,
+        related_name='retention_sessions',
+        verbose_name='영상'
+    )
+    session = models.CharField(
+        max_length=64,
+        verbose_name='재생 세션 ID'
+    )
+    buckets = models.BinaryField(
+        default=bytes,
+        verbose_name='센 버킷 비트맵'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_index=True
+    )
+
+    class Meta:
+        verbose_name = '유지 곡선 세션'
+        verbose_name_plural = '유지 곡선 세션 목록'
+        unique_together = [['video', 'session']]
+
+    def __str__(self):
+        return f"{self.video_id}:{self.session}"
@@ -0,0 +1,231 @@
+"""
+시청 유지 곡선
+
+재생 위치를 BUCKET_SECONDS 구간으로 나누고, 구간마다 그 구간을 본 세션 수를 셉니다.
+(곡선 = 구간별 세션 수 / 전체 세션 수)
+
+WAL 세그먼트를 압축할 때 세그먼트의 이벤트 전체를 NumPy 배열로 바꿔
+1. (세션, 영상)별로 정렬한 뒤 연속한 두 위치를 시청 구간으로 만들고
+   (압축 집계의 시청 시간과 같은 규칙: seek 이후나 MAX_PROGRESS_GAP 초과 구간 제외)
+2. 구간을 버킷 번호로 펼쳐 (세션, 영상, 버킷) 중복을 제거한 뒤
+3. 영상별 bincount 로 히스토그램을 만들어 저장된 배열에 더합니다.
+
+한 세션이 여러 세그먼트에 걸치면 같은 구간을 두 번 세지 않도록, 세션별로 이미 센
+버킷 비트맵을 압축과 같은 트랜잭션에서 RetentionSession 에 저장하고
+RETENTION_SESSION_SECONDS 동안 갱신이 없으면 삭제합니다.
+"""
+from datetime import timedelta
+
+import numpy as np
+from django.utils import timezone
+
+from videos.models import Video
+
+from .events import COMPLETE, MAX_PROGRESS_GAP, PAUSE, PLAY, PROGRESS
+from .models import RetentionCurve, RetentionSession
+
+BUCKET_SECONDS = 5
+COUNT_DTYPE = np.dtype('<u4')
+
+# 세션별 센 버킷 비트맵 보관 시간 (세션이 이보다 오래 멈췄다 이어지면 다시 셀 수 있음)
+RETENTION_SESSION_SECONDS = 6 * 60 * 60
+
+
+def bitmap_from_ids(ids):
+    """버킷 번호 목록 → 비트맵 (파이썬 int, 비트 i = 버킷 i)"""
+    ids = np.fromiter(ids, dtype=np.int64)
+    if not ids.size:
+        return 0
+    flags = np.zeros(int(ids.max()) + 1, dtype=bool)
+    flags[ids] = True
+    return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+
+def ids_from_bitmap(bitmap):
+    """비트맵 → 버킷 번호 배열 (오름차순)"""
+    if not bitmap:
+        return np.empty(0, dtype=np.int64)
+    raw = np.frombuffer(bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(raw, bitorder='little'))
+
+
+def watched_buckets(records):
+    """
+    레코드 → (세션 번호 배열, 영상 ID 배열, 버킷 배열), 세션 번호 → 세션 ID 목록
+
+    같은 (세션, 영상, 버킷) 은 한 번만 포함합니다.
+    """
+    session_ids = {}
+    sessions, videos, codes, positions = [], [], [], []
+    for _received_at, _user_id, session, events in records:
+        number = session_ids.setdefault(session, len(session_ids))
+        for code, video_id, position in events:
+            sessions.append(number)
+            videos.append(video_id)
+            codes.append(code)
+            positions.append(position)
+
+    empty = np.empty(0, dtype=np.int64)
+    if not codes:
+        return (empty, empty, empty), []
+
+    sessions = np.asarray(sessions, dtype=np.int64)
+    videos = np.asarray(videos, dtype=np.int64)
+    codes = np.asarray(codes, dtype=np.int8)
+    positions = np.asarray(positions, dtype=np.float64)
+
+    # (세션, 영상)별로 묶되 기록 순서 유지
+    order = np.lexsort((np.arange(codes.size), videos, sessions))
+    sessions, videos, codes, positions = sessions[order], videos[order], codes[order], positions[order]
+
+    # 연속한 두 이벤트 사이의 시청 구간
+    delta = np.diff(positions)
+    watched = (
+        (sessions[1:] == sessions[:-1])
+        & (videos[1:] == videos[:-1])
+        & np.isin(codes[1:], (PROGRESS, PAUSE, COMPLETE))
+        & (codes[:-1] != PAUSE)
+        & (delta > 0)
+        & (delta <= MAX_PROGRESS_GAP)
+    )
+    # play/progress 위치 자체도 본 것으로 처리 (길이 0 구간)
+    points = np.isin(codes, (PLAY, PROGRESS))
+
+    starts = np.concatenate([positions[:-1][watched], positions[points]])
+    ends = np.concatenate([positions[1:][watched], positions[points]])
+    interval_sessions = np.concatenate([sessions[1:][watched], sessions[points]])
+    interval_videos = np.concatenate([videos[1:][watched], videos[points]])
+
+    # 구간 → 버킷 번호 펼치기
+    first = (starts // BUCKET_SECONDS).astype(np.int64)
+    lengths = (ends // BUCKET_SECONDS).astype(np.int64) - first + 1
+    owner = np.repeat(np.arange(first.size), lengths)
+    offsets = np.arange(owner.size) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    buckets = first[owner] + offsets
+
+    # (세션, 영상, 버킷) 중복 제거
+    triples = np.unique(
+        np.stack([interval_sessions[owner], interval_videos[owner], buckets], axis=1), axis=0
+    )
+    names = list(session_ids)
+    return (triples[:, 0], triples[:, 1], triples[:, 2]), names
+
+
+def session_bitmaps(records):
+    """레코드 → {(영상 ID, 세션 ID): 본 버킷 비트맵}"""
+    (sessions, videos, buckets), names = watched_buckets(records)
+    if not buckets.size:
+        return {}
+
+    # (세션, 영상) 경계로 나누기 (watched_buckets 결과는 세션, 영상, 버킷 순 정렬)
+    boundaries = np.flatnonzero((np.diff(sessions) != 0) | (np.diff(videos) != 0)) + 1
+    starts = np.concatenate([[0], boundaries])
+    return {
+        (int(videos[start]), names[int(sessions[start])]): bitmap_from_ids(group)
+        for start, group in zip(starts, np.split(buckets, boundaries))
+    }
+
+
+def histograms(bitmaps, seen):
+    """
+    (세션별 비트맵, 이미 센 비트맵) → ({영상 ID: 구간별 새 시청 세션 수 배열}, {영상 ID: 새 세션 수}, 합친 비트맵)
+
+    이전 세그먼트에서 이미 센 (세션, 영상, 버킷) 은 제외합니다.
+    """
+    new_buckets = {}
+    new_sessions = {}
+    updated = {}
+    for key, bitmap in bitmaps.items():
+        video_id = key[0]
+        previous = seen.get(key, 0)
+        updated[key] = previous | bitmap
+        fresh = bitmap & ~previous
+        if not fresh:
+            continue
+        new_buckets.setdefault(video_id, []).append(ids_from_bitmap(fresh))
+        if not previous:
+            new_sessions[video_id] = new_sessions.get(video_id, 0) + 1
+
+    counts = {
+        video_id: np.bincount(np.concatenate(groups)).astype(COUNT_DTYPE)
+        for video_id, groups in new_buckets.items()
+    }
+    return counts, new_sessions, updated
+
+
+def merge(stored, added):
+    """저장된 배열과 새 히스토그램 합치기 (길이가 다르면 긴 쪽에 맞춤)"""
+    stored = np.frombuffer(bytes(stored), dtype=COUNT_DTYPE)
+    size = max(stored.size, added.size)
+    merged = np.zeros(size, dtype=COUNT_DTYPE)
+    merged[:stored.size] += stored
+    merged[:added.size] += added
+    return merged
+
+
+def _lock_sessions(keys):
+    """(영상 ID, 세션 ID) 목록 → {키: 잠근 RetentionSession} (없는 행은 빈 비트맵으로 생성)"""
+    RetentionSession.objects.bulk_create(
+        [RetentionSession(video_id=video_id, session=session) for video_id, session in keys],
+        ignore_conflicts=True
+    )
+    rows = RetentionSession.objects.select_for_update().filter(
+        video_id__in={video_id for video_id, _ in keys},
+        session__in={session for _, session in keys}
+    ).order_by('pk')
+    return {(row.video_id, row.session): row for row in rows if (row.video_id, row.session) in keys}
+
+
+def apply_records(records):
+    """세그먼트 레코드를 유지 곡선에 반영 (압축 트랜잭션 안에서 호출)"""
+    bitmaps = session_bitmaps(records)
+    if not bitmaps:
+        return 0
+
+    video_ids = set(Video.objects.filter(id__in={video_id for video_id, _ in bitmaps}).values_list('id', flat=True))
+    bitmaps = {key: bitmap for key, bitmap in bitmaps.items() if key[0] in video_ids}
+    if not bitmaps:
+        return 0
+
+    # 센 버킷은 같은 트랜잭션에서 저장 (롤백되면 함께 되돌아가므로 재시도 시 빠지거나 겹치지 않음)
+    sessions = _lock_sessions(bitmaps.keys())
+    seen = {key: int.from_bytes(bytes(row.buckets), 'little') for key, row in sessions.items()}
+    counts, new_sessions, updated = histograms(bitmaps, seen)
+
+    now = timezone.now()
+    for key, row in sessions.items():
+        bitmap = updated[key]
+        row.buckets = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+        row.updated_at = now
+    RetentionSession.objects.bulk_update(list(sessions.values()), ['buckets', 'updated_at'], batch_size=500)
+
+    if not counts:
+        return 0
+
+    RetentionCurve.objects.bulk_create(
+        [RetentionCurve(video_id=video_id, bucket_seconds=BUCKET_SECONDS) for video_id in counts],
+        ignore_conflicts=True
+    )
+    rows = list(RetentionCurve.objects.select_for_update().filter(video_id__in=counts).order_by('pk'))
+    for row in rows:
+        row.counts = merge(row.counts, counts[row.video_id]).tobytes()
+        row.sessions += new_sessions.get(row.video_id, 0)
+        row.updated_at = now
+    RetentionCurve.objects.bulk_update(rows, ['counts', 'sessions', 'updated_at'], batch_size=200)
+    return len(rows)
+
+
+def purge_sessions():
+    """RETENTION_SESSION_SECONDS 동안 이어지지 않은 세션 상태 삭제"""
+    cutoff = timezone.now() - timedelta(seconds=RETENTION_SESSION_SECONDS)
+    deleted, _ = RetentionSession.objects.filter(updated_at__lt=cutoff).delete()
+    return deleted
+
+
+def curve(video_id):
+    """저장된 곡선 (없으면 None) → (구간 길이, 세션 수, 구간별 세션 수 배열)"""
+    row = RetentionCurve.objects.filter(video_id=video_id).values_list('bucket_seconds', 'sessions', 'counts').first()
+    if row is None:
+        return None
+    bucket_seconds, sessions, counts = row
+    return bucket_seconds, sessions, np.frombuffer(bytes(counts), dtype=COUNT_DTYPE)
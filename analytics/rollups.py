@@ -0,0 +1,247 @@
+"""
+영상별 일간/주간/월간 집계
+
+대시보드가 VideoCompletion/VideoRating/Comment 를 날짜별로 GROUP BY 하지 않도록
+(영상, 기간 단위, 기간 시작일) 행에 조회수/완강/평가/댓글 수를 미리 더해 둡니다.
+
+- 증분: 모델 시그널(커밋 후)과 영상 조회에서 record() 로 프로세스 메모리에 증분을
+  모으고, 백그라운드 스레드가 ANALYTICS_ROLLUP_FLUSH_SECONDS 마다 일간/주간/월간 행에
+  한 번에 더합니다. 저장에 실패하면 증분을 메모리에 되돌려 다음 주기에 다시 시도합니다.
+- 보정: 매일 rebuild_video_rollups 로 전날 일간 행의 완강/평가/댓글 수를 원본에서
+  다시 계산하고, 해당 주/월 행을 일간 행 합계로 다시 만듭니다.
+  (조회수는 원본 기록이 없으므로 증분 값을 그대로 유지합니다.)
+  다른 프로세스 메모리에 아직 남은 증분이 보정 뒤에 더해지면 두 번 집계되므로,
+  날짜가 끝나고 플러시 주기가 두 번 지난 날짜만 보정합니다.
+"""
+import atexit
+import logging
+import threading
+from collections import Counter, defaultdict
+from datetime import datetime, time as dt_time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from social.models import Comment, VideoRating
+from videos.models import Video, VideoCompletion
+
+from .background import PeriodicFlusher
+from .models import VideoStatsRollup
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ('day', 'week', 'month')
+FIELDS = ['views', 'completions', 'ratings', 'rating_sum', 'comments']
+# 원본 테이블에서 다시 계산할 수 있는 필드
+DERIVED_FIELDS = ['completions', 'ratings', 'rating_sum', 'comments']
+
+_lock = threading.Lock()
+_pending = defaultdict(Counter)
+
+
+class RollupNotSettled(ValueError):
+    """아직 다른 프로세스의 증분이 남아 있을 수 있는 날짜 (보정 불가)"""
+
+
+def get_flush_interval():
+    return settings.ANALYTICS_ROLLUP_FLUSH_SECONDS
+
+
+def period_start(date, period):
+    """날짜가 속한 기간의 시작일 (주는 월요일부터)"""
+    if period == 'week':
+        return date - timedelta(days=date.weekday())
+    if period == 'month':
+        return date.replace(day=1)
+    return date
+
+
+def next_period_start(start, period):
+    if period == 'week':
+        return start + timedelta(days=7)
+    if period == 'month':
+        return (start + timedelta(days=32)).replace(day=1)
+    return start + timedelta(days=1)
+
+
+def add_to_rows(model, totals, key_fields):
+    """
+    {키 튜플: {필드: 증분}} 을 집계 행에 더함 (트랜잭션 안에서 호출)
+
+    없는 행은 먼저 만들고(ignore_conflicts), 행을 잠근 뒤 bulk_update 로 저장합니다.
+    """
+    if not totals:
+        return 0
+
+    model.objects.bulk_create(
+        [model(**dict(zip(key_fields, key))) for key in totals],
+        ignore_conflicts=True
+    )
+    lookups = {
+        f'{field}__in': {key[index] for key in totals}
+        for index, field in enumerate(key_fields)
+    }
+    now = timezone.now()
+    changed = []
+    fields = set()
+    # 동시에 실행되는 플러시와 교착하지 않도록 항상 pk 순으로 잠금
+    for row in model.objects.select_for_update().filter(**lookups).order_by('pk'):
+        deltas = totals.get(tuple(getattr(row, field) for field in key_fields))
+        if deltas is None:
+            continue
+        for field, delta in deltas.items():
+            setattr(row, field, max(0, getattr(row, field) + delta))
+            fields.add(field)
+        row.updated_at = now
+        changed.append(row)
+    model.objects.bulk_update(changed, sorted(fields) + ['updated_at'], batch_size=500)
+    return len(changed)
+
+
+def record(video_id, date, **deltas):
+    """영상의 날짜별 증분 기록 (커밋 후에 호출, 저장은 백그라운드 스레드)"""
+    with _lock:
+        _pending[(video_id, date)].update(deltas)
+    flusher.ensure_started()
+
+
+def record_view(video_id):
+    record(video_id, timezone.localdate(), views=1)
+
+
+def _requeue(pending):
+    """저장하지 못한 증분을 메모리에 되돌림 (그 사이 새로 모인 증분에 더함)"""
+    with _lock:
+        for key, deltas in pending.items():
+            _pending[key].update(deltas)
+
+
+def flush():
+    """모인 증분을 일간/주간/월간 행에 더함"""
+    global _pending
+
+    with _lock:
+        pending, _pending = _pending, defaultdict(Counter)
+
+    if not pending:
+        return 0
+
+    try:
+        existing = set(
+            Video.objects.filter(id__in={video_id for video_id, _ in pending}).values_list('id', flat=True)
+        )
+        totals = defaultdict(Counter)
+        for (video_id, date), deltas in pending.items():
+            if video_id not in existing:
+                continue
+            for period in PERIODS:
+                totals[(video_id, period, period_start(date, period))].update(deltas)
+
+        with transaction.atomic():
+            return add_to_rows(VideoStatsRollup, totals, ('video_id', 'period', 'start'))
+    except Exception:
+        _requeue(pending)
+        raise
+
+
+flusher = PeriodicFlusher('video-rollups', flush, get_flush_interval)
+
+
+@atexit.register
+def _flush_on_exit():
+    if not _pending:
+        return
+    try:
+        flush()
+    except Exception:
+        logger.exception('영상 기간 집계 저장 실패')
+
+
+def _day_bounds(date):
+    tz = timezone.get_current_timezone()
+    start = timezone.make_aware(datetime.combine(date, dt_time.min), tz)
+    return start, timezone.make_aware(datetime.combine(date + timedelta(days=1), dt_time.min), tz)
+
+
+def _source_counts(date):
+    """원본 테이블에서 날짜의 영상별 완강/평가/댓글 수 (GROUP BY 3회)"""
+    start, end = _day_bounds(date)
+    counts = defaultdict(lambda: dict.fromkeys(DERIVED_FIELDS, 0))
+
+    completions = VideoCompletion.objects.filter(
+        is_completed=True, completed_at__gte=start, completed_at__lt=end
+    ).values('video_id').annotate(n=Count('id'))
+    for row in completions:
+        counts[row['video_id']]['completions'] = row['n']
+
+    ratings = VideoRating.objects.filter(
+        created_at__gte=start, created_at__lt=end
+    ).values('video_id').annotate(n=Count('id'), total=Sum('rating'))
+    for row in ratings:
+        counts[row['video_id']].update(ratings=row['n'], rating_sum=row['total'])
+
+    comments = Comment.objects.filter(
+        created_at__gte=start, created_at__lt=end
+    ).values('video_id').annotate(n=Count('id'))
+    for row in comments:
+        counts[row['video_id']]['comments'] = row['n']
+    return counts
+
+
+def _set_rows(period, start, values, fields):
+    """(period, start) 행들의 fields 를 values({영상 ID: {필드: 값}}) 로 덮어씀 (없는 영상은 0)"""
+    VideoStatsRollup.objects.bulk_create(
+        [VideoStatsRollup(video_id=video_id, period=period, start=start) for video_id in values],
+        ignore_conflicts=True
+    )
+    now = timezone.now()
+    rows = list(VideoStatsRollup.objects.select_for_update().filter(period=period, start=start).order_by('pk'))
+    for row in rows:
+        row_values = values.get(row.video_id, {})
+        for field in fields:
+            setattr(row, field, row_values.get(field) or 0)
+        row.updated_at = now
+    VideoStatsRollup.objects.bulk_update(rows, fields + ['updated_at'], batch_size=500)
+
+    # 모든 값이 0 이 된 행 정리
+    VideoStatsRollup.objects.filter(
+        period=period, start=start, **{field: 0 for field in FIELDS}
+    ).delete()
+
+
+def _rebuild_period(period, start):
+    """주간/월간 행을 일간 행 합계로 다시 만듦"""
+    days = VideoStatsRollup.objects.filter(
+        period='day', start__gte=start, start__lt=next_period_start(start, period)
+    ).values('video_id').annotate(**{f'total_{field}': Sum(field) for field in FIELDS})
+    _set_rows(period, start, {
+        row['video_id']: {field: row[f'total_{field}'] for field in FIELDS} for row in days
+    }, FIELDS)
+
+
+def settled_at(date):
+    """날짜의 증분이 모든 프로세스에서 저장되었다고 볼 수 있는 시각 (날짜 끝 + 플러시 주기 2회)"""
+    _, end = _day_bounds(date)
+    return end + timedelta(seconds=2 * get_flush_interval())
+
+
+def rebuild_day(date):
+    """
+    날짜의 일간 행을 원본으로 보정하고 해당 주간/월간 행 재계산
+
+    flush() 는 이 프로세스의 증분만 저장하므로, 다른 프로세스의 증분이 남아 있을 수
+    있는 날짜(settled_at 이전)는 RollupNotSettled 로 거절합니다.
+    """
+    if timezone.now() < settled_at(date):
+        raise RollupNotSettled(f'{date} 의 증분이 아직 저장 중일 수 있습니다. ({settled_at(date)} 이후 보정 가능)')
+
+    flush()
+    counts = _source_counts(date)
+
+    with transaction.atomic():
+        _set_rows('day', date, counts, DERIVED_FIELDS)
+        for period in ('week', 'month'):
+            _rebuild_period(period, period_start(date, period))
+    return len(counts)
@@ -0,0 +1,81 @@
+"""
+영상 기간 집계 증분
+
+완강/평가/댓글 변경을 커밋 후 rollups.record() 로 넘깁니다.
+증분은 이벤트가 생긴 날짜(completed_at/created_at)의 행에 반영합니다.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from social.models import Comment, VideoRating
+from videos.models import VideoCompletion
+from . import rollups
+
+
+def _record(video_id, when, **deltas):
+    transaction.on_commit(partial(rollups.record, video_id, timezone.localdate(when), **deltas))
+
+
+@receiver(pre_save, sender=VideoCompletion)
+def remember_previous_completion(sender, instance, **kwargs):
+    """수정 전 완강 여부/완강일 기억"""
+    instance._previous_completion = None
+    if instance.pk and not instance._state.adding:
+        instance._previous_completion = VideoCompletion.objects.filter(
+            pk=instance.pk
+        ).values_list('is_completed', 'completed_at').first()
+
+
+def _completion_state(is_completed, completed_at):
+    return completed_at if is_completed and completed_at else None
+
+
+@receiver(post_save, sender=VideoCompletion)
+def count_completion(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_completion', None)
+    before = _completion_state(*previous) if previous else None
+    after = _completion_state(instance.is_completed, instance.completed_at)
+    if before == after:
+        return
+    if before is not None:
+        _record(instance.video_id, before, completions=-1)
+    if after is not None:
+        _record(instance.video_id, after, completions=1)
+
+
+@receiver(post_delete, sender=VideoCompletion)
+def uncount_completion(sender, instance, **kwargs):
+    completed_at = _completion_state(instance.is_completed, instance.completed_at)
+    if completed_at is not None:
+        _record(instance.video_id, completed_at, completions=-1)
+
+
+@receiver(post_save, sender=VideoRating)
+def count_rating(sender, instance, created, **kwargs):
+    """평가 추가/수정 (수정 전 평점은 videos.signals 의 pre_save 가 기억)"""
+    if created:
+        _record(instance.video_id, instance.created_at, ratings=1, rating_sum=int(instance.rating))
+        return
+    previous = getattr(instance, '_previous_rating', None)
+    if previous is not None and previous != int(instance.rating):
+        _record(instance.video_id, instance.created_at, rating_sum=int(instance.rating) - previous)
+
+
+@receiver(post_delete, sender=VideoRating)
+def uncount_rating(sender, instance, **kwargs):
+    _record(instance.video_id, instance.created_at, ratings=-1, rating_sum=-int(instance.rating))
+
+
+@receiver(post_save, sender=Comment)
+def count_comment(sender, instance, created, **kwargs):
+    if created:
+        _record(instance.video_id, instance.created_at, comments=1)
+
+
+@receiver(post_delete, sender=Comment)
+def uncount_comment(sender, instance, **kwargs):
+    _record(instance.video_id, instance.created_at, comments=-1)
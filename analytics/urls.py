@@ -0,0 +1,12 @@
+from django.urls import path
+
+from .views import InstructorDashboardView, PlaybackEventView, VideoRetentionView, VideoStatsView
+
+app_name = 'analytics'
+
+urlpatterns = [
+    path('events/', PlaybackEventView.as_view(), name='playback-events'),
+    path('dashboard/', InstructorDashboardView.as_view(), name='instructor-dashboard'),
+    path('videos/<int:video_id>/stats/', VideoStatsView.as_view(), name='video-stats'),
+    path('videos/<int:video_id>/retention/', VideoRetentionView.as_view(), name='video-retention'),
+]
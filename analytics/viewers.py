@@ -0,0 +1,147 @@
+"""
+고유 방문자 집계
+
+조회 시에는 프로세스 메모리의 HyperLogLog 스케치에만 기록하고,
+백그라운드 스레드가 VIEW_SKETCH_FLUSH_SECONDS 마다 DB 스케치(ViewerSketch)와
+트랜잭션 하나로 병합해 저장한 뒤 대상 모델의 unique_viewers 컬럼을 갱신합니다.
+저장에 실패하면 스케치를 메모리에 되돌려 다음 주기에 다시 시도합니다.
+
+비로그인 방문자는 IP + User-Agent 로 식별합니다. X-Forwarded-For 는 클라이언트가
+임의로 넣을 수 있으므로 VIEW_TRUSTED_PROXY_COUNT(앞단 프록시 수)가 설정된 경우에만
+프록시가 덧붙인 항목을 사용합니다.
+"""
+import atexit
+import hashlib
+import logging
+import threading
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .background import PeriodicFlusher
+from .hyperloglog import HyperLogLog
+from .models import ViewerSketch
+
+logger = logging.getLogger(__name__)
+
+# 대상 종류 → unique_viewers 컬럼을 가진 모델
+TARGET_MODELS = {
+    'question': 'community.Question',
+    'video': 'videos.Video',
+}
+
+_lock = threading.Lock()
+_pending = {}
+
+
+def get_flush_interval():
+    return getattr(settings, 'VIEW_SKETCH_FLUSH_SECONDS', 30)
+
+
+def client_ip(request):
+    """클라이언트 IP (신뢰하는 프록시 수만큼 X-Forwarded-For 뒤에서부터 건너뜀)"""
+    proxies = getattr(settings, 'VIEW_TRUSTED_PROXY_COUNT', 0)
+    if proxies > 0:
+        forwarded = [part.strip() for part in request.META.get('HTTP_X_FORWARDED_FOR', '').split(',') if part.strip()]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get('REMOTE_ADDR', '')
+
+
+def viewer_key(request):
+    """방문자 식별 키 (로그인 사용자 ID, 아니면 IP + User-Agent 해시)"""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated:
+        return f'u:{user.pk}'
+
+    raw = '|'.join([
+        client_ip(request),
+        request.META.get('HTTP_USER_AGENT', ''),
+    ])
+    return 'a:' + hashlib.sha1(raw.encode()).hexdigest()
+
+
+def record_view(target_type, target_id, request):
+    """조회 기록 (메모리 스케치에 추가, 저장은 백그라운드 스레드에서)"""
+    key = (target_type, target_id)
+    with _lock:
+        sketch = _pending.get(key)
+        if sketch is None:
+            sketch = _pending[key] = HyperLogLog()
+        sketch.add(viewer_key(request))
+    flusher.ensure_started()
+
+
+def _requeue(pending):
+    """저장하지 못한 스케치를 메모리에 되돌림 (그 사이 새로 모인 스케치와 병합)"""
+    with _lock:
+        for key, sketch in pending.items():
+            current = _pending.get(key)
+            _pending[key] = sketch if current is None else current.merge(sketch)
+
+
+def flush():
+    """메모리 스케치를 DB 스케치에 병합하고 unique_viewers 갱신 (트랜잭션 1회)"""
+    global _pending
+
+    with _lock:
+        pending, _pending = _pending, {}
+
+    if not pending:
+        return 0
+
+    try:
+        with transaction.atomic():
+            ViewerSketch.objects.bulk_create(
+                [
+                    ViewerSketch(target_type=target_type, target_id=target_id, registers=HyperLogLog().to_bytes())
+                    for target_type, target_id in pending
+                ],
+                ignore_conflicts=True
+            )
+            rows = ViewerSketch.objects.select_for_update().filter(
+                target_type__in={target_type for target_type, _ in pending},
+                target_id__in={target_id for _, target_id in pending}
+            ).order_by('pk')
+
+            now = timezone.now()
+            changed = []
+            estimates = {}
+            for stored in rows:
+                sketch = pending.get((stored.target_type, stored.target_id))
+                if sketch is None:
+                    continue
+                merged = HyperLogLog(stored.registers).merge(sketch)
+                stored.registers = merged.to_bytes()
+                stored.estimate = merged.count()
+                stored.updated_at = now
+                changed.append(stored)
+                estimates.setdefault(stored.target_type, {})[stored.target_id] = stored.estimate
+            ViewerSketch.objects.bulk_update(changed, ['registers', 'estimate', 'updated_at'], batch_size=200)
+
+            for target_type, values in estimates.items():
+                model = apps.get_model(TARGET_MODELS[target_type])
+                model.objects.bulk_update(
+                    [model(pk=pk, unique_viewers=estimate) for pk, estimate in sorted(values.items())],
+                    ['unique_viewers'],
+                    batch_size=500
+                )
+    except Exception:
+        _requeue(pending)
+        raise
+    return len(pending)
+
+
+flusher = PeriodicFlusher('unique-viewers', flush, get_flush_interval)
+
+
+@atexit.register
+def _flush_on_exit():
+    if not _pending:
+        return
+    try:
+        flush()
+    except Exception:
+        logger.exception('고유 방문자 스케치 저장 실패')
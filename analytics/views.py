@@ -1,3 +1,262 @@
-from django.shortcuts import render
+import time
+from datetime import date, timedelta
 
-# Create your views here.
+import numpy as np
+from django.conf import settings
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiResponse
+from rest_framework import permissions, status
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from videos.models import Video
+
+from . import dashboard, retention, rollups, wal
+from .events import InvalidBatch, encode_record, parse_batch
+from .models import VideoStatsRollup
+
+
+class PlaybackEventView(APIView):
+    """재생 이벤트 수집 (WAL 에 기록 후 백그라운드에서 집계)"""
+
+    permission_classes = [permissions.AllowAny]
+    parser_classes = [JSONParser]
+
+    @extend_schema(
+        tags=['분석'],
+        summary='재생 이벤트 일괄 전송',
+        description=(
+            '한 재생 세션의 이벤트(play, pause, seek, progress, complete)를 모아 보냅니다. '
+            '형식이 잘못된 이벤트는 버리고 나머지만 기록합니다. '
+            '집계에는 백그라운드 압축 주기만큼 지연이 있습니다.'
+        ),
+        request={
+            'application/json': {
+                'type': 'object',
+                'properties': {
+                    'session': {'type': 'string', 'maxLength': 64},
+                    'events': {
+                        'type': 'array',
+                        'items': {
+                            'type': 'object',
+                            'properties': {
+                                'type': {'type': 'string', 'enum': ['play', 'pause', 'seek', 'progress', 'complete']},
+                                'video': {'type': 'integer'},
+                                'position': {'type': 'number', 'description': '재생 위치 (초)'},
+                            },
+                            'required': ['type', 'video'],
+                        },
+                    },
+                },
+                'required': ['session', 'events'],
+            }
+        },
+        responses={
+            202: OpenApiResponse(description='기록한 이벤트 수와 버린 이벤트 수'),
+            400: OpenApiResponse(description='배치 형식 오류')
+        }
+    )
+    def post(self, request):
+        try:
+            session, events, rejected = parse_batch(request.data, settings.ANALYTICS_MAX_BATCH_EVENTS)
+        except InvalidBatch as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if events:
+            user_id = request.user.pk if request.user.is_authenticated else None
+            wal.append(encode_record(time.time(), user_id, session, events))
+
+        return Response(
+            {'accepted': len(events), 'rejected': rejected},
+            status=status.HTTP_202_ACCEPTED
+        )
+
+
+def _check_video_owner(request, video_id):
+    """영상 강사 본인 또는 관리자가 아니면 오류 응답 (claims_user_on_read 뷰에서 사용)"""
+    instructor_id = Video.objects.filter(pk=video_id).values_list('instructor_id', flat=True).first()
+    if instructor_id is None:
+        return Response({'error': '영상을 찾을 수 없습니다.'}, status=status.HTTP_404_NOT_FOUND)
+
+    user = request.user
+    if instructor_id != user.pk and not (user.is_staff or getattr(user, 'role', None) == 'admin'):
+        return Response({'error': '영상 통계는 강사 본인만 볼 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+class VideoStatsView(APIView):
+    """영상 기간별 통계 (집계 행만 조회)"""
+
+    permission_classes = [permissions.IsAuthenticated]
+    claims_user_on_read = True
+
+    # 기간 단위별 기본 조회 구간과 최대 포인트 수
+    DEFAULT_POINTS = {'day': 30, 'week': 12, 'month': 12}
+    MAX_POINTS = 366
+
+    @extend_schema(
+        tags=['분석'],
+        summary='영상 기간별 통계',
+        description=(
+            '영상의 조회수/완강/평가/댓글 수를 일간·주간·월간 단위로 조회합니다. '
+            '강사 본인과 관리자만 볼 수 있으며, 미리 집계된 행만 읽으므로 '
+            '비용은 이벤트 수가 아니라 조회 구간 길이에 비례합니다.'
+        ),
+        parameters=[
+            OpenApiParameter('period', str, enum=['day', 'week', 'month'], description='기간 단위 (기본값: day)'),
+            OpenApiParameter('start', str, description='시작일 (YYYY-MM-DD)'),
+            OpenApiParameter('end', str, description='종료일 (YYYY-MM-DD, 기본값: 오늘)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='기간별 통계와 합계'),
+            400: OpenApiResponse(description='잘못된 기간'),
+            403: OpenApiResponse(description='권한 없음'),
+            404: OpenApiResponse(description='영상을 찾을 수 없음')
+        }
+    )
+    def get(self, request, video_id):
+        denied = _check_video_owner(request, video_id)
+        if denied:
+            return denied
+
+        period = request.query_params.get('period', 'day')
+        if period not in rollups.PERIODS:
+            return Response({'error': 'period 는 day, week, month 중 하나여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            end = date.fromisoformat(request.query_params['end']) if 'end' in request.query_params else timezone.localdate()
+            start = date.fromisoformat(request.query_params['start']) if 'start' in request.query_params else None
+        except ValueError:
+            return Response({'error': '날짜는 YYYY-MM-DD 형식이어야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 기간 시작일 목록 (빈 기간은 0 으로 채움)
+        end = rollups.period_start(end, period)
+        if start is None:
+            starts = [end]
+            for _ in range(self.DEFAULT_POINTS[period] - 1):
+                starts.insert(0, rollups.period_start(starts[0] - timedelta(days=1), period))
+        else:
+            starts = []
+            current = rollups.period_start(start, period)
+            while current <= end and len(starts) <= self.MAX_POINTS:
+                starts.append(current)
+                current = rollups.next_period_start(current, period)
+            if not starts:
+                return Response({'error': 'start 는 end 보다 늦을 수 없습니다.'}, status=status.HTTP_400_BAD_REQUEST)
+            if len(starts) > self.MAX_POINTS:
+                return Response(
+                    {'error': f'한 번에 최대 {self.MAX_POINTS}개 기간까지 조회할 수 있습니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        rows = {
+            row['start']: row
+            for row in VideoStatsRollup.objects.filter(
+                video_id=video_id, period=period, start__gte=starts[0], start__lte=starts[-1]
+            ).values('start', *rollups.FIELDS)
+        }
+        empty = dict.fromkeys(rollups.FIELDS, 0)
+        series = []
+        totals = dict(empty)
+        for period_start in starts:
+            row = rows.get(period_start, empty)
+            point = {'start': period_start, **{field: row[field] for field in rollups.FIELDS}}
+            point['rating_avg'] = round(row['rating_sum'] / row['ratings'], 2) if row['ratings'] > 0 else None
+            series.append(point)
+            for field in rollups.FIELDS:
+                totals[field] += row[field]
+        totals['rating_avg'] = round(totals['rating_sum'] / totals['ratings'], 2) if totals['ratings'] > 0 else None
+
+        return Response({
+            'video': video_id,
+            'period': period,
+            'start': starts[0],
+            'end': starts[-1],
+            'series': series,
+            'totals': totals,
+        })
+
+
+class VideoRetentionView(APIView):
+    """영상 시청 유지 곡선 (저장된 배열만 조회)"""
+
+    permission_classes = [permissions.IsAuthenticated]
+    claims_user_on_read = True
+
+    @extend_schema(
+        tags=['분석'],
+        summary='영상 시청 유지 곡선',
+        description=(
+            '재생 구간별로 그 구간을 본 세션 수와 비율을 반환합니다. '
+            '재생 이벤트를 압축할 때 갱신된 곡선만 읽으며, 강사 본인과 관리자만 볼 수 있습니다.'
+        ),
+        responses={
+            200: OpenApiResponse(description='구간 길이, 세션 수, 구간별 시청 세션 수와 비율'),
+            403: OpenApiResponse(description='권한 없음'),
+            404: OpenApiResponse(description='영상을 찾을 수 없음')
+        }
+    )
+    def get(self, request, video_id):
+        denied = _check_video_owner(request, video_id)
+        if denied:
+            return denied
+
+        stored = retention.curve(video_id)
+        if stored is None:
+            return Response({
+                'video': video_id,
+                'bucket_seconds': retention.BUCKET_SECONDS,
+                'sessions': 0,
+                'viewers': [],
+                'retention': [],
+            })
+
+        bucket_seconds, sessions, counts = stored
+        ratios = np.round(counts / sessions, 4) if sessions else np.zeros(counts.size)
+        return Response({
+            'video': video_id,
+            'bucket_seconds': bucket_seconds,
+            'sessions': sessions,
+            'viewers': counts.tolist(),
+            'retention': ratios.tolist(),
+        })
+
+
+class InstructorDashboardView(APIView):
+    """강사 대시보드 (영상별/전체 지표, 캐시)"""
+
+    permission_classes = [permissions.IsAuthenticated]
+    claims_user_on_read = True
+
+    @extend_schema(
+        tags=['분석'],
+        summary='강사 대시보드',
+        description=(
+            '강사의 모든 영상에 대한 조회수, 평가, 완강률, 미답변 질문 수와 전체 합계, '
+            '지표별 상위 영상을 반환합니다. 결과는 짧게 캐시되며, 동시에 여러 명이 열어도 '
+            '계산은 한 번만 합니다. 관리자는 instructor 파라미터로 다른 강사를 조회할 수 있습니다.'
+        ),
+        parameters=[
+            OpenApiParameter('instructor', int, description='강사 ID (관리자 전용, 기본값: 본인)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='대시보드 지표'),
+            400: OpenApiResponse(description='잘못된 강사 ID'),
+            403: OpenApiResponse(description='강사/관리자가 아님')
+        }
+    )
+    def get(self, request):
+        user = request.user
+        is_admin = user.is_staff or getattr(user, 'role', None) == 'admin'
+        if 'instructor' in request.query_params and is_admin:
+            try:
+                instructor_id = int(request.query_params['instructor'])
+            except ValueError:
+                return Response({'error': 'instructor 는 정수여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        elif getattr(user, 'role', None) == 'instructor' or is_admin:
+            instructor_id = user.pk
+        else:
+            return Response({'error': '강사만 대시보드를 볼 수 있습니다.'}, status=status.HTTP_403_FORBIDDEN)
+
+        return Response(dashboard.get_dashboard(instructor_id))
@@ -0,0 +1,160 @@
+"""
+재생 이벤트 WAL (세그먼트 파일)
+
+이벤트마다 행을 INSERT 하는 대신 수신한 배치를 로컬 디스크의 세그먼트 파일에
+한 줄씩 덧붙이고(append 한 번 = write 시스템 콜 한 번), 백그라운드
+consumer(compact_analytics_events)가 봉인된 세그먼트를 DB 집계로 압축합니다.
+
+- 프로세스마다 자기 세그먼트(<생성 시각 ns>-<pid>.open)에만 씁니다.
+- ANALYTICS_WAL_SEGMENT_BYTES 를 넘으면 다음 기록 때, ANALYTICS_WAL_SEGMENT_SECONDS 가
+  지나면 백그라운드 스레드가 .log 로 이름을 바꿔 봉인합니다. (기록이 끊긴 프로세스의
+  세그먼트도 제때 압축되도록) 새 세그먼트는 다음 기록 때 엽니다.
+- 프로세스 종료 시 열린 세그먼트를 봉인하고, 비정상 종료한 프로세스의
+  세그먼트는 consumer 가 pid 생존 여부를 확인해 봉인합니다.
+  (따라서 WAL 디렉터리는 호스트마다 따로 두고 consumer 도 호스트마다 실행합니다.)
+"""
+import atexit
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+
+from django.conf import settings
+
+from .background import PeriodicFlusher
+
+logger = logging.getLogger(__name__)
+
+OPEN_SUFFIX = '.open'
+SEALED_SUFFIX = '.log'
+# 반영할 수 없는 세그먼트를 옮겨 두는 하위 디렉터리 (수동 확인용)
+QUARANTINE_DIR = 'quarantine'
+
+
+def get_directory():
+    return Path(settings.ANALYTICS_WAL_DIR)
+
+
+def get_seal_interval():
+    # 세그먼트가 ANALYTICS_WAL_SEGMENT_SECONDS 의 1.5배 안에 봉인되도록 절반 주기로 확인
+    return max(1, settings.ANALYTICS_WAL_SEGMENT_SECONDS // 2)
+
+
+class SegmentWriter:
+    """프로세스별 활성 세그먼트에 레코드 덧붙이기"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.fd = None
+        self.path = None
+        self.pid = None
+        self.size = 0
+        self.opened_at = 0.0
+
+    def _open(self):
+        directory = get_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.pid = os.getpid()
+        self.path = directory / f'{time.time_ns()}-{self.pid}{OPEN_SUFFIX}'
+        self.fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self.size = 0
+        self.opened_at = time.monotonic()
+
+    def _seal(self):
+        os.close(self.fd)
+        if self.size:
+            os.rename(self.path, self.path.with_suffix(SEALED_SUFFIX))
+        else:
+            self.path.unlink(missing_ok=True)
+        self.fd = None
+
+    def _expired(self):
+        return time.monotonic() - self.opened_at >= settings.ANALYTICS_WAL_SEGMENT_SECONDS
+
+    def append(self, record):
+        with self.lock:
+            if self.fd is not None and self.pid != os.getpid():
+                # fork 된 자식 프로세스: 상속된 fd 만 닫고 부모의 세그먼트는 그대로 둠
+                os.close(self.fd)
+                self.fd = None
+            if self.fd is not None and (self.size >= settings.ANALYTICS_WAL_SEGMENT_BYTES or self._expired()):
+                self._seal()
+            if self.fd is None:
+                self._open()
+            os.write(self.fd, record)
+            self.size += len(record)
+        sealer.ensure_started()
+
+    def seal_if_expired(self):
+        """ANALYTICS_WAL_SEGMENT_SECONDS 가 지난 활성 세그먼트 봉인 (백그라운드 스레드에서 호출)"""
+        with self.lock:
+            if self.fd is not None and self.pid == os.getpid() and self._expired():
+                self._seal()
+                return True
+        return False
+
+    def close(self):
+        with self.lock:
+            if self.fd is not None and self.pid == os.getpid():
+                self._seal()
+
+
+writer = SegmentWriter()
+sealer = PeriodicFlusher('wal-sealer', writer.seal_if_expired, get_seal_interval)
+
+
+def append(record):
+    writer.append(record)
+
+
+@atexit.register
+def _seal_on_exit():
+    try:
+        writer.close()
+    except OSError:
+        logger.exception('재생 이벤트 세그먼트 봉인 실패')
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def seal_abandoned():
+    """종료된 프로세스가 남긴 열린 세그먼트 봉인"""
+    sealed = 0
+    for path in get_directory().glob(f'*{OPEN_SUFFIX}'):
+        try:
+            pid = int(path.stem.rsplit('-', 1)[1])
+        except (IndexError, ValueError):
+            continue
+        if _pid_alive(pid):
+            continue
+        try:
+            os.rename(path, path.with_suffix(SEALED_SUFFIX))
+            sealed += 1
+        except FileNotFoundError:
+            pass
+    return sealed
+
+
+def sealed_segments():
+    """봉인된 세그먼트 (생성 순)"""
+    directory = get_directory()
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f'*{SEALED_SUFFIX}'), key=lambda path: int(path.stem.split('-', 1)[0]))
+
+
+def quarantine(path):
+    """반영할 수 없는 세그먼트를 격리 디렉터리로 옮김 (뒤 세그먼트 압축이 막히지 않도록)"""
+    target = path.parent / QUARANTINE_DIR
+    target.mkdir(exist_ok=True)
+    os.rename(path, target / path.name)
+    return target / path.name
@@ -1,15 +1,15 @@
 from django.contrib import admin
-from .models import Category, Tag
+from .models import Category, Tag, TagLeaderboard
 
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
     """카테고리 Admin"""
 
-    list_display = ['name', 'slug', 'icon', 'created_at']
+    list_display = ['name', 'slug', 'parent', 'depth', 'videos_count', 'subtree_videos_count', 'created_at']
     search_fields = ['name', 'description']
     prepopulated_fields = {'slug': ('name',)}
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['path', 'depth', 'videos_count', 'subtree_videos_count', 'created_at', 'updated_at']
 
 
 @admin.register(Tag)
@@ -20,3 +20,11 @@ class TagAdmin(admin.ModelAdmin):
     search_fields = ['name']
     prepopulated_fields = {'slug': ('name',)}
     readonly_fields = ['created_at']
+
+
+@admin.register(TagLeaderboard)
+class TagLeaderboardAdmin(admin.ModelAdmin):
+    """인기 태그 순위 Admin"""
+
+    list_display = ['window', 'computed_at']
+    readonly_fields = ['entries', 'computed_at']
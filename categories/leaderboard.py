@@ -0,0 +1,85 @@
+"""
+인기 태그 순위
+
+- 전체 기간: Tag.videos_count (시그널로 증분 유지) 를 taxonomy 스냅샷에서
+  미리 정렬해 두고 상위 K개를 잘라 반환합니다.
+- 최근 7일/30일: 태그 연결/해제 시 TagDailyCount 를 증분 갱신하고,
+  refresh_tag_leaderboards 커맨드가 주기적으로 기간 합계 상위 LEADERBOARD_SIZE 개를
+  TagLeaderboard 에 정렬된 스냅샷으로 저장합니다.
+"""
+from datetime import timedelta
+
+from django.db.models import F, Sum
+from django.utils import timezone
+
+from .models import TagDailyCount, TagLeaderboard
+from . import taxonomy
+
+WINDOW_DAYS = {
+    '7d': 7,
+    '30d': 30,
+}
+LEADERBOARD_SIZE = 100
+MAX_LIMIT = 50
+RETENTION_DAYS = max(WINDOW_DAYS.values())
+
+
+def record_tag_changes(tag_ids, delta):
+    """오늘자 태그 일별 증감 기록 (쿼리 2회)"""
+    tag_ids = list(tag_ids)
+    if not tag_ids:
+        return
+
+    today = timezone.localdate()
+    TagDailyCount.objects.bulk_create(
+        [TagDailyCount(tag_id=tag_id, date=today) for tag_id in tag_ids],
+        ignore_conflicts=True
+    )
+    TagDailyCount.objects.filter(tag_id__in=tag_ids, date=today).update(
+        count=F('count') + delta
+    )
+
+
+def refresh(window):
+    """기간별 순위 스냅샷 재계산"""
+    since = timezone.localdate() - timedelta(days=WINDOW_DAYS[window] - 1)
+    rows = TagDailyCount.objects.filter(date__gte=since).values('tag_id').annotate(
+        score=Sum('count')
+    ).filter(score__gt=0).order_by('-score', 'tag_id')[:LEADERBOARD_SIZE]
+
+    entries = [[row['tag_id'], row['score']] for row in rows]
+    TagLeaderboard.objects.update_or_create(window=window, defaults={'entries': entries})
+    return entries
+
+
+def refresh_all():
+    """모든 기간 순위 갱신 및 보관 기간이 지난 일별 집계 삭제"""
+    for window in WINDOW_DAYS:
+        refresh(window)
+    TagDailyCount.objects.filter(
+        date__lt=timezone.localdate() - timedelta(days=RETENTION_DAYS)
+    ).delete()
+
+
+def top_tags(window='all', limit=10):
+    """상위 태그 목록 (태그 데이터에 score 포함)"""
+    limit = max(1, min(limit, MAX_LIMIT))
+    snapshot = taxonomy.get_snapshot()
+
+    if window == 'all':
+        return [
+            dict(tag, score=tag['videos_count'])
+            for tag in snapshot['popular_tags'][:limit]
+        ]
+
+    leaderboard = TagLeaderboard.objects.filter(window=window).values_list('entries', flat=True).first() or []
+    tags_by_id = snapshot['tags_by_id']
+    results = []
+    for tag_id, score in leaderboard:
+        tag = tags_by_id.get(tag_id)
+        if tag is None:
+            continue
+        results.append(dict(tag, score=score))
+        if len(results) == limit:
+            break
+    return results
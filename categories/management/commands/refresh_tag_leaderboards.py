@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from categories.leaderboard import refresh_all
+
+
+class Command(BaseCommand):
+    help = '최근 7일/30일 인기 태그 순위 스냅샷을 갱신합니다. (cron 등으로 주기 실행)'
+
+    def handle(self, *args, **options):
+        refresh_all()
+        self.stdout.write(self.style.SUCCESS('인기 태그 순위를 갱신했습니다.'))
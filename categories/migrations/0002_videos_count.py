@@ -0,0 +1,45 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:38
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_videos_count(apps, schema_editor):
+    """기존 카테고리/태그의 영상 수 채우기"""
+    Category = apps.get_model('categories', 'Category')
+    Tag = apps.get_model('categories', 'Tag')
+    Video = apps.get_model('videos', 'Video')
+    VideoTag = Video.tags.through
+
+    category_counts = Video.objects.filter(category=OuterRef('pk')).values('category').annotate(
+        total=Count('id')
+    ).values('total')
+    Category.objects.update(videos_count=Coalesce(Subquery(category_counts), 0))
+
+    tag_counts = VideoTag.objects.filter(tag=OuterRef('pk')).values('tag').annotate(
+        total=Count('id')
+    ).values('total')
+    Tag.objects.update(videos_count=Coalesce(Subquery(tag_counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+        ('videos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='videos_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='영상 수'),
+        ),
+        migrations.AddField(
+            model_name='tag',
+            name='videos_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='영상 수'),
+        ),
+        migrations.RunPython(backfill_videos_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:39
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_videos_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TagLeaderboard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('window', models.CharField(choices=[('7d', '최근 7일'), ('30d', '최근 30일')], max_length=10, unique=True, verbose_name='기간')),
+                ('entries', models.JSONField(default=list, help_text='[[tag_id, score], ...] 점수 내림차순', verbose_name='순위')),
+                ('computed_at', models.DateTimeField(auto_now=True, verbose_name='계산일')),
+            ],
+            options={
+                'verbose_name': '인기 태그 순위',
+                'verbose_name_plural': '인기 태그 순위 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='TagDailyCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(default=django.utils.timezone.localdate, verbose_name='날짜')),
+                ('count', models.IntegerField(default=0, verbose_name='증감')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_counts', to='categories.tag', verbose_name='태그')),
+            ],
+            options={
+                'verbose_name': '태그 일별 집계',
+                'verbose_name_plural': '태그 일별 집계 목록',
+                'indexes': [models.Index(fields=['date'], name='categories__date_f2ee54_idx')],
+                'unique_together': {('tag', 'date')},
+            },
+        ),
+    ]
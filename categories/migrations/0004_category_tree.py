@@ -0,0 +1,46 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_paths(apps, schema_editor):
+    """기존 카테고리는 모두 루트로 경로 지정"""
+    Category = apps.get_model('categories', 'Category')
+    categories = list(Category.objects.only('pk'))
+    for category in categories:
+        category.path = f'{category.pk:08d}/'
+    Category.objects.bulk_update(categories, ['path'], batch_size=500)
+    Category.objects.update(subtree_videos_count=F('videos_count'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0003_tag_leaderboard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='category',
+            name='depth',
+            field=models.PositiveSmallIntegerField(default=0, editable=False, verbose_name='깊이'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='parent',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='children', to='categories.category', verbose_name='상위 카테고리'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='path',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255, verbose_name='경로'),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='subtree_videos_count',
+            field=models.PositiveIntegerField(default=0, help_text='하위 카테고리를 포함한 영상 수', verbose_name='전체 영상 수'),
+        ),
+        migrations.RunPython(backfill_paths, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,40 @@
-from django.db import models
+from django.db import models, transaction
+from django.db.models import F, Max, Q, Value
+from django.db.models.functions import Concat, Length, Substr
 from django.utils.text import slugify
 from django.core.exceptions import ValidationError
+from django.utils import timezone
 
 
 class Category(models.Model):
-    """영상 카테고리"""
+    """
+    영상 카테고리 (계층 구조)
 
+    path 는 루트부터 자신까지의 id 를 고정 폭으로 이어 붙인 materialized path
+    (예: '00000001/00000004/') 이므로 하위 트리 전체를 인덱스 범위 조회 한 번으로
+    찾을 수 있습니다.
+    """
+
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        related_name='children',
+        verbose_name='상위 카테고리'
+    )
+    path = models.CharField(
+        max_length=255,
+        blank=True,
+        db_index=True,
+        editable=False,
+        verbose_name='경로'
+    )
+    depth = models.PositiveSmallIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='깊이'
+    )
     name = models.CharField(
         max_length=50,
         unique=True,
@@ -26,6 +55,15 @@ class Category(models.Model):
         help_text='이모지 또는 아이콘 클래스명',
         verbose_name='아이콘'
     )
+    videos_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='영상 수'
+    )
+    subtree_videos_count = models.PositiveIntegerField(
+        default=0,
+        help_text='하위 카테고리를 포함한 영상 수',
+        verbose_name='전체 영상 수'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -34,21 +72,119 @@ class Category(models.Model):
         verbose_name_plural = '카테고리 목록'
         ordering = ['name']
 
+    # 시그널/트리 이동 시 UPDATE 로만 갱신되는 필드
+    DENORMALIZED_FIELDS = ('path', 'depth', 'videos_count', 'subtree_videos_count')
+
+    # 경로 한 단계 길이 ('00000001/') 와 path 길이 제한으로 정해지는 최대 단계 수
+    PATH_SEGMENT_LENGTH = 9
+    MAX_LEVELS = 255 // PATH_SEGMENT_LENGTH
+
     def __str__(self):
         return self.name
 
+    @staticmethod
+    def subtree_lookup(path, prefix=''):
+        """
+        path 하위 트리(자신 포함) 조건: path 로 시작하는 경로
+
+        범위 비교(path 이상 ~ 다음 문자열 미만)는 콜레이션에 따라 '/' 의 정렬 위치가
+        달라 하위 행이 빠질 수 있으므로 접두어 LIKE 를 사용합니다.
+        (PostgreSQL 은 db_index=True 인 CharField 에 varchar_pattern_ops 인덱스를
+        함께 만들어 두므로 이 조건도 인덱스를 탑니다.)
+        """
+        return Q(**{f'{prefix}path__startswith': path})
+
+    @staticmethod
+    def ancestor_ids(path):
+        """경로에 포함된 카테고리 id 목록 (루트 → 자신)"""
+        return [int(part) for part in path.split('/') if part]
+
     def clean(self):
         """모델 레벨 검증"""
         super().clean()
         if self.name and len(self.name) < 2:
             raise ValidationError({'name': '카테고리명은 2자 이상이어야 합니다.'})
+        if self.pk and self.parent_id:
+            if self.parent_id == self.pk or self.pk in self.ancestor_ids(self.parent.path):
+                raise ValidationError({'parent': '자신 또는 하위 카테고리를 상위 카테고리로 지정할 수 없습니다.'})
+        if self.parent_id and len(self.parent.path) + self.PATH_SEGMENT_LENGTH + self._subtree_height() > self._meta.get_field('path').max_length:
+            raise ValidationError({'parent': f'카테고리는 최대 {self.MAX_LEVELS}단계까지 만들 수 있습니다.'})
+
+    def _subtree_height(self):
+        """하위 트리에서 자신보다 가장 깊은 경로가 더 긴 길이 (이동 시 함께 길어짐)"""
+        if not self.pk:
+            return 0
+        path = Category.objects.filter(pk=self.pk).values_list('path', flat=True).first()
+        if not path:
+            return 0
+        deepest = Category.objects.filter(self.subtree_lookup(path)).aggregate(length=Max(Length('path')))['length']
+        return (deepest or len(path)) - len(path)
 
     def save(self, *args, **kwargs):
         # 슬러그 자동 생성
         if not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
         self.full_clean()
-        super().save(*args, **kwargs)
+
+        adding = self._state.adding
+        previous_parent_id = None
+        if not adding:
+            previous_parent_id = Category.objects.filter(pk=self.pk).values_list('parent_id', flat=True).first()
+            # 영상 수/경로는 시그널과 트리 이동에서 UPDATE 로만 갱신
+            if kwargs.get('update_fields') is None:
+                kwargs['update_fields'] = [
+                    field.name for field in self._meta.concrete_fields
+                    if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+                ]
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if adding:
+                self._set_path()
+            elif previous_parent_id != self.parent_id:
+                self._move()
+
+    def _parent_position(self):
+        if self.parent_id is None:
+            return '', 0
+        parent = Category.objects.values('path', 'depth').get(pk=self.parent_id)
+        return parent['path'], parent['depth'] + 1
+
+    def _set_path(self):
+        """새 카테고리 경로 지정"""
+        parent_path, self.depth = self._parent_position()
+        self.path = f'{parent_path}{self.pk:08d}/'
+        Category.objects.filter(pk=self.pk).update(path=self.path, depth=self.depth)
+
+    def _move(self):
+        """
+        하위 트리 이동
+
+        하위 트리 전체의 경로/깊이를 UPDATE 한 번으로 바꾸고,
+        기존/새 조상의 전체 영상 수를 하위 트리 영상 수만큼 옮깁니다.
+        """
+        current = Category.objects.values('path', 'depth', 'subtree_videos_count').get(pk=self.pk)
+        old_path = current['path']
+        parent_path, depth = self._parent_position()
+        new_path = f'{parent_path}{self.pk:08d}/'
+
+        Category.objects.filter(self.subtree_lookup(old_path)).update(
+            path=Concat(Value(new_path), Substr('path', len(old_path) + 1), output_field=models.CharField()),
+            depth=F('depth') + (depth - current['depth'])
+        )
+
+        moved = current['subtree_videos_count']
+        if moved:
+            Category.objects.filter(
+                pk__in=self.ancestor_ids(old_path)[:-1],
+                subtree_videos_count__gte=moved
+            ).update(subtree_videos_count=F('subtree_videos_count') - moved)
+            Category.objects.filter(pk__in=self.ancestor_ids(new_path)[:-1]).update(
+                subtree_videos_count=F('subtree_videos_count') + moved
+            )
+
+        self.path = new_path
+        self.depth = depth
 
 
 class Tag(models.Model):
@@ -64,6 +200,10 @@ class Tag(models.Model):
         unique=True,
         verbose_name='슬러그'
     )
+    videos_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='영상 수'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -74,6 +214,49 @@ class Tag(models.Model):
     def __str__(self):
         return f"#{self.name}"
 
+    @classmethod
+    def bulk_get_or_create(cls, names):
+        """
+        이름 목록으로 태그 조회, 없는 태그는 한 번에 생성
+
+        슬러그를 미리 계산해 이름/슬러그로 한 번에 조회하고, 없는 태그는
+        bulk_create(ignore_conflicts=True) 로 만든 뒤 다시 조회합니다.
+        동시 요청이 같은 태그를 먼저 만들어도 충돌은 무시되고 그 태그를 사용합니다.
+        이름 순서대로 태그 목록을 반환합니다. (같은 태그는 한 번만)
+        """
+        from . import taxonomy
+
+        slugs = {name: slugify(name, allow_unicode=True) for name in names}
+
+        def lookup():
+            tags = cls.objects.filter(Q(name__in=slugs.keys()) | Q(slug__in=slugs.values()))
+            by_name, by_slug = {}, {}
+            for tag in tags:
+                by_name[tag.name] = tag
+                by_slug[tag.slug] = tag
+            return {
+                name: by_name.get(name) or by_slug.get(slug)
+                for name, slug in slugs.items()
+                if name in by_name or slug in by_slug
+            }
+
+        found = lookup()
+        missing = [name for name in slugs if name not in found]
+        if missing:
+            created = {}
+            for name in missing:
+                created.setdefault(slugs[name], cls(name=name, slug=slugs[name]))
+            cls.objects.bulk_create(created.values(), ignore_conflicts=True)
+            transaction.on_commit(taxonomy.bump_version)
+            found = lookup()
+
+        tags = []
+        for name in names:
+            tag = found.get(name)
+            if tag is not None and tag not in tags:
+                tags.append(tag)
+        return tags
+
     def clean(self):
         """모델 레벨 검증"""
         super().clean()
@@ -85,4 +268,70 @@ class Tag(models.Model):
         if not self.slug:
             self.slug = slugify(self.name, allow_unicode=True)
         self.full_clean()
+
+        # 영상 수는 영상 변경 시그널에서 F() 로만 갱신
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'videos_count'
+            ]
         super().save(*args, **kwargs)
+
+
+class TagDailyCount(models.Model):
+    """태그 일별 영상 연결 증감 (기간별 인기 태그 집계용)"""
+
+    tag = models.ForeignKey(
+        Tag,
+        on_delete=models.CASCADE,
+        related_name='daily_counts',
+        verbose_name='태그'
+    )
+    date = models.DateField(
+        default=timezone.localdate,
+        verbose_name='날짜'
+    )
+    count = models.IntegerField(
+        default=0,
+        verbose_name='증감'
+    )
+
+    class Meta:
+        verbose_name = '태그 일별 집계'
+        verbose_name_plural = '태그 일별 집계 목록'
+        unique_together = [['tag', 'date']]
+        indexes = [
+            models.Index(fields=['date']),
+        ]
+
+    def __str__(self):
+        return f"{self.tag_id} {self.date}: {self.count:+d}"
+
+
+class TagLeaderboard(models.Model):
+    """기간별 인기 태그 스냅샷 (점수 내림차순 상위 N개)"""
+
+    WINDOW_CHOICES = (
+        ('7d', '최근 7일'),
+        ('30d', '최근 30일'),
+    )
+
+    window = models.CharField(
+        max_length=10,
+        choices=WINDOW_CHOICES,
+        unique=True,
+        verbose_name='기간'
+    )
+    entries = models.JSONField(
+        default=list,
+        help_text='[[tag_id, score], ...] 점수 내림차순',
+        verbose_name='순위'
+    )
+    computed_at = models.DateTimeField(auto_now=True, verbose_name='계산일')
+
+    class Meta:
+        verbose_name = '인기 태그 순위'
+        verbose_name_plural = '인기 태그 순위 목록'
+
+    def __str__(self):
+        return f"{self.get_window_display()} ({len(self.entries)})"
@@ -5,15 +5,17 @@ from .models import Category, Tag
 class CategorySerializer(serializers.ModelSerializer):
     """카테고리 Serializer"""
 
-    videos_count = serializers.IntegerField(source='videos.count', read_only=True)
-
     class Meta:
         model = Category
         fields = [
             'id', 'name', 'slug', 'description', 'icon',
-            'videos_count', 'created_at', 'updated_at'
+            'parent', 'path', 'depth',
+            'videos_count', 'subtree_videos_count', 'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'slug', 'path', 'depth',
+            'videos_count', 'subtree_videos_count', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'slug', 'created_at', 'updated_at']
 
     def validate_name(self, value):
         """이름 검증"""
@@ -27,7 +29,7 @@ class CategoryCreateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Category
-        fields = ['name', 'description', 'icon']
+        fields = ['name', 'description', 'icon', 'parent']
 
     def validate_name(self, value):
         """이름 검증"""
@@ -35,18 +37,22 @@ class CategoryCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('카테고리명은 2자 이상이어야 합니다.')
         return value
 
+    def validate_parent(self, value):
+        """상위 카테고리 검증 (자신 또는 하위 카테고리로 이동 불가)"""
+        if value and self.instance and self.instance.pk in Category.ancestor_ids(value.path):
+            raise serializers.ValidationError('자신 또는 하위 카테고리를 상위 카테고리로 지정할 수 없습니다.')
+        return value
+
 
 class TagSerializer(serializers.ModelSerializer):
     """태그 Serializer"""
 
-    videos_count = serializers.IntegerField(source='videos.count', read_only=True)
-
     class Meta:
         model = Tag
         fields = [
             'id', 'name', 'slug', 'videos_count', 'created_at'
         ]
-        read_only_fields = ['id', 'slug', 'created_at']
+        read_only_fields = ['id', 'slug', 'videos_count', 'created_at']
 
     def validate_name(self, value):
         """이름 검증"""
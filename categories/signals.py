@@ -0,0 +1,134 @@
+"""
+카테고리/태그 영상 수(videos_count) 유지
+
+Video 저장/삭제와 Video.tags 변경 시 F() UPDATE 로 증감합니다. 카테고리는 조상까지
+전체 영상 수(subtree_videos_count)도 함께 갱신합니다. 영상 수 변경으로는 taxonomy
+스냅샷 버전을 올리지 않고(스냅샷 TTL 로 반영), 카테고리/태그 구조 변경 시에만 올립니다.
+"""
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import pre_save, post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from videos.models import Video
+from .models import Category, Tag
+from . import taxonomy, leaderboard
+
+
+def _adjust(model, pks, delta):
+    pks = [pk for pk in pks if pk is not None]
+    if not pks:
+        return
+    if model is Tag:
+        leaderboard.record_tag_changes(pks, delta)
+    if model is Category:
+        _rollup_subtree(pks, delta)
+    if delta > 0:
+        model.objects.filter(pk__in=pks).update(videos_count=F('videos_count') + delta)
+    else:
+        model.objects.filter(pk__in=pks, videos_count__gte=-delta).update(
+            videos_count=F('videos_count') + delta
+        )
+
+
+def _rollup_subtree(pks, delta):
+    """카테고리와 모든 조상의 전체 영상 수(subtree_videos_count) 증감"""
+    for path in Category.objects.filter(pk__in=pks).values_list('path', flat=True):
+        ancestors = Category.objects.filter(pk__in=Category.ancestor_ids(path))
+        if delta > 0:
+            ancestors.update(subtree_videos_count=F('subtree_videos_count') + delta)
+        else:
+            ancestors.filter(subtree_videos_count__gte=-delta).update(
+                subtree_videos_count=F('subtree_videos_count') + delta
+            )
+
+
+@receiver(pre_save, sender=Video)
+def remember_previous_category(sender, instance, **kwargs):
+    """수정 전 카테고리 기억"""
+    instance._previous_category_id = None
+    if instance.pk and not instance._state.adding:
+        instance._previous_category_id = Video.objects.filter(
+            pk=instance.pk
+        ).values_list('category_id', flat=True).first()
+
+
+@receiver(post_save, sender=Video)
+def update_category_count(sender, instance, created, **kwargs):
+    """영상 생성/카테고리 변경 시 카테고리 영상 수 갱신"""
+    if created:
+        _adjust(Category, [instance.category_id], 1)
+        return
+
+    previous = getattr(instance, '_previous_category_id', None)
+    if previous != instance.category_id:
+        _adjust(Category, [previous], -1)
+        _adjust(Category, [instance.category_id], 1)
+
+
+@receiver(pre_delete, sender=Video)
+def release_tag_counts(sender, instance, **kwargs):
+    """영상 삭제 시 태그 영상 수 감소 (M2M 행은 m2m_changed 없이 삭제됨)"""
+    _adjust(Tag, list(instance.tags.values_list('pk', flat=True)), -1)
+
+
+@receiver(post_delete, sender=Video)
+def release_category_count(sender, instance, **kwargs):
+    """영상 삭제 시 카테고리 영상 수 감소"""
+    _adjust(Category, [instance.category_id], -1)
+
+
+@receiver(m2m_changed, sender=Video.tags.through)
+def update_tag_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    """영상 태그 추가/제거 시 태그 영상 수 갱신"""
+    if reverse:
+        # Tag 쪽에서 영상을 추가/제거하는 경우 (tag.videos.add(...))
+        if action == 'post_add':
+            _adjust(Tag, [instance.pk], len(pk_set))
+        elif action == 'pre_remove':
+            instance._removed_videos_count = instance.videos.filter(pk__in=pk_set).count()
+        elif action == 'post_remove':
+            _adjust(Tag, [instance.pk], -getattr(instance, '_removed_videos_count', 0))
+        elif action == 'pre_clear':
+            instance._removed_videos_count = instance.videos.count()
+        elif action == 'post_clear':
+            _adjust(Tag, [instance.pk], -getattr(instance, '_removed_videos_count', 0))
+        return
+
+    # post_add 의 pk_set 은 실제로 새로 추가된 태그만 포함
+    if action == 'post_add':
+        _adjust(Tag, pk_set, 1)
+    elif action == 'pre_remove':
+        instance._removed_tag_ids = list(instance.tags.filter(pk__in=pk_set).values_list('pk', flat=True))
+    elif action == 'pre_clear':
+        instance._removed_tag_ids = list(instance.tags.values_list('pk', flat=True))
+    elif action in ('post_remove', 'post_clear'):
+        _adjust(Tag, getattr(instance, '_removed_tag_ids', []), -1)
+
+
+@receiver(pre_delete, sender=Category)
+def release_deleted_category(sender, instance, **kwargs):
+    """
+    카테고리 삭제 시 조상의 전체 영상 수에서 이 카테고리의 영상 수를 뺌
+
+    Video.category 는 SET_NULL 이라 영상은 시그널 없는 UPDATE 로 분리되므로
+    여기서 직접 빼야 합니다. (parent 가 PROTECT 라 삭제되는 것은 항상 리프 카테고리이고,
+    리프의 videos_count 가 곧 하위 트리 영상 수입니다.)
+    """
+    current = Category.objects.filter(pk=instance.pk).values('path', 'videos_count').first()
+    if current is None or not current['videos_count']:
+        return
+    count = current['videos_count']
+    Category.objects.filter(
+        pk__in=Category.ancestor_ids(current['path'])[:-1],
+        subtree_videos_count__gte=count
+    ).update(subtree_videos_count=F('subtree_videos_count') - count)
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_taxonomy(sender, **kwargs):
+    """카테고리/태그 변경 시 스냅샷 무효화"""
+    transaction.on_commit(taxonomy.bump_version)
@@ -0,0 +1,81 @@
+"""
+카테고리/태그 스냅샷 캐시
+
+카테고리·태그 목록은 거의 바뀌지 않으므로 프로세스마다 직렬화된 스냅샷을
+메모리에 들고 있고, 공유 캐시의 버전 스탬프가 바뀐 경우에만 다시 만듭니다.
+조회 비용은 캐시 GET 한 번입니다.
+
+- 카테고리/태그 추가·수정·삭제(구조 변경) 시에만 bump_version() 으로 스탬프를 올립니다.
+- 영상 수(videos_count 등)는 비정규화 컬럼에서 읽으므로, 영상 업로드마다 모든 프로세스가
+  재구성하지 않도록 스냅샷을 TAXONOMY_SNAPSHOT_MAX_AGE_SECONDS 마다만 다시 만듭니다.
+  (영상 수는 그만큼 늦게 반영될 수 있습니다.)
+"""
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = 'taxonomy:version'
+
+_lock = threading.Lock()
+_snapshot = None
+_snapshot_version = None
+_snapshot_built_at = 0.0
+
+
+def get_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        version = uuid.uuid4().hex
+        # 다른 프로세스가 먼저 만들었으면 그 값을 사용
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def bump_version():
+    """버전 스탬프 변경 (모든 프로세스의 스냅샷 무효화)"""
+    cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def _build():
+    from .models import Category, Tag
+    from .serializers import CategorySerializer, TagSerializer
+
+    categories = CategorySerializer(Category.objects.order_by('name'), many=True).data
+    tags = TagSerializer(Tag.objects.order_by('name'), many=True).data
+    tags = [dict(item) for item in tags]
+    return {
+        'categories': [dict(item) for item in categories],
+        'categories_by_slug': {item['slug']: dict(item) for item in categories},
+        'categories_by_id': {item['id']: dict(item) for item in categories},
+        'tags': tags,
+        'tags_by_slug': {tag['slug']: tag for tag in tags},
+        'tags_by_id': {tag['id']: tag for tag in tags},
+        'popular_tags': sorted(tags, key=lambda tag: (-tag['videos_count'], tag['name'])),
+    }
+
+
+def get_snapshot():
+    """현재 버전의 카테고리/태그 스냅샷"""
+    global _snapshot, _snapshot_version, _snapshot_built_at
+
+    def is_current():
+        return (
+            _snapshot is not None
+            and _snapshot_version == version
+            and time.monotonic() - _snapshot_built_at < settings.TAXONOMY_SNAPSHOT_MAX_AGE_SECONDS
+        )
+
+    version = get_version()
+    if is_current():
+        return _snapshot
+
+    with _lock:
+        if not is_current():
+            _snapshot = _build()
+            _snapshot_version = version
+            _snapshot_built_at = time.monotonic()
+    return _snapshot
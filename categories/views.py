@@ -1,11 +1,13 @@
 from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Count
+from django.http import Http404
+from django.db.models import ProtectedError
 
 from .models import Category, Tag
+from . import taxonomy, leaderboard
 from .serializers import (
     CategorySerializer,
     CategoryCreateSerializer,
@@ -31,10 +33,11 @@ class IsAdminOrReadOnly(permissions.BasePermission):
 class CategoryViewSet(viewsets.ModelViewSet):
     """카테고리 ViewSet"""
 
-    queryset = Category.objects.annotate(videos_count=Count('videos'))
+    queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
+    claims_user_on_read = True
 
     def get_serializer_class(self):
         """액션별 Serializer 선택"""
@@ -51,7 +54,13 @@ class CategoryViewSet(viewsets.ModelViewSet):
         }
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        """카테고리 목록 (프로세스 스냅샷에서 제공)"""
+        categories = taxonomy.get_snapshot()['categories']
+
+        page = self.paginate_queryset(categories)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(categories)
 
     @extend_schema(
         tags=['카테고리/태그'],
@@ -63,7 +72,11 @@ class CategoryViewSet(viewsets.ModelViewSet):
         }
     )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        """카테고리 상세 (프로세스 스냅샷에서 제공)"""
+        category = taxonomy.get_snapshot()['categories_by_slug'].get(kwargs['slug'])
+        if category is None:
+            raise Http404('카테고리를 찾을 수 없습니다.')
+        return Response(category)
 
     @extend_schema(
         tags=['카테고리/태그'],
@@ -108,21 +121,29 @@ class CategoryViewSet(viewsets.ModelViewSet):
         description='카테고리를 삭제합니다. (관리자만 가능)',
         responses={
             204: OpenApiResponse(description='삭제 성공'),
+            400: OpenApiResponse(description='하위 카테고리가 있음'),
             403: OpenApiResponse(description='권한 없음'),
             404: OpenApiResponse(description='카테고리를 찾을 수 없음')
         }
     )
     def destroy(self, request, *args, **kwargs):
-        return super().destroy(request, *args, **kwargs)
+        try:
+            return super().destroy(request, *args, **kwargs)
+        except ProtectedError:
+            return Response(
+                {'error': '하위 카테고리가 있는 카테고리는 삭제할 수 없습니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
 
 class TagViewSet(viewsets.ModelViewSet):
     """태그 ViewSet"""
 
-    queryset = Tag.objects.annotate(videos_count=Count('videos'))
+    queryset = Tag.objects.all()
     serializer_class = TagSerializer
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = 'slug'
+    claims_user_on_read = True
 
     def get_serializer_class(self):
         """액션별 Serializer 선택"""
@@ -130,15 +151,15 @@ class TagViewSet(viewsets.ModelViewSet):
             return TagCreateSerializer
         return TagSerializer
 
-    def get_queryset(self):
-        """queryset 최적화"""
-        queryset = super().get_queryset()
+    def get_snapshot_tags(self):
+        """스냅샷 태그 목록 (?popular 이면 영상 수 순)"""
+        snapshot = taxonomy.get_snapshot()
 
-        # 인기 태그 정렬 (영상 수 기준)
+        # 인기 태그 정렬 (영상 수 기준, 스냅샷에 미리 정렬됨)
         if self.request.query_params.get('popular'):
-            queryset = queryset.order_by('-videos_count')
+            return snapshot['popular_tags']
 
-        return queryset
+        return snapshot['tags']
 
     @extend_schema(
         tags=['카테고리/태그'],
@@ -149,7 +170,13 @@ class TagViewSet(viewsets.ModelViewSet):
         }
     )
     def list(self, request, *args, **kwargs):
-        return super().list(request, *args, **kwargs)
+        """태그 목록 (프로세스 스냅샷에서 제공)"""
+        tags = self.get_snapshot_tags()
+
+        page = self.paginate_queryset(tags)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(tags)
 
     @extend_schema(
         tags=['카테고리/태그'],
@@ -161,7 +188,11 @@ class TagViewSet(viewsets.ModelViewSet):
         }
     )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        """태그 상세 (프로세스 스냅샷에서 제공)"""
+        tag = taxonomy.get_snapshot()['tags_by_slug'].get(kwargs['slug'])
+        if tag is None:
+            raise Http404('태그를 찾을 수 없습니다.')
+        return Response(tag)
 
     @extend_schema(
         tags=['카테고리/태그'],
@@ -216,16 +247,35 @@ class TagViewSet(viewsets.ModelViewSet):
     @extend_schema(
         tags=['카테고리/태그'],
         summary='인기 태그 조회',
-        description='영상 수가 많은 인기 태그 순으로 조회합니다.',
+        description=(
+            '인기 태그 상위 K개를 조회합니다. window=all 은 전체 영상 수, '
+            f'7d/30d 는 해당 기간에 새로 연결된 영상 수 기준입니다. (limit 최대 {leaderboard.MAX_LIMIT})'
+        ),
+        parameters=[
+            OpenApiParameter('window', str, enum=['all', '7d', '30d'], description='집계 기간 (기본값: all)'),
+            OpenApiParameter('limit', int, description=f'조회 개수 (기본값: 10, 최대 {leaderboard.MAX_LIMIT})'),
+        ],
         responses={
-            200: OpenApiResponse(response=TagSerializer(many=True))
+            200: OpenApiResponse(response=TagSerializer(many=True)),
+            400: OpenApiResponse(description='잘못된 요청')
         }
     )
     @action(detail=False, methods=['get'])
     def popular(self, request):
-        """인기 태그 조회 (영상 수 기준)"""
-        limit = int(request.query_params.get('limit', 10))
-        tags = self.get_queryset().order_by('-videos_count')[:limit]
+        """인기 태그 조회 (미리 계산된 순위에서 상위 K개)"""
+        window = request.query_params.get('window', 'all')
+        if window != 'all' and window not in leaderboard.WINDOW_DAYS:
+            return Response(
+                {'error': 'window 는 all, 7d, 30d 중 하나여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            limit = int(request.query_params.get('limit', 10))
+        except ValueError:
+            return Response(
+                {'error': 'limit 은 숫자여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        serializer = self.get_serializer(tags, many=True)
-        return Response(serializer.data)
+        return Response(leaderboard.top_tags(window, limit))
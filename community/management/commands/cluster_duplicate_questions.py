@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+
+from community.models import Question, QuestionSignature
+from community.similarity import cluster_duplicates, index_question
+
+
+class Command(BaseCommand):
+    help = '같은 영상의 중복 질문을 MinHash/LSH 버킷으로 묶습니다. (cron 등으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reindex',
+            action='store_true',
+            help='시그니처가 없는 기존 질문을 먼저 색인합니다.'
+        )
+
+    def handle(self, *args, **options):
+        if options['reindex']:
+            missing = Question.objects.exclude(
+                pk__in=QuestionSignature.objects.values('question_id')
+            ).only('id', 'video_id', 'title', 'content')
+            indexed = 0
+            for question in missing.iterator(chunk_size=500):
+                index_question(question)
+                indexed += 1
+            self.stdout.write(f'질문 {indexed}개를 색인했습니다.')
+
+        groups = cluster_duplicates()
+        self.stdout.write(self.style.SUCCESS(f'중복 질문 그룹 {groups}개를 찾았습니다.'))
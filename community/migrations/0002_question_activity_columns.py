@@ -0,0 +1,55 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:33
+
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Greatest
+
+
+def backfill_activity_columns(apps, schema_editor):
+    """기존 질문의 답변 수/최근 활동일 채우기"""
+    Question = apps.get_model('community', 'Question')
+    Answer = apps.get_model('community', 'Answer')
+
+    answers = Answer.objects.filter(question=OuterRef('pk')).values('question')
+    Question.objects.update(
+        answers_count=Coalesce(
+            Subquery(answers.annotate(total=Count('id')).values('total')), 0
+        ),
+        last_activity_at=Greatest(
+            'created_at',
+            Coalesce(Subquery(answers.annotate(latest=Max('created_at')).values('latest')), 'created_at')
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0001_initial'),
+        ('videos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='question',
+            name='answers_count',
+            field=models.PositiveIntegerField(default=0, verbose_name='답변 수'),
+        ),
+        migrations.AddField(
+            model_name='question',
+            name='last_activity_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, verbose_name='최근 활동일'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['-last_activity_at'], name='question_activity_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(condition=models.Q(('is_answered', False)), fields=['-created_at'], name='question_unanswered_idx'),
+        ),
+        migrations.RunPython(backfill_activity_columns, migrations.RunPython.noop),
+    ]
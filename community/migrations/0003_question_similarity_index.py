@@ -0,0 +1,43 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0002_question_activity_columns'),
+        ('videos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='QuestionSignature',
+            fields=[
+                ('question', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='community.question', verbose_name='질문')),
+                ('minhash', models.BinaryField(verbose_name='MinHash 시그니처')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cluster_root', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='community.question', verbose_name='중복 그룹 대표 질문')),
+                ('video', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='videos.video', verbose_name='관련 영상')),
+            ],
+            options={
+                'verbose_name': '질문 시그니처',
+                'verbose_name_plural': '질문 시그니처 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='QuestionBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('bucket_key', models.BigIntegerField(verbose_name='버킷 키')),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='lsh_buckets', to='community.question', verbose_name='질문')),
+                ('video', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='videos.video', verbose_name='관련 영상')),
+            ],
+            options={
+                'verbose_name': '질문 LSH 버킷',
+                'verbose_name_plural': '질문 LSH 버킷 목록',
+                'indexes': [models.Index(fields=['video', 'bucket_key'], name='community_q_video_i_778c54_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:35
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('community', '0003_question_similarity_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnswerVote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.SmallIntegerField(choices=[(1, '추천'), (-1, '비추천')], verbose_name='투표')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': '답변 투표',
+                'verbose_name_plural': '답변 투표 목록',
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='answer',
+            options={'ordering': ['-is_accepted', '-rank', 'created_at'], 'verbose_name': '답변', 'verbose_name_plural': '답변 목록'},
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='downvotes',
+            field=models.PositiveIntegerField(default=0, verbose_name='비추천 수'),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='rank',
+            field=models.FloatField(default=0.0, help_text='추천 비율의 윌슨 신뢰구간 하한', verbose_name='랭킹 점수'),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='score',
+            field=models.IntegerField(default=0, verbose_name='투표 점수'),
+        ),
+        migrations.AddField(
+            model_name='answer',
+            name='upvotes',
+            field=models.PositiveIntegerField(default=0, verbose_name='추천 수'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['question', '-is_accepted', '-rank'], name='answer_ranking_idx'),
+        ),
+        migrations.AddField(
+            model_name='answervote',
+            name='answer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='votes', to='community.answer', verbose_name='답변'),
+        ),
+        migrations.AddField(
+            model_name='answervote',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='answer_votes', to=settings.AUTH_USER_MODEL, verbose_name='사용자'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='answervote',
+            unique_together={('user', 'answer')},
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils import timezone
 from videos.models import Video
 
 
@@ -45,6 +47,22 @@ class Question(models.Model):
         default=0,
         verbose_name='조회수'
     )
+    unique_viewers = models.PositiveIntegerField(
+        default=0,
+        help_text='HyperLogLog 추정값 (주기적으로 갱신)',
+        verbose_name='고유 방문자 수'
+    )
+
+    # 통계 필드 (목록 조회용 비정규화)
+    answers_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='답변 수'
+    )
+    last_activity_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='최근 활동일'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -55,8 +73,17 @@ class Question(models.Model):
         indexes = [
             models.Index(fields=['-created_at']),
             models.Index(fields=['video', '-created_at']),
+            models.Index(fields=['-last_activity_at'], name='question_activity_idx'),
+            # 미답변 질문 최신순 (부분 인덱스)
+            models.Index(
+                fields=['-created_at'],
+                condition=Q(is_answered=False),
+                name='question_unanswered_idx'
+            ),
         ]
 
+    DENORMALIZED_FIELDS = ('views_count', 'unique_viewers', 'answers_count', 'last_activity_at')
+
     def __str__(self):
         return self.title
 
@@ -72,6 +99,13 @@ class Question(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
+
+        # 비정규화 통계 필드는 F() UPDATE 로만 갱신 (오래된 인스턴스 값으로 덮어쓰지 않음)
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
         super().save(*args, **kwargs)
 
 
@@ -97,13 +131,38 @@ class Answer(models.Model):
         default=False,
         verbose_name='채택 여부'
     )
+
+    # 투표 통계 필드
+    upvotes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='추천 수'
+    )
+    downvotes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='비추천 수'
+    )
+    score = models.IntegerField(
+        default=0,
+        verbose_name='투표 점수'
+    )
+    rank = models.FloatField(
+        default=0.0,
+        help_text='추천 비율의 윌슨 신뢰구간 하한',
+        verbose_name='랭킹 점수'
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    DENORMALIZED_FIELDS = ('upvotes', 'downvotes', 'score', 'rank')
+
     class Meta:
         verbose_name = '답변'
         verbose_name_plural = '답변 목록'
-        ordering = ['-is_accepted', 'created_at']
+        ordering = ['-is_accepted', '-rank', 'created_at']
+        indexes = [
+            models.Index(fields=['question', '-is_accepted', '-rank'], name='answer_ranking_idx'),
+        ]
 
     def __str__(self):
         status = " (채택됨)" if self.is_accepted else ""
@@ -118,4 +177,118 @@ class Answer(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
+
+        # 투표 통계 필드는 투표 처리에서만 갱신 (오래된 인스턴스 값으로 덮어쓰지 않음)
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
         super().save(*args, **kwargs)
+
+
+class AnswerVote(models.Model):
+    """답변 추천/비추천"""
+
+    VALUE_CHOICES = (
+        (1, '추천'),
+        (-1, '비추천'),
+    )
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='answer_votes',
+        verbose_name='사용자'
+    )
+    answer = models.ForeignKey(
+        Answer,
+        on_delete=models.CASCADE,
+        related_name='votes',
+        verbose_name='답변'
+    )
+    value = models.SmallIntegerField(
+        choices=VALUE_CHOICES,
+        verbose_name='투표'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '답변 투표'
+        verbose_name_plural = '답변 투표 목록'
+        unique_together = [['user', 'answer']]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.answer_id}: {self.value:+d}"
+
+
+class QuestionSignature(models.Model):
+    """질문 MinHash 시그니처 (중복 질문 탐지용)"""
+
+    question = models.OneToOneField(
+        Question,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='signature',
+        verbose_name='질문'
+    )
+    video = models.ForeignKey(
+        Video,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='관련 영상'
+    )
+    minhash = models.BinaryField(
+        verbose_name='MinHash 시그니처'
+    )
+    cluster_root = models.ForeignKey(
+        Question,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='중복 그룹 대표 질문'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '질문 시그니처'
+        verbose_name_plural = '질문 시그니처 목록'
+
+    def __str__(self):
+        return f"{self.question_id} (group: {self.cluster_root_id})"
+
+
+class QuestionBucket(models.Model):
+    """질문 LSH 버킷 (영상 단위, 밴드별 해시)"""
+
+    question = models.ForeignKey(
+        Question,
+        on_delete=models.CASCADE,
+        related_name='lsh_buckets',
+        verbose_name='질문'
+    )
+    video = models.ForeignKey(
+        Video,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='관련 영상'
+    )
+    bucket_key = models.BigIntegerField(
+        verbose_name='버킷 키'
+    )
+
+    class Meta:
+        verbose_name = '질문 LSH 버킷'
+        verbose_name_plural = '질문 LSH 버킷 목록'
+        indexes = [
+            models.Index(fields=['video', 'bucket_key']),
+        ]
+
+    def __str__(self):
+        return f"{self.question_id}: {self.bucket_key}"
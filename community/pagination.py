@@ -0,0 +1,55 @@
+"""
+답변 키셋 페이지네이션
+
+채택된 답변은 질문 상세에 따로 고정되므로, 나머지 답변만
+(rank 내림차순, id 오름차순) 키셋으로 나눠 읽습니다.
+answer_ranking_idx (question, -is_accepted, -rank) 인덱스를 그대로 따라가며
+OFFSET/COUNT 쿼리가 없습니다.
+"""
+import base64
+import binascii
+
+from django.db.models import Q
+
+from .models import Answer
+
+ANSWERS_PAGE_SIZE = 10
+MAX_ANSWERS_PAGE_SIZE = 50
+
+
+def encode_cursor(position):
+    rank, answer_id = position
+    return base64.urlsafe_b64encode(f'{rank!r}|{answer_id}'.encode()).decode()
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (rank, answer_id) 로 변환 (잘못된 커서면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        rank, answer_id = raw.split('|', 1)
+        return float(rank), int(answer_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+
+def get_answer_page(question_id, position=None, page_size=ANSWERS_PAGE_SIZE):
+    """
+    채택되지 않은 답변 한 페이지
+
+    Returns:
+        (답변 목록, 다음 페이지 위치 또는 None)
+    """
+    answers = Answer.objects.filter(
+        question_id=question_id, is_accepted=False
+    ).select_related('user')
+
+    if position:
+        rank, answer_id = position
+        answers = answers.filter(Q(rank__lt=rank) | Q(rank=rank, id__gt=answer_id))
+
+    answers = list(answers.order_by('-rank', 'id')[:page_size + 1])
+    if len(answers) > page_size:
+        answers = answers[:page_size]
+        last = answers[-1]
+        return answers, (last.rank, last.id)
+    return answers, None
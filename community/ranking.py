@@ -0,0 +1,85 @@
+"""
+답변 랭킹 (윌슨 점수 구간 하한)
+
+추천/비추천 수가 바뀔 때마다 해당 답변 행을 잠그고 랭킹 점수를 다시 계산해
+저장하므로, 목록은 (question, -is_accepted, -rank) 인덱스 순서로 바로 읽을 수 있습니다.
+"""
+import math
+
+from django.db import transaction
+
+from .models import Answer, AnswerVote
+
+Z_95 = 1.96
+
+
+def wilson_lower_bound(upvotes, downvotes, z=Z_95):
+    """추천 비율의 윌슨 신뢰구간 하한 (투표가 없으면 0)"""
+    total = upvotes + downvotes
+    if total == 0:
+        return 0.0
+
+    phat = upvotes / total
+    return (
+        phat + z * z / (2 * total)
+        - z * math.sqrt((phat * (1 - phat) + z * z / (4 * total)) / total)
+    ) / (1 + z * z / total)
+
+
+def _lock_answer(answer_id):
+    """답변 행 잠금 (투표 변경은 항상 답변 → 투표 순서로 잠가 같은 사용자의 동시 투표를 직렬화)"""
+    return Answer.objects.select_for_update().only(
+        'id', 'upvotes', 'downvotes'
+    ).get(pk=answer_id)
+
+
+def _apply(answer, up_delta, down_delta):
+    """잠근 답변의 투표 수/점수/랭킹을 갱신"""
+    answer.upvotes = max(answer.upvotes + up_delta, 0)
+    answer.downvotes = max(answer.downvotes + down_delta, 0)
+    answer.score = answer.upvotes - answer.downvotes
+    answer.rank = wilson_lower_bound(answer.upvotes, answer.downvotes)
+    Answer.objects.filter(pk=answer.pk).update(
+        upvotes=answer.upvotes,
+        downvotes=answer.downvotes,
+        score=answer.score,
+        rank=answer.rank
+    )
+    return answer
+
+
+def _deltas(value):
+    return (1, 0) if value > 0 else (0, 1)
+
+
+def vote(user, answer, value):
+    """투표 (같은 값이면 변화 없음, 반대 값이면 전환)"""
+    with transaction.atomic():
+        locked = _lock_answer(answer.pk)
+        existing = AnswerVote.objects.filter(user=user, answer=answer).first()
+        if existing is None:
+            AnswerVote.objects.create(user=user, answer=answer, value=value)
+            up, down = _deltas(value)
+        elif existing.value == value:
+            up, down = 0, 0
+        else:
+            old_up, old_down = _deltas(existing.value)
+            new_up, new_down = _deltas(value)
+            existing.value = value
+            existing.save(update_fields=['value', 'updated_at'])
+            up, down = new_up - old_up, new_down - old_down
+
+        return _apply(locked, up, down)
+
+
+def unvote(user, answer):
+    """투표 취소 (투표 기록이 없으면 None)"""
+    with transaction.atomic():
+        locked = _lock_answer(answer.pk)
+        existing = AnswerVote.objects.filter(user=user, answer=answer).first()
+        if existing is None:
+            return None
+
+        up, down = _deltas(existing.value)
+        existing.delete()
+        return _apply(locked, -up, -down)
@@ -1,6 +1,10 @@
 from rest_framework import serializers
-from .models import Question, Answer
+from django.urls import reverse
+from drf_spectacular.utils import extend_schema_field
+from .models import Question, Answer, AnswerVote
+from .pagination import get_answer_page, encode_cursor
 from accounts.serializers import UserSerializer
+from videos.models import Video
 from videos.serializers import VideoListSerializer
 
 
@@ -12,10 +16,22 @@ class AnswerSerializer(serializers.ModelSerializer):
     class Meta:
         model = Answer
         fields = [
-            'id', 'question', 'user', 'content',
-            'is_accepted', 'created_at', 'updated_at'
+            'id', 'question', 'user', 'content', 'is_accepted',
+            'upvotes', 'downvotes', 'score',
+            'created_at', 'updated_at'
+        ]
+        read_only_fields = [
+            'id', 'user', 'is_accepted', 'upvotes', 'downvotes', 'score',
+            'created_at', 'updated_at'
         ]
-        read_only_fields = ['id', 'user', 'is_accepted', 'created_at', 'updated_at']
+
+
+class AnswerVoteSerializer(serializers.ModelSerializer):
+    """답변 투표 Serializer"""
+
+    class Meta:
+        model = AnswerVote
+        fields = ['value']
 
 
 class AnswerCreateSerializer(serializers.ModelSerializer):
@@ -37,23 +53,30 @@ class AnswerCreateSerializer(serializers.ModelSerializer):
         return Answer.objects.create(**validated_data)
 
 
+class QuestionVideoSerializer(serializers.ModelSerializer):
+    """질문 목록용 영상 요약 Serializer"""
+
+    class Meta:
+        model = Video
+        fields = ['id', 'title', 'thumbnail']
+
+
 class QuestionListSerializer(serializers.ModelSerializer):
     """질문 목록 Serializer"""
 
     user = UserSerializer(read_only=True)
-    video = VideoListSerializer(read_only=True)
-    answers_count = serializers.IntegerField(source='answers.count', read_only=True)
+    video = QuestionVideoSerializer(read_only=True)
 
     class Meta:
         model = Question
         fields = [
             'id', 'user', 'video', 'title', 'content',
-            'is_answered', 'answers_count', 'views_count',
-            'created_at', 'updated_at'
+            'is_answered', 'answers_count', 'views_count', 'unique_viewers',
+            'last_activity_at', 'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'user', 'is_answered', 'views_count',
-            'created_at', 'updated_at'
+            'id', 'user', 'is_answered', 'answers_count', 'views_count', 'unique_viewers',
+            'last_activity_at', 'created_at', 'updated_at'
         ]
 
 
@@ -62,22 +85,46 @@ class QuestionDetailSerializer(serializers.ModelSerializer):
 
     user = UserSerializer(read_only=True)
     video = VideoListSerializer(read_only=True)
-    answers = AnswerSerializer(many=True, read_only=True)
+    answers = serializers.SerializerMethodField()
+    answers_next = serializers.SerializerMethodField()
     accepted_answer = AnswerSerializer(read_only=True)
-    answers_count = serializers.IntegerField(source='answers.count', read_only=True)
 
     class Meta:
         model = Question
         fields = [
             'id', 'user', 'video', 'title', 'content',
-            'is_answered', 'accepted_answer', 'answers', 'answers_count',
-            'views_count', 'created_at', 'updated_at'
+            'is_answered', 'accepted_answer', 'answers', 'answers_next', 'answers_count',
+            'views_count', 'unique_viewers', 'last_activity_at', 'created_at', 'updated_at'
         ]
         read_only_fields = [
-            'id', 'user', 'is_answered', 'accepted_answer',
-            'views_count', 'created_at', 'updated_at'
+            'id', 'user', 'is_answered', 'accepted_answer', 'answers_count',
+            'views_count', 'unique_viewers', 'last_activity_at', 'created_at', 'updated_at'
         ]
 
+    def _first_page(self, obj):
+        """채택 답변을 제외한 랭킹 순 첫 페이지 (질문당 한 번만 조회)"""
+        if not hasattr(obj, '_answers_first_page'):
+            obj._answers_first_page = get_answer_page(obj.id)
+        return obj._answers_first_page
+
+    @extend_schema_field(AnswerSerializer(many=True))
+    def get_answers(self, obj):
+        """답변 첫 페이지 (나머지는 answers_next 커서로 조회)"""
+        answers, _ = self._first_page(obj)
+        return AnswerSerializer(answers, many=True, context=self.context).data
+
+    @extend_schema_field(serializers.URLField(allow_null=True))
+    def get_answers_next(self, obj):
+        """다음 답변 페이지 URL"""
+        _, next_position = self._first_page(obj)
+        if next_position is None:
+            return None
+
+        url = reverse('question-answers', kwargs={'pk': obj.pk})
+        url = f'{url}?cursor={encode_cursor(next_position)}'
+        request = self.context.get('request')
+        return request.build_absolute_uri(url) if request else url
+
 
 class QuestionCreateSerializer(serializers.ModelSerializer):
     """질문 생성 Serializer"""
@@ -102,3 +149,28 @@ class QuestionCreateSerializer(serializers.ModelSerializer):
         """질문 생성"""
         # user는 view에서 전달
         return Question.objects.create(**validated_data)
+
+
+class SimilarQuestionQuerySerializer(serializers.Serializer):
+    """작성 전 유사 질문 조회 요청 Serializer"""
+
+    video = serializers.PrimaryKeyRelatedField(
+        queryset=Video.objects.all(),
+        required=False,
+        allow_null=True
+    )
+    title = serializers.CharField(max_length=200)
+    content = serializers.CharField(required=False, allow_blank=True, default='')
+
+
+class SimilarQuestionSerializer(serializers.ModelSerializer):
+    """유사 질문 Serializer"""
+
+    similarity = serializers.FloatField(read_only=True)
+
+    class Meta:
+        model = Question
+        fields = [
+            'id', 'title', 'is_answered', 'answers_count',
+            'similarity', 'created_at'
+        ]
@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import Question, Answer
+from . import similarity
+
+
+@receiver(post_save, sender=Answer)
+def increase_answers_count(sender, instance, created, **kwargs):
+    """답변 작성 시 질문의 답변 수/최근 활동일 갱신"""
+    if created:
+        Question.objects.filter(pk=instance.question_id).update(
+            answers_count=F('answers_count') + 1,
+            last_activity_at=timezone.now()
+        )
+
+
+@receiver(post_delete, sender=Answer)
+def decrease_answers_count(sender, instance, **kwargs):
+    """답변 삭제 시 질문의 답변 수 갱신"""
+    Question.objects.filter(pk=instance.question_id, answers_count__gt=0).update(
+        answers_count=F('answers_count') - 1
+    )
+
+
+@receiver(post_save, sender=Question)
+def index_question_similarity(sender, instance, created, update_fields=None, **kwargs):
+    """질문 작성/수정 시 MinHash 시그니처와 LSH 버킷 갱신"""
+    if update_fields is not None and not {'title', 'content', 'video'} & set(update_fields):
+        return
+    transaction.on_commit(lambda: similarity.index_question(instance))
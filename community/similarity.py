@@ -0,0 +1,190 @@
+"""
+중복 질문 탐지 (MinHash + LSH)
+
+질문 제목/내용을 문자 3-gram 으로 쪼개 MinHash 시그니처(NUM_PERM 개)를 만들고,
+BANDS 개의 밴드로 나눈 해시를 QuestionBucket 에 영상 단위로 저장합니다.
+작성 전 유사 질문 조회는 같은 영상의 버킷 키 IN 조회 한 번으로 후보를 찾고,
+시그니처 일치 비율(추정 자카드 유사도)로 검증합니다. 질문을 스캔하지 않습니다.
+"""
+import hashlib
+import re
+import zlib
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+
+from .models import Question, QuestionSignature, QuestionBucket
+
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+_PRIME = np.uint64(4294967291)  # 2^32 보다 작은 가장 큰 소수
+_random = np.random.RandomState(20251022)
+_A = _random.randint(1, 2 ** 31, size=NUM_PERM).astype(np.uint64)
+_B = _random.randint(0, 2 ** 31, size=NUM_PERM).astype(np.uint64)
+_EMPTY = np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+
+_NON_WORD = re.compile(r'[^\w]+', re.UNICODE)
+
+
+def get_threshold():
+    return getattr(settings, 'QUESTION_DUPLICATE_THRESHOLD', 0.5)
+
+
+def shingles(text):
+    """공백/구두점을 정규화한 문자 3-gram 해시 집합"""
+    normalized = _NON_WORD.sub(' ', text.lower()).strip()
+    if len(normalized) < SHINGLE_SIZE:
+        return set()
+    return {
+        zlib.crc32(normalized[i:i + SHINGLE_SIZE].encode())
+        for i in range(len(normalized) - SHINGLE_SIZE + 1)
+    }
+
+
+def minhash(title, content):
+    """MinHash 시그니처 (uint32 NUM_PERM 개)"""
+    values = shingles(f'{title} {content}')
+    if not values:
+        return _EMPTY.copy()
+
+    x = np.fromiter(values, dtype=np.uint64, count=len(values))
+    # (a * x + b) mod p 를 (순열 x 슁글) 행렬로 계산한 뒤 슁글 축 최솟값
+    hashed = (np.outer(_A, x) + _B[:, None]) % _PRIME
+    return hashed.min(axis=1).astype(np.uint32)
+
+
+def bucket_keys(signature):
+    """밴드별 LSH 버킷 키 (밴드 번호 포함, signed 64bit)"""
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        digest = hashlib.blake2b(bytes([band]) + chunk, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, 'big', signed=True))
+    return keys
+
+
+def similarity(signature, other):
+    """추정 자카드 유사도 (시그니처 일치 비율)"""
+    return float(np.count_nonzero(signature == other)) / NUM_PERM
+
+
+def _load(raw):
+    return np.frombuffer(bytes(raw), dtype=np.uint32)
+
+
+def index_question(question):
+    """질문 시그니처/버킷 갱신 (질문 저장 시 호출)"""
+    signature = minhash(question.title, question.content)
+
+    with transaction.atomic():
+        QuestionSignature.objects.update_or_create(
+            question=question,
+            defaults={'video_id': question.video_id, 'minhash': signature.tobytes()}
+        )
+        QuestionBucket.objects.filter(question=question).delete()
+        if np.array_equal(signature, _EMPTY):
+            return
+        QuestionBucket.objects.bulk_create([
+            QuestionBucket(question=question, video_id=question.video_id, bucket_key=key)
+            for key in bucket_keys(signature)
+        ])
+
+
+def find_similar(video_id, title, content, limit=5, exclude_id=None):
+    """
+    같은 영상의 유사 질문 조회
+
+    Returns:
+        [(Question, 유사도), ...] 유사도 내림차순
+    """
+    signature = minhash(title, content)
+    if np.array_equal(signature, _EMPTY):
+        return []
+
+    candidate_ids = set(
+        QuestionBucket.objects.filter(
+            video_id=video_id, bucket_key__in=bucket_keys(signature)
+        ).values_list('question_id', flat=True)
+    )
+    candidate_ids.discard(exclude_id)
+    if not candidate_ids:
+        return []
+
+    threshold = get_threshold()
+    scored = []
+    for question_id, raw in QuestionSignature.objects.filter(
+        question_id__in=candidate_ids
+    ).values_list('question_id', 'minhash'):
+        score = similarity(signature, _load(raw))
+        if score >= threshold:
+            scored.append((question_id, score))
+
+    scored.sort(key=lambda item: -item[1])
+    scored = scored[:limit]
+
+    questions = Question.objects.in_bulk([question_id for question_id, _ in scored])
+    return [(questions[question_id], score) for question_id, score in scored if question_id in questions]
+
+
+def cluster_duplicates():
+    """
+    기존 중복 질문 묶기 (배치 작업)
+
+    같은 영상/버킷을 공유하는 질문 쌍을 시그니처로 검증한 뒤 union-find 로 묶고,
+    그룹 내 가장 오래된 질문을 cluster_root 로 기록합니다.
+    """
+    threshold = get_threshold()
+    parent = {}
+
+    def find(node):
+        while parent.setdefault(node, node) != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def union(a, b):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    buckets = {}
+    for video_id, bucket_key, question_id in QuestionBucket.objects.order_by(
+        'video_id', 'bucket_key'
+    ).values_list('video_id', 'bucket_key', 'question_id').iterator(chunk_size=5000):
+        buckets.setdefault((video_id, bucket_key), []).append(question_id)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2:
+            continue
+        members.sort()
+        for i, a in enumerate(members):
+            for b in members[i + 1:]:
+                pairs.add((a, b))
+
+    if pairs:
+        ids = {question_id for pair in pairs for question_id in pair}
+        signatures = {
+            question_id: _load(raw)
+            for question_id, raw in QuestionSignature.objects.filter(
+                question_id__in=ids
+            ).values_list('question_id', 'minhash')
+        }
+        for a, b in pairs:
+            if a in signatures and b in signatures and similarity(signatures[a], signatures[b]) >= threshold:
+                union(a, b)
+
+    groups = {}
+    for node in parent:
+        groups.setdefault(find(node), []).append(node)
+    groups = {root: members for root, members in groups.items() if len(members) > 1}
+
+    with transaction.atomic():
+        QuestionSignature.objects.update(cluster_root=None)
+        for root, members in groups.items():
+            QuestionSignature.objects.filter(question_id__in=members).update(cluster_root_id=root)
+    return len(groups)
@@ -2,17 +2,32 @@ from rest_framework import viewsets, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from rest_framework.exceptions import NotFound
+from django.db.models import F
+from rest_framework.utils.urls import replace_query_param
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import Question, Answer
+from . import ranking
+from .pagination import (
+    get_answer_page, encode_cursor, decode_cursor,
+    ANSWERS_PAGE_SIZE, MAX_ANSWERS_PAGE_SIZE
+)
 from .serializers import (
     QuestionListSerializer,
     QuestionDetailSerializer,
     QuestionCreateSerializer,
     AnswerSerializer,
-    AnswerCreateSerializer
+    AnswerCreateSerializer,
+    AnswerVoteSerializer,
+    SimilarQuestionQuerySerializer,
+    SimilarQuestionSerializer
 )
+from .similarity import find_similar
+from notifications import events as notification_events
+from analytics.viewers import record_view
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -27,7 +42,8 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
 class QuestionViewSet(viewsets.ModelViewSet):
     """질문 ViewSet"""
 
-    queryset = Question.objects.select_related('user', 'video', 'accepted_answer').prefetch_related('answers')
+    # 답변은 상세 Serializer 에서 첫 페이지만 키셋으로 조회
+    queryset = Question.objects.select_related('user', 'video', 'accepted_answer__user')
     serializer_class = QuestionDetailSerializer
     permission_classes = [permissions.IsAuthenticatedOrReadOnly, IsOwnerOrReadOnly]
     filter_backends = [DjangoFilterBackend]
@@ -43,15 +59,43 @@ class QuestionViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """queryset 최적화"""
-        queryset = super().get_queryset()
+        if self.action == 'list':
+            # 목록은 비정규화 컬럼과 영상 요약만 사용 (답변 prefetch/COUNT 없음)
+            queryset = Question.objects.select_related('user', 'video')
+        else:
+            queryset = super().get_queryset()
 
         # video_id 파라미터가 있으면 필터링
         video_id = self.request.query_params.get('video_id')
         if video_id:
             queryset = queryset.filter(video_id=video_id)
 
+        # 미답변 질문 최신순 (question_unanswered_idx 부분 인덱스)
+        if self.request.query_params.get('unanswered') in ('true', '1'):
+            queryset = queryset.filter(is_answered=False)
+
+        # 최근 활동순 (question_activity_idx)
+        if self.request.query_params.get('sort') == 'activity':
+            return queryset.order_by('-last_activity_at')
+
         return queryset.order_by('-created_at')
 
+    @extend_schema(
+        tags=['커뮤니티'],
+        summary='질문 목록',
+        description='질문 목록을 조회합니다. ?unanswered=true 로 미답변 질문만, ?sort=activity 로 최근 활동순 정렬이 가능합니다.',
+        parameters=[
+            OpenApiParameter('video_id', int, description='영상 ID'),
+            OpenApiParameter('unanswered', bool, description='미답변 질문만 조회'),
+            OpenApiParameter('sort', str, enum=['recent', 'activity'], description='정렬 (기본값: recent)'),
+        ],
+        responses={
+            200: OpenApiResponse(response=QuestionListSerializer(many=True))
+        }
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     @extend_schema(
         tags=['커뮤니티'],
         summary='질문 작성',
@@ -69,7 +113,7 @@ class QuestionViewSet(viewsets.ModelViewSet):
         question = serializer.save(user=request.user)
 
         return Response(
-            QuestionDetailSerializer(question).data,
+            QuestionDetailSerializer(question, context={'request': request}).data,
             status=status.HTTP_201_CREATED
         )
 
@@ -86,9 +130,10 @@ class QuestionViewSet(viewsets.ModelViewSet):
         """질문 조회 (조회수 증가)"""
         instance = self.get_object()
 
-        # 조회수 증가
+        # 조회수 증가 (F() 로 경쟁 없이) 및 고유 방문자 스케치 기록
+        Question.objects.filter(pk=instance.pk).update(views_count=F('views_count') + 1)
         instance.views_count += 1
-        instance.save(update_fields=['views_count'])
+        record_view('question', instance.pk, request)
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -145,16 +190,95 @@ class QuestionViewSet(viewsets.ModelViewSet):
 
         question.accepted_answer = answer
         question.is_answered = True
-        question.save()
+        question.last_activity_at = timezone.now()
+        question.save(update_fields=[
+            'accepted_answer', 'is_answered', 'last_activity_at', 'updated_at'
+        ])
+
+        # 답변 작성자에게 채택 알림
+        notification_events.answer_accepted(answer, request.user)
 
         return Response(
             {
                 'message': '답변이 채택되었습니다.',
-                'question': QuestionDetailSerializer(question).data
+                'question': QuestionDetailSerializer(question, context={'request': request}).data
             },
             status=status.HTTP_200_OK
         )
 
+    @extend_schema(
+        tags=['커뮤니티'],
+        summary='질문 답변 목록',
+        description='채택된 답변을 제외한 답변을 랭킹 순으로 커서 페이지네이션하여 조회합니다.',
+        parameters=[
+            OpenApiParameter('cursor', str, description='다음 페이지 커서'),
+            OpenApiParameter('page_size', int, description=f'페이지 크기 (최대 {MAX_ANSWERS_PAGE_SIZE})'),
+        ],
+        responses={
+            200: OpenApiResponse(response=AnswerSerializer(many=True)),
+            404: OpenApiResponse(description='질문을 찾을 수 없음 / 잘못된 커서')
+        }
+    )
+    @action(detail=True, methods=['get'])
+    def answers(self, request, pk=None):
+        """질문 답변 목록 (커서 페이지네이션)"""
+        question = get_object_or_404(Question.objects.only('id'), pk=pk)
+
+        position = None
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                position = decode_cursor(cursor)
+            except ValueError:
+                raise NotFound('잘못된 커서입니다.')
+
+        try:
+            page_size = int(request.query_params.get('page_size', ANSWERS_PAGE_SIZE))
+        except ValueError:
+            page_size = ANSWERS_PAGE_SIZE
+        page_size = max(1, min(page_size, MAX_ANSWERS_PAGE_SIZE))
+
+        answers, next_position = get_answer_page(question.id, position, page_size)
+
+        next_link = None
+        if next_position:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), 'cursor', encode_cursor(next_position)
+            )
+
+        return Response({
+            'next': next_link,
+            'results': AnswerSerializer(answers, many=True, context={'request': request}).data
+        })
+
+    @extend_schema(
+        tags=['커뮤니티'],
+        summary='유사 질문 조회',
+        description='질문 작성 전, 같은 영상에 올라온 비슷한 질문을 MinHash/LSH 색인으로 찾아 반환합니다.',
+        request=SimilarQuestionQuerySerializer,
+        responses={
+            200: OpenApiResponse(response=SimilarQuestionSerializer(many=True)),
+            400: OpenApiResponse(description='잘못된 요청')
+        }
+    )
+    @action(detail=False, methods=['post'], permission_classes=[permissions.AllowAny])
+    def similar(self, request):
+        """작성 전 유사 질문 조회"""
+        query = SimilarQuestionQuerySerializer(data=request.data)
+        query.is_valid(raise_exception=True)
+
+        video = query.validated_data.get('video')
+        results = []
+        for question, score in find_similar(
+            video.id if video else None,
+            query.validated_data['title'],
+            query.validated_data['content']
+        ):
+            question.similarity = round(score, 2)
+            results.append(question)
+
+        return Response(SimilarQuestionSerializer(results, many=True).data)
+
 
 class AnswerViewSet(viewsets.ModelViewSet):
     """답변 ViewSet"""
@@ -180,7 +304,7 @@ class AnswerViewSet(viewsets.ModelViewSet):
         if question_id:
             queryset = queryset.filter(question_id=question_id)
 
-        return queryset.order_by('-is_accepted', 'created_at')
+        return queryset.order_by('-is_accepted', '-rank', 'created_at')
 
     @extend_schema(
         tags=['커뮤니티'],
@@ -198,7 +322,49 @@ class AnswerViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         answer = serializer.save(user=request.user)
 
+        # 질문 작성자에게 답변 알림
+        notification_events.question_answered(answer)
+
         return Response(
-            AnswerSerializer(answer).data,
+            AnswerSerializer(answer, context={'request': request}).data,
             status=status.HTTP_201_CREATED
         )
+
+    @extend_schema(
+        tags=['커뮤니티'],
+        summary='답변 추천/비추천',
+        description='답변에 추천(1) 또는 비추천(-1)을 합니다. DELETE 로 투표를 취소합니다.',
+        request=AnswerVoteSerializer,
+        responses={
+            200: OpenApiResponse(response=AnswerSerializer, description='투표 반영 성공'),
+            400: OpenApiResponse(description='잘못된 요청'),
+            404: OpenApiResponse(description='투표 기록을 찾을 수 없음')
+        }
+    )
+    @action(detail=True, methods=['post', 'delete'], permission_classes=[permissions.IsAuthenticated])
+    def vote(self, request, pk=None):
+        """답변 추천/비추천 (DELETE: 취소)"""
+        answer = self.get_object()
+
+        if request.method == 'DELETE':
+            if ranking.unvote(request.user, answer) is None:
+                return Response(
+                    {'error': '투표 기록을 찾을 수 없습니다.'},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+        else:
+            if answer.user_id == request.user.id:
+                return Response(
+                    {'error': '자신의 답변에는 투표할 수 없습니다.'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            serializer = AnswerVoteSerializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            ranking.vote(request.user, answer, serializer.validated_data['value'])
+
+        answer.refresh_from_db()
+        return Response(
+            AnswerSerializer(answer, context={'request': request}).data,
+            status=status.HTTP_200_OK
+        )
@@ -60,6 +60,7 @@ INSTALLED_APPS = [
     'social',
     'community',
     'analytics',
+    'notifications',
 ]
 
 MIDDLEWARE = [
@@ -69,6 +70,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'accounts.middleware.RelationshipMiddleware',  # 응답 내 사용자 관계 상태 일괄 조회
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -105,6 +107,16 @@ DATABASES = {
 }
 
 
+# Cache
+# 여러 워커 프로세스가 버전 스탬프 등을 공유하려면 운영 환경에서는 Redis/Memcached 등 공유 캐시를 지정하세요.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'studytube'),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
 
@@ -157,7 +169,7 @@ AUTH_USER_MODEL = 'accounts.User'
 # Django REST Framework
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'accounts.authentication.CachedJWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticatedOrReadOnly',
@@ -178,13 +190,15 @@ SIMPLE_JWT = {
     'REFRESH_TOKEN_LIFETIME': timedelta(days=int(os.getenv('JWT_REFRESH_TOKEN_LIFETIME', 7))),
     'ROTATE_REFRESH_TOKENS': True,
     'BLACKLIST_AFTER_ROTATION': True,
-    'UPDATE_LAST_LOGIN': True,
+    # last_login 은 accounts.last_login 에서 모아서 저장
+    'UPDATE_LAST_LOGIN': False,
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'AUTH_HEADER_TYPES': ('Bearer',),
     'AUTH_HEADER_NAME': 'HTTP_AUTHORIZATION',
     'USER_ID_FIELD': 'id',
     'USER_ID_CLAIM': 'user_id',
+    'TOKEN_REFRESH_SERIALIZER': 'accounts.serializers.CustomTokenRefreshSerializer',
 }
 
 # DRF Spectacular (Swagger/OpenAPI)
@@ -207,3 +221,63 @@ CORS_ALLOW_CREDENTIALS = True
 MAX_VIDEO_SIZE = int(os.getenv('MAX_VIDEO_SIZE', 500)) * 1024 * 1024  # MB to Bytes
 MAX_IMAGE_SIZE = int(os.getenv('MAX_IMAGE_SIZE', 5)) * 1024 * 1024  # MB to Bytes
 DATA_UPLOAD_MAX_MEMORY_SIZE = MAX_VIDEO_SIZE
+
+# Home Feed (팔로우 강사 새 영상 타임라인)
+# 팔로워 수가 임계값 이하인 강사의 영상만 팔로워 타임라인에 미리 기록(fan-out on write)하고,
+# 그보다 큰 강사의 영상은 조회 시점에 병합합니다.
+FEED_FANOUT_MAX_FOLLOWERS = int(os.getenv('FEED_FANOUT_MAX_FOLLOWERS', 5000))
+FEED_MAX_LENGTH = int(os.getenv('FEED_MAX_LENGTH', 500))
+
+# Follow Suggestions (친구의 친구 추천, 사용자별 상위 K명)
+FOLLOW_SUGGESTIONS_TOP_K = int(os.getenv('FOLLOW_SUGGESTIONS_TOP_K', 20))
+
+# Notifications (알림 큐 배치 크기, 다이제스트 묶음 구간)
+NOTIFICATION_BATCH_SIZE = int(os.getenv('NOTIFICATION_BATCH_SIZE', 500))
+NOTIFICATION_DIGEST_WINDOW_MINUTES = int(os.getenv('NOTIFICATION_DIGEST_WINDOW_MINUTES', 60))
+
+# Duplicate Questions (MinHash 추정 유사도 기준값)
+QUESTION_DUPLICATE_THRESHOLD = float(os.getenv('QUESTION_DUPLICATE_THRESHOLD', 0.5))
+
+# Unique Viewers (프로세스 메모리 HyperLogLog 스케치를 DB에 병합하는 주기, 초)
+VIEW_SKETCH_FLUSH_SECONDS = int(os.getenv('VIEW_SKETCH_FLUSH_SECONDS', 30))
+# 비로그인 방문자 IP 판별 시 신뢰하는 앞단 프록시 수 (0 이면 X-Forwarded-For 무시, REMOTE_ADDR 사용)
+VIEW_TRUSTED_PROXY_COUNT = int(os.getenv('VIEW_TRUSTED_PROXY_COUNT', 0))
+
+# JWT Authentication (인증된 요청의 사용자 캐시 TTL, 초)
+AUTH_USER_CACHE_SECONDS = int(os.getenv('AUTH_USER_CACHE_SECONDS', 60))
+
+# Password Hashing (로그인/회원가입 비밀번호 해싱 프로세스 풀, 0 이면 요청 스레드에서 실행)
+AUTHENTICATION_BACKENDS = ['accounts.backends.PooledPasswordBackend']
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', 2))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', 8))
+PASSWORD_HASH_TIMEOUT_SECONDS = int(os.getenv('PASSWORD_HASH_TIMEOUT_SECONDS', 10))
+
+# Last Login (토큰 발급 시 last_login 쓰기 병합 주기, 같은 사용자 재기록 최소 간격, 초)
+LAST_LOGIN_FLUSH_SECONDS = int(os.getenv('LAST_LOGIN_FLUSH_SECONDS', 5))
+LAST_LOGIN_GRANULARITY_SECONDS = int(os.getenv('LAST_LOGIN_GRANULARITY_SECONDS', 300))
+
+# User Import (API 로 받는 일괄 가입 파일의 최대 크기/행 수, 넘으면 import_users 명령 사용)
+# 요청 안에서 해싱하므로 행 수 x 해싱 시간(약 0.3초) / PASSWORD_HASH_WORKERS 가 요청 제한 시간 안에 들어오도록
+USER_IMPORT_MAX_BYTES = int(os.getenv('USER_IMPORT_MAX_BYTES', 64 * 1024))
+USER_IMPORT_MAX_ROWS = int(os.getenv('USER_IMPORT_MAX_ROWS', 100))
+
+# Public Profile (공개 프로필 캐시 TTL, 초 - 조회수 등 자주 바뀌는 값의 최대 반영 지연)
+PROFILE_CACHE_SECONDS = int(os.getenv('PROFILE_CACHE_SECONDS', 60))
+
+# Playback Events (재생 이벤트 WAL 디렉터리, 세그먼트 봉인 크기/주기, 요청당 최대 이벤트 수)
+ANALYTICS_WAL_DIR = BASE_DIR / os.getenv('ANALYTICS_WAL_DIR', 'var/analytics_wal')
+ANALYTICS_WAL_SEGMENT_BYTES = int(os.getenv('ANALYTICS_WAL_SEGMENT_BYTES', 4 * 1024 * 1024))
+ANALYTICS_WAL_SEGMENT_SECONDS = int(os.getenv('ANALYTICS_WAL_SEGMENT_SECONDS', 30))
+ANALYTICS_MAX_BATCH_EVENTS = int(os.getenv('ANALYTICS_MAX_BATCH_EVENTS', 500))
+
+# Video Stats Rollups (영상 기간 집계 증분을 DB 에 더하는 주기, 초)
+ANALYTICS_ROLLUP_FLUSH_SECONDS = int(os.getenv('ANALYTICS_ROLLUP_FLUSH_SECONDS', 10))
+
+# Instructor Dashboard (강사 대시보드 캐시 TTL, 초)
+ANALYTICS_DASHBOARD_CACHE_SECONDS = int(os.getenv('ANALYTICS_DASHBOARD_CACHE_SECONDS', 60))
+
+# Taxonomy Snapshot (카테고리/태그 스냅샷 최대 보관 시간, 초 - 영상 수의 최대 반영 지연)
+TAXONOMY_SNAPSHOT_MAX_AGE_SECONDS = int(os.getenv('TAXONOMY_SNAPSHOT_MAX_AGE_SECONDS', 60))
+
+# Catalog Facets (패싯 인덱스 최대 보관 시간, 초 - 다른 프로세스 변경의 최대 반영 지연)
+FACET_INDEX_MAX_AGE_SECONDS = int(os.getenv('FACET_INDEX_MAX_AGE_SECONDS', 60))
@@ -27,7 +27,8 @@ urlpatterns = [
     path('api/social/', include('social.urls')),
     path('api/qna/', include('community.urls')),
     path('api/', include('categories.urls')),
-    # path('api/analytics/', include('analytics.urls')),
+    path('api/notifications/', include('notifications.urls')),
+    path('api/analytics/', include('analytics.urls')),
 
     # 테스트 페이지
     path('test-video/', TemplateView.as_view(template_name='video_test.html'), name='video_test'),
@@ -0,0 +1,32 @@
+from django.contrib import admin
+from .models import NotificationEvent, Notification, NotificationCounter
+
+
+@admin.register(NotificationEvent)
+class NotificationEventAdmin(admin.ModelAdmin):
+    """알림 이벤트 큐 Admin"""
+
+    list_display = ['verb', 'actor', 'recipient', 'target_type', 'target_id', 'created_at']
+    list_filter = ['verb']
+    raw_id_fields = ['actor', 'recipient']
+    readonly_fields = ['created_at']
+
+
+@admin.register(Notification)
+class NotificationAdmin(admin.ModelAdmin):
+    """알림 Admin"""
+
+    list_display = ['recipient', 'verb', 'actor', 'target_type', 'target_id', 'count', 'is_read', 'updated_at']
+    list_filter = ['verb', 'is_read']
+    search_fields = ['recipient__username', 'actor__username']
+    raw_id_fields = ['recipient', 'actor']
+    readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(NotificationCounter)
+class NotificationCounterAdmin(admin.ModelAdmin):
+    """알림 카운터 Admin"""
+
+    list_display = ['user', 'unread_count']
+    search_fields = ['user__username']
+    raw_id_fields = ['user']
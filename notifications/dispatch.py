@@ -0,0 +1,182 @@
+"""
+알림 팬아웃 워커
+
+NotificationEvent 큐를 id 순으로 배치 단위로 읽어
+- 수신자가 없는 이벤트(새 영상)는 행위자의 팔로워 전체로 펼치고,
+- (수신자, 종류, 대상) 이 같고 다이제스트 구간 안에 있는 읽지 않은 알림이 있으면
+  count 를 늘리고, 없으면 새 알림을 bulk_create 로 생성한 뒤,
+- 새로 생긴 알림 수만큼 NotificationCounter 를 증가시키고 처리한 이벤트를 삭제합니다.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from social.models import Follow
+from .models import NotificationEvent, Notification, NotificationCounter
+
+BULK_BATCH_SIZE = 1000
+
+
+def get_batch_size():
+    return getattr(settings, 'NOTIFICATION_BATCH_SIZE', 500)
+
+
+def get_digest_window():
+    return timedelta(minutes=getattr(settings, 'NOTIFICATION_DIGEST_WINDOW_MINUTES', 60))
+
+
+def _chunks(values, chunk_size):
+    """IN 쿼리용 청크 (팔로워 전체로 펼친 수신자 목록이 DB 변수 한도를 넘지 않도록)"""
+    values = list(values)
+    for start in range(0, len(values), chunk_size):
+        yield values[start:start + chunk_size]
+
+
+def _expand(events):
+    """이벤트를 (수신자, 종류, 대상종류, 대상ID) 별 [건수, 마지막 행위자] 로 집계"""
+    fanout_actor_ids = {event.actor_id for event in events if event.recipient_id is None}
+    followers_by_actor = defaultdict(list)
+    if fanout_actor_ids:
+        for following_id, follower_id in Follow.objects.filter(
+            following_id__in=fanout_actor_ids
+        ).values_list('following_id', 'follower_id'):
+            followers_by_actor[following_id].append(follower_id)
+
+    deliveries = {}
+    for event in events:
+        if event.recipient_id is not None:
+            recipient_ids = [event.recipient_id]
+        else:
+            recipient_ids = followers_by_actor.get(event.actor_id, [])
+
+        for recipient_id in recipient_ids:
+            key = (recipient_id, event.verb, event.target_type, event.target_id)
+            delivery = deliveries.setdefault(key, [0, event.actor_id])
+            delivery[0] += 1
+            delivery[1] = event.actor_id
+    return deliveries
+
+
+def _increment_counters(new_counts):
+    """수신자별 읽지 않은 알림 카운터 증가 (증가량이 같은 사용자끼리 한 번에 UPDATE)"""
+    if not new_counts:
+        return
+
+    NotificationCounter.objects.bulk_create(
+        [NotificationCounter(user_id=user_id) for user_id in new_counts],
+        ignore_conflicts=True,
+        batch_size=BULK_BATCH_SIZE
+    )
+
+    users_by_increment = defaultdict(list)
+    for user_id, increment in new_counts.items():
+        users_by_increment[increment].append(user_id)
+
+    chunk_size = get_batch_size()
+    for increment, user_ids in users_by_increment.items():
+        for chunk in _chunks(user_ids, chunk_size):
+            NotificationCounter.objects.filter(user_id__in=chunk).update(
+                unread_count=F('unread_count') + increment
+            )
+
+
+def process_batch(batch_size=None):
+    """이벤트 한 배치를 처리하고 처리한 이벤트 수를 반환"""
+    batch_size = batch_size or get_batch_size()
+
+    with transaction.atomic():
+        events = NotificationEvent.objects.order_by('id')
+        if connection.features.has_select_for_update_skip_locked:
+            events = events.select_for_update(skip_locked=True)
+        events = list(events[:batch_size])
+        if not events:
+            return 0
+
+        deliveries = _expand(events)
+        now = timezone.now()
+
+        # 다이제스트 구간 안의 읽지 않은 알림 조회
+        open_digests = {}
+        if deliveries:
+            recipient_ids = sorted({key[0] for key in deliveries})
+            for chunk in _chunks(recipient_ids, batch_size):
+                for notification in Notification.objects.filter(
+                    recipient_id__in=chunk,
+                    is_read=False,
+                    updated_at__gte=now - get_digest_window()
+                ).order_by('updated_at'):
+                    key = (
+                        notification.recipient_id, notification.verb,
+                        notification.target_type, notification.target_id
+                    )
+                    open_digests[key] = notification
+
+        to_update, to_create = [], []
+        new_counts = defaultdict(int)
+        for key, (count, actor_id) in deliveries.items():
+            notification = open_digests.get(key)
+            if notification is not None:
+                notification.count += count
+                notification.actor_id = actor_id
+                notification.updated_at = now
+                to_update.append(notification)
+            else:
+                recipient_id, verb, target_type, target_id = key
+                to_create.append(Notification(
+                    recipient_id=recipient_id,
+                    verb=verb,
+                    actor_id=actor_id,
+                    target_type=target_type,
+                    target_id=target_id,
+                    count=count
+                ))
+                new_counts[recipient_id] += 1
+
+        Notification.objects.bulk_update(
+            to_update, ['count', 'actor', 'updated_at'], batch_size=BULK_BATCH_SIZE
+        )
+        Notification.objects.bulk_create(to_create, batch_size=BULK_BATCH_SIZE)
+        _increment_counters(new_counts)
+
+        NotificationEvent.objects.filter(id__in=[event.id for event in events]).delete()
+
+    return len(events)
+
+
+def process_pending(batch_size=None):
+    """큐가 빌 때까지 배치 처리"""
+    total = 0
+    while True:
+        processed = process_batch(batch_size)
+        if not processed:
+            return total
+        total += processed
+
+
+def get_unread_count(user):
+    """읽지 않은 알림 수 (카운터 한 행 조회)"""
+    return NotificationCounter.objects.filter(user=user).values_list(
+        'unread_count', flat=True
+    ).first() or 0
+
+
+def mark_read(user, notification_ids=None):
+    """알림 읽음 처리 (ids 가 없으면 전체)"""
+    with transaction.atomic():
+        unread = Notification.objects.filter(recipient=user, is_read=False)
+        if notification_ids is not None:
+            unread = unread.filter(id__in=notification_ids)
+            updated = unread.update(is_read=True)
+            if updated:
+                NotificationCounter.objects.filter(user=user).update(
+                    unread_count=Greatest(F('unread_count') - updated, Value(0))
+                )
+        else:
+            updated = unread.update(is_read=True)
+            NotificationCounter.objects.filter(user=user).update(unread_count=0)
+    return updated
@@ -0,0 +1,41 @@
+"""
+알림 이벤트 기록
+
+요청 경로에서는 NotificationEvent 한 줄만 INSERT 하고 즉시 반환합니다.
+수신자 팬아웃과 다이제스트 병합은 notifications.dispatch 에서 배치로 처리합니다.
+"""
+from .models import NotificationEvent
+
+
+def record(verb, actor, target_type, target_id, recipient=None):
+    """알림 이벤트 기록 (본인에게 가는 알림은 기록하지 않음)"""
+    if recipient is not None and recipient.pk == actor.pk:
+        return None
+
+    return NotificationEvent.objects.create(
+        verb=verb,
+        actor=actor,
+        recipient=recipient,
+        target_type=target_type,
+        target_id=target_id
+    )
+
+
+def comment_replied(reply):
+    """내 댓글에 답글이 달림"""
+    return record('comment_reply', reply.user, 'comment', reply.parent_id, reply.parent.user)
+
+
+def question_answered(answer):
+    """내 질문에 답변이 달림"""
+    return record('question_answer', answer.user, 'question', answer.question_id, answer.question.user)
+
+
+def answer_accepted(answer, accepted_by):
+    """내 답변이 채택됨"""
+    return record('answer_accepted', accepted_by, 'answer', answer.id, answer.user)
+
+
+def video_uploaded(video):
+    """팔로우한 강사가 새 영상을 올림 (워커에서 팔로워에게 팬아웃, 강사 단위로 묶음)"""
+    return record('new_video', video.instructor, 'user', video.instructor_id)
@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from notifications.dispatch import process_pending
+
+
+class Command(BaseCommand):
+    help = '알림 이벤트 큐를 배치로 팬아웃합니다. --loop 옵션으로 백그라운드 워커로 실행할 수 있습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=None,
+            help='배치당 처리할 이벤트 수 (기본값: settings.NOTIFICATION_BATCH_SIZE)'
+        )
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='종료하지 않고 주기적으로 큐를 처리합니다.'
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=2.0,
+            help='--loop 실행 시 큐 확인 간격 (초)'
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            processed = process_pending(options['batch_size'])
+            if processed:
+                self.stdout.write(f'알림 이벤트 {processed}개를 처리했습니다.')
+
+            if not options['loop']:
+                break
+            time.sleep(options['interval'])
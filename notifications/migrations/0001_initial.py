@@ -0,0 +1,67 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='notification_counter', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('unread_count', models.PositiveIntegerField(default=0, verbose_name='읽지 않은 알림 수')),
+            ],
+            options={
+                'verbose_name': '알림 카운터',
+                'verbose_name_plural': '알림 카운터 목록',
+            },
+        ),
+        migrations.CreateModel(
+            name='NotificationEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('comment_reply', '댓글 답글'), ('question_answer', '질문 답변'), ('answer_accepted', '답변 채택'), ('new_video', '새 영상')], max_length=30, verbose_name='종류')),
+                ('target_type', models.CharField(choices=[('comment', '댓글'), ('question', '질문'), ('answer', '답변'), ('video', '영상'), ('user', '사용자')], max_length=20, verbose_name='대상 종류')),
+                ('target_id', models.PositiveBigIntegerField(verbose_name='대상 ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('actor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='행위자')),
+                ('recipient', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='수신자')),
+            ],
+            options={
+                'verbose_name': '알림 이벤트',
+                'verbose_name_plural': '알림 이벤트 큐',
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Notification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('verb', models.CharField(choices=[('comment_reply', '댓글 답글'), ('question_answer', '질문 답변'), ('answer_accepted', '답변 채택'), ('new_video', '새 영상')], max_length=30, verbose_name='종류')),
+                ('target_type', models.CharField(choices=[('comment', '댓글'), ('question', '질문'), ('answer', '답변'), ('video', '영상'), ('user', '사용자')], max_length=20, verbose_name='대상 종류')),
+                ('target_id', models.PositiveBigIntegerField(verbose_name='대상 ID')),
+                ('count', models.PositiveIntegerField(default=1, verbose_name='묶인 이벤트 수')),
+                ('is_read', models.BooleanField(default=False, verbose_name='읽음 여부')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('actor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='마지막 행위자')),
+                ('recipient', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to=settings.AUTH_USER_MODEL, verbose_name='수신자')),
+            ],
+            options={
+                'verbose_name': '알림',
+                'verbose_name_plural': '알림 목록',
+                'ordering': ['-updated_at'],
+                'indexes': [models.Index(fields=['recipient', '-updated_at'], name='notificatio_recipie_44bca6_idx'), models.Index(fields=['recipient', 'verb', 'target_type', 'target_id', 'is_read'], name='notificatio_recipie_54ce87_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,140 @@
+from django.db import models
+from django.conf import settings
+
+
+VERB_CHOICES = (
+    ('comment_reply', '댓글 답글'),
+    ('question_answer', '질문 답변'),
+    ('answer_accepted', '답변 채택'),
+    ('new_video', '새 영상'),
+)
+
+TARGET_TYPE_CHOICES = (
+    ('comment', '댓글'),
+    ('question', '질문'),
+    ('answer', '답변'),
+    ('video', '영상'),
+    ('user', '사용자'),
+)
+
+
+class NotificationEvent(models.Model):
+    """
+    알림 이벤트 큐 (append-only)
+
+    요청 처리 중에는 이벤트 한 줄만 기록하고, 팬아웃/다이제스트 처리는
+    process_notifications 워커가 배치로 수행한 뒤 처리한 이벤트를 삭제합니다.
+    recipient 가 비어 있으면 actor 의 팔로워 전체에게 팬아웃합니다. (새 영상)
+    """
+
+    verb = models.CharField(
+        max_length=30,
+        choices=VERB_CHOICES,
+        verbose_name='종류'
+    )
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='+',
+        verbose_name='수신자'
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='행위자'
+    )
+    target_type = models.CharField(
+        max_length=20,
+        choices=TARGET_TYPE_CHOICES,
+        verbose_name='대상 종류'
+    )
+    target_id = models.PositiveBigIntegerField(
+        verbose_name='대상 ID'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = '알림 이벤트'
+        verbose_name_plural = '알림 이벤트 큐'
+        ordering = ['id']
+
+    def __str__(self):
+        return f"{self.get_verb_display()} ({self.target_type}:{self.target_id})"
+
+
+class Notification(models.Model):
+    """사용자 알림 (같은 대상/시간 구간의 이벤트는 하나의 다이제스트로 묶음)"""
+
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notifications',
+        verbose_name='수신자'
+    )
+    verb = models.CharField(
+        max_length=30,
+        choices=VERB_CHOICES,
+        verbose_name='종류'
+    )
+    actor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='마지막 행위자'
+    )
+    target_type = models.CharField(
+        max_length=20,
+        choices=TARGET_TYPE_CHOICES,
+        verbose_name='대상 종류'
+    )
+    target_id = models.PositiveBigIntegerField(
+        verbose_name='대상 ID'
+    )
+    count = models.PositiveIntegerField(
+        default=1,
+        verbose_name='묶인 이벤트 수'
+    )
+    is_read = models.BooleanField(
+        default=False,
+        verbose_name='읽음 여부'
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '알림'
+        verbose_name_plural = '알림 목록'
+        ordering = ['-updated_at']
+        indexes = [
+            models.Index(fields=['recipient', '-updated_at']),
+            models.Index(fields=['recipient', 'verb', 'target_type', 'target_id', 'is_read']),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient_id}: {self.get_verb_display()} x{self.count}"
+
+
+class NotificationCounter(models.Model):
+    """읽지 않은 알림 수 (O(1) 조회용 비정규화 카운터)"""
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='notification_counter',
+        verbose_name='사용자'
+    )
+    unread_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='읽지 않은 알림 수'
+    )
+
+    class Meta:
+        verbose_name = '알림 카운터'
+        verbose_name_plural = '알림 카운터 목록'
+
+    def __str__(self):
+        return f"{self.user_id}: {self.unread_count}"
@@ -0,0 +1,37 @@
+from rest_framework import serializers
+from .models import Notification
+
+
+class NotificationSerializer(serializers.ModelSerializer):
+    """알림 Serializer"""
+
+    actor_username = serializers.CharField(source='actor.username', read_only=True)
+    message = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Notification
+        fields = [
+            'id', 'verb', 'actor', 'actor_username',
+            'target_type', 'target_id', 'count', 'message',
+            'is_read', 'created_at', 'updated_at'
+        ]
+        read_only_fields = fields
+
+    def get_message(self, obj):
+        """알림 문구 (여러 건이 묶인 경우 다이제스트 문구)"""
+        actor = obj.actor.username
+        if obj.verb == 'comment_reply':
+            if obj.count > 1:
+                return f'내 댓글에 새 답글 {obj.count}개가 달렸습니다.'
+            return f'{actor}님이 내 댓글에 답글을 남겼습니다.'
+        if obj.verb == 'question_answer':
+            if obj.count > 1:
+                return f'내 질문에 새 답변 {obj.count}개가 달렸습니다.'
+            return f'{actor}님이 내 질문에 답변했습니다.'
+        if obj.verb == 'answer_accepted':
+            return f'{actor}님이 내 답변을 채택했습니다.'
+        if obj.verb == 'new_video':
+            if obj.count > 1:
+                return f'{actor}님이 새 영상 {obj.count}개를 올렸습니다.'
+            return f'{actor}님이 새 영상을 올렸습니다.'
+        return obj.get_verb_display()
@@ -0,0 +1,13 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from videos.models import Video
+from . import events
+
+
+@receiver(post_save, sender=Video)
+def notify_new_video(sender, instance, created, **kwargs):
+    """공개 영상 업로드 시 팔로워 알림 이벤트 기록"""
+    if created and instance.is_public:
+        transaction.on_commit(lambda: events.video_uploaded(instance))
@@ -0,0 +1,85 @@
+from rest_framework import viewsets, permissions, status, mixins
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from drf_spectacular.utils import extend_schema, OpenApiResponse
+
+from .models import Notification
+from .serializers import NotificationSerializer
+from . import dispatch
+
+
+class NotificationViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
+    """알림 ViewSet"""
+
+    serializer_class = NotificationSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    filter_backends = []
+
+    def get_queryset(self):
+        """내 알림 (최근 갱신순)"""
+        return Notification.objects.filter(
+            recipient=self.request.user
+        ).select_related('actor').order_by('-updated_at')
+
+    @extend_schema(
+        tags=['알림'],
+        summary='알림 목록',
+        description='내 알림을 최근 갱신순으로 조회합니다. 같은 대상의 알림은 다이제스트로 묶입니다.',
+        responses={
+            200: OpenApiResponse(response=NotificationSerializer(many=True)),
+            401: OpenApiResponse(description='인증되지 않음')
+        }
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
+    @extend_schema(
+        tags=['알림'],
+        summary='읽지 않은 알림 수',
+        responses={
+            200: OpenApiResponse(description='읽지 않은 알림 수'),
+            401: OpenApiResponse(description='인증되지 않음')
+        }
+    )
+    @action(detail=False, methods=['get'])
+    def unread_count(self, request):
+        """읽지 않은 알림 수"""
+        return Response({'unread_count': dispatch.get_unread_count(request.user)})
+
+    @extend_schema(
+        tags=['알림'],
+        summary='알림 읽음 처리',
+        request=None,
+        responses={
+            200: OpenApiResponse(description='읽음 처리 성공'),
+            404: OpenApiResponse(description='알림을 찾을 수 없음')
+        }
+    )
+    @action(detail=True, methods=['post'])
+    def read(self, request, pk=None):
+        """알림 읽음 처리"""
+        notification = self.get_object()
+        dispatch.mark_read(request.user, [notification.id])
+
+        return Response(
+            {'unread_count': dispatch.get_unread_count(request.user)},
+            status=status.HTTP_200_OK
+        )
+
+    @extend_schema(
+        tags=['알림'],
+        summary='모든 알림 읽음 처리',
+        request=None,
+        responses={
+            200: OpenApiResponse(description='읽음 처리 성공')
+        }
+    )
+    @action(detail=False, methods=['post'])
+    def read_all(self, request):
+        """모든 알림 읽음 처리"""
+        updated = dispatch.mark_read(request.user)
+
+        return Response(
+            {'message': f'알림 {updated}개를 읽음 처리했습니다.', 'unread_count': 0},
+            status=status.HTTP_200_OK
+        )
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import VideoRating, Comment, Follow
+from .models import VideoRating, Comment, Follow, TimelineEntry, FollowSuggestion
 
 
 @admin.register(VideoRating)
@@ -36,3 +36,22 @@ class FollowAdmin(admin.ModelAdmin):
     list_filter = ['created_at']
     search_fields = ['follower__username', 'following__username']
     readonly_fields = ['created_at']
+
+
+@admin.register(TimelineEntry)
+class TimelineEntryAdmin(admin.ModelAdmin):
+    """타임라인 항목 Admin"""
+
+    list_display = ['user', 'video', 'instructor', 'created_at']
+    search_fields = ['user__username', 'video__title']
+    raw_id_fields = ['user', 'video', 'instructor']
+
+
+@admin.register(FollowSuggestion)
+class FollowSuggestionAdmin(admin.ModelAdmin):
+    """팔로우 추천 Admin"""
+
+    list_display = ['user', 'suggested_user', 'score', 'updated_at']
+    search_fields = ['user__username', 'suggested_user__username']
+    raw_id_fields = ['user', 'suggested_user']
+    readonly_fields = ['updated_at']
@@ -0,0 +1,228 @@
+"""
+홈 피드 (팔로우한 강사의 새 영상)
+
+하이브리드 fan-out:
+- 팔로워 수가 FEED_FANOUT_MAX_FOLLOWERS 이하인 강사의 영상은 업로드 시점에
+  팔로워별 TimelineEntry 로 미리 기록합니다 (fan-out on write).
+- 그보다 팔로워가 많은 강사의 영상은 조회 시점에 (instructor, -created_at)
+  인덱스로 읽어와 타임라인과 병합합니다 (fan-in on read).
+"""
+import base64
+import binascii
+import heapq
+from itertools import islice
+
+from django.conf import settings
+from django.db.models import Count, Q
+from django.utils.dateparse import parse_datetime
+
+from videos.models import Video
+from .models import Follow, TimelineEntry
+
+FANOUT_BATCH_SIZE = 1000
+BACKFILL_SIZE = 20
+
+
+def get_fanout_threshold():
+    return getattr(settings, 'FEED_FANOUT_MAX_FOLLOWERS', 5000)
+
+
+def get_max_length():
+    return getattr(settings, 'FEED_MAX_LENGTH', 500)
+
+
+def is_fanout_instructor(instructor):
+    """업로드 시점에 fan-out 하는 강사인지 여부"""
+    return instructor.followers_count <= get_fanout_threshold()
+
+
+def _fan_out(instructor_id, videos):
+    """[(영상 id, created_at)] 를 강사의 모든 팔로워 타임라인에 기록 (한 번에 FANOUT_BATCH_SIZE 행)"""
+    follower_ids = Follow.objects.filter(
+        following_id=instructor_id
+    ).values_list('follower_id', flat=True).iterator(chunk_size=FANOUT_BATCH_SIZE)
+    followers_per_batch = max(1, FANOUT_BATCH_SIZE // len(videos))
+
+    created = 0
+    while True:
+        batch = list(islice(follower_ids, followers_per_batch))
+        if not batch:
+            break
+        TimelineEntry.objects.bulk_create(
+            [
+                TimelineEntry(
+                    user_id=follower_id,
+                    video_id=video_id,
+                    instructor_id=instructor_id,
+                    created_at=created_at
+                )
+                for follower_id in batch
+                for video_id, created_at in videos
+            ],
+            ignore_conflicts=True
+        )
+        created += len(batch) * len(videos)
+    return created
+
+
+def fan_out_video(video):
+    """새로 공개된 영상을 팔로워 타임라인에 기록"""
+    if not video.is_public or not is_fanout_instructor(video.instructor):
+        return 0
+    return _fan_out(video.instructor_id, [(video.id, video.created_at)])
+
+
+def backfill_followers(instructor):
+    """
+    fan-in 에서 fan-out 으로 바뀐 강사의 최근 영상을 모든 팔로워 타임라인에 채움
+
+    팔로워가 FEED_FANOUT_MAX_FOLLOWERS 이하로 줄면 조회 시점 병합 대상에서 빠지므로,
+    그동안 타임라인에 기록되지 않은 최근 영상을 미리 기록합니다.
+    """
+    if not is_fanout_instructor(instructor):
+        return 0
+
+    videos = list(
+        Video.objects.filter(
+            instructor=instructor, is_public=True
+        ).order_by('-created_at').values_list('id', 'created_at')[:BACKFILL_SIZE]
+    )
+    if not videos:
+        return 0
+    return _fan_out(instructor.id, videos)
+
+
+def backfill_timeline(follower_id, instructor):
+    """새로 팔로우한 강사의 최근 영상을 타임라인에 채움"""
+    if not is_fanout_instructor(instructor):
+        return
+
+    videos = Video.objects.filter(
+        instructor=instructor, is_public=True
+    ).order_by('-created_at').values_list('id', 'created_at')[:BACKFILL_SIZE]
+
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(
+                user_id=follower_id,
+                video_id=video_id,
+                instructor_id=instructor.id,
+                created_at=created_at
+            )
+            for video_id, created_at in videos
+        ],
+        ignore_conflicts=True
+    )
+
+
+def remove_from_timeline(follower_id, instructor_id):
+    """언팔로우한 강사의 영상을 타임라인에서 제거"""
+    TimelineEntry.objects.filter(user_id=follower_id, instructor_id=instructor_id).delete()
+
+
+def encode_cursor(position):
+    created_at, video_id = position
+    raw = f'{created_at.isoformat()}|{video_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor):
+    """커서 문자열을 (created_at, video_id) 로 변환 (잘못된 커서면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, video_id = raw.rsplit('|', 1)
+        created_at = parse_datetime(created_at)
+        video_id = int(video_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError('Invalid cursor')
+
+    if created_at is None:
+        raise ValueError('Invalid cursor')
+    return created_at, video_id
+
+
+def _before(position, created_field, id_field):
+    """(created_at, id) 키셋 조건"""
+    created_at, video_id = position
+    return Q(**{f'{created_field}__lt': created_at}) | Q(
+        **{created_field: created_at, f'{id_field}__lt': video_id}
+    )
+
+
+def get_feed_page(user, position=None, page_size=20):
+    """
+    홈 피드 한 페이지 조회
+
+    타임라인(fan-out 결과)과 대형 강사 영상을 각각 키셋으로 page_size+1 개씩
+    읽어와 (created_at, id) 내림차순으로 병합합니다.
+
+    Returns:
+        (영상 목록, 다음 페이지 위치 또는 None)
+    """
+    limit = page_size + 1
+
+    entries = TimelineEntry.objects.filter(user=user, video__is_public=True)
+    if position:
+        entries = entries.filter(_before(position, 'created_at', 'video_id'))
+    timeline_keys = list(
+        entries.order_by('-created_at', '-video_id').values_list('created_at', 'video_id')[:limit]
+    )
+
+    pulled_instructor_ids = list(
+        Follow.objects.filter(
+            follower=user,
+            following__followers_count__gt=get_fanout_threshold()
+        ).values_list('following_id', flat=True)
+    )
+    pulled_keys = []
+    if pulled_instructor_ids:
+        videos = Video.objects.filter(instructor_id__in=pulled_instructor_ids, is_public=True)
+        if position:
+            videos = videos.filter(_before(position, 'created_at', 'id'))
+        pulled_keys = list(
+            videos.order_by('-created_at', '-id').values_list('created_at', 'id')[:limit]
+        )
+
+    merged = []
+    seen = set()
+    for key in heapq.merge(timeline_keys, pulled_keys, reverse=True):
+        if key[1] in seen:
+            continue
+        seen.add(key[1])
+        merged.append(key)
+        if len(merged) == limit:
+            break
+
+    has_next = len(merged) > page_size
+    merged = merged[:page_size]
+
+    videos_by_id = Video.objects.select_related(
+        'instructor', 'category'
+    ).prefetch_related('tags').in_bulk([video_id for _, video_id in merged])
+    videos = [videos_by_id[video_id] for _, video_id in merged if video_id in videos_by_id]
+
+    next_position = merged[-1] if has_next and merged else None
+    return videos, next_position
+
+
+def trim_timelines(max_length=None):
+    """사용자별 타임라인을 최신 max_length 개로 유지 (백그라운드 작업용)"""
+    max_length = max_length or get_max_length()
+
+    overflowing = list(
+        TimelineEntry.objects.values('user_id').annotate(
+            total=Count('id')
+        ).filter(total__gt=max_length).values_list('user_id', flat=True)
+    )
+
+    deleted = 0
+    for user_id in overflowing:
+        cutoff = TimelineEntry.objects.filter(user_id=user_id).order_by(
+            '-created_at', '-video_id'
+        ).values_list('created_at', 'video_id')[max_length - 1]
+
+        count, _ = TimelineEntry.objects.filter(user_id=user_id).filter(
+            _before(cutoff, 'created_at', 'video_id')
+        ).delete()
+        deleted += count
+    return deleted
@@ -0,0 +1,23 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from social.suggestions import compute_all
+
+
+class Command(BaseCommand):
+    help = '팔로우 그래프 전체로 친구의 친구 추천을 재계산합니다. (cron 등으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--top-k',
+            type=int,
+            default=None,
+            help='사용자별 추천 수 (기본값: settings.FOLLOW_SUGGESTIONS_TOP_K)'
+        )
+
+    def handle(self, *args, **options):
+        started = time.monotonic()
+        saved = compute_all(options['top_k'])
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(f'추천 {saved}건을 저장했습니다. ({elapsed:.1f}초)'))
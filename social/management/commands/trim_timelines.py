@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from social.feed import trim_timelines
+
+
+class Command(BaseCommand):
+    help = '사용자별 홈 피드 타임라인을 최신 FEED_MAX_LENGTH 개로 정리합니다. (cron 등으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-length',
+            type=int,
+            default=None,
+            help='사용자별 최대 보관 개수 (기본값: settings.FEED_MAX_LENGTH)'
+        )
+
+    def handle(self, *args, **options):
+        deleted = trim_timelines(options['max_length'])
+        self.stdout.write(self.style.SUCCESS(f'타임라인 항목 {deleted}개를 정리했습니다.'))
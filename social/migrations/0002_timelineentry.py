@@ -0,0 +1,34 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0001_initial'),
+        ('videos', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TimelineEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(verbose_name='영상 생성일')),
+                ('instructor', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='강사')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+                ('video', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='timeline_entries', to='videos.video', verbose_name='영상')),
+            ],
+            options={
+                'verbose_name': '타임라인 항목',
+                'verbose_name_plural': '타임라인 항목 목록',
+                'ordering': ['-created_at', '-video_id'],
+                'indexes': [models.Index(fields=['user', '-created_at', '-video'], name='social_time_user_id_ff2505_idx')],
+                'unique_together': {('user', 'video')},
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:30
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('social', '0002_timelineentry'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FollowSuggestion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.PositiveIntegerField(default=0, verbose_name='공통 이웃 수')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('suggested_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='추천 사용자')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='follow_suggestions', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '팔로우 추천',
+                'verbose_name_plural': '팔로우 추천 목록',
+                'ordering': ['-score'],
+                'indexes': [models.Index(fields=['user', '-score'], name='social_foll_user_id_f99c77_idx')],
+                'unique_together': {('user', 'suggested_user')},
+            },
+        ),
+    ]
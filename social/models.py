@@ -151,3 +151,75 @@ class Follow(models.Model):
     def save(self, *args, **kwargs):
         self.full_clean()
         super().save(*args, **kwargs)
+
+
+class TimelineEntry(models.Model):
+    """홈 피드 타임라인 (팔로우한 강사의 새 영상, fan-out on write)"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='사용자'
+    )
+    video = models.ForeignKey(
+        Video,
+        on_delete=models.CASCADE,
+        related_name='timeline_entries',
+        verbose_name='영상'
+    )
+    instructor = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='강사'
+    )
+    created_at = models.DateTimeField(
+        verbose_name='영상 생성일'
+    )
+
+    class Meta:
+        verbose_name = '타임라인 항목'
+        verbose_name_plural = '타임라인 항목 목록'
+        unique_together = [['user', 'video']]
+        ordering = ['-created_at', '-video_id']
+        indexes = [
+            models.Index(fields=['user', '-created_at', '-video']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} ← {self.video_id}"
+
+
+class FollowSuggestion(models.Model):
+    """팔로우 추천 (친구의 친구, 공통 이웃 수 가중치)"""
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='follow_suggestions',
+        verbose_name='사용자'
+    )
+    suggested_user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='+',
+        verbose_name='추천 사용자'
+    )
+    score = models.PositiveIntegerField(
+        default=0,
+        verbose_name='공통 이웃 수'
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = '팔로우 추천'
+        verbose_name_plural = '팔로우 추천 목록'
+        unique_together = [['user', 'suggested_user']]
+        ordering = ['-score']
+        indexes = [
+            models.Index(fields=['user', '-score']),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} → {self.suggested_user_id} ({self.score})"
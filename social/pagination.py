@@ -0,0 +1,23 @@
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+
+
+class FollowCursorPagination(CursorPagination):
+    """팔로워/팔로잉 목록 커서 페이지네이션
+
+    Follow.Meta.indexes 의 (follower, -created_at), (following, -created_at)
+    인덱스 순서를 그대로 따라가므로 OFFSET 스캔과 COUNT 쿼리가 필요 없습니다.
+    """
+
+    page_size = 20
+    max_page_size = 100
+    page_size_query_param = 'page_size'
+    ordering = '-created_at'
+
+    def get_paginated_response(self, data, count=None):
+        return Response({
+            'count': count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
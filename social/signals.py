@@ -0,0 +1,48 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from videos.models import Video
+from .models import Follow
+from . import feed, suggestions
+
+
+@receiver(post_save, sender=Video)
+def fan_out_new_video(sender, instance, created, **kwargs):
+    """새 영상 업로드 또는 비공개 → 공개 전환 시 팔로워 타임라인에 기록 (커밋 이후)"""
+    # _previous_is_public 은 videos.signals 의 pre_save 에서 기록
+    published = instance.is_public and getattr(instance, '_previous_is_public', None) is False
+    if created or published:
+        transaction.on_commit(lambda: feed.fan_out_video(instance))
+
+
+@receiver(post_save, sender=Follow)
+def backfill_followed_timeline(sender, instance, created, **kwargs):
+    """팔로우 시 해당 강사의 최근 영상을 타임라인에 채움"""
+    if created:
+        transaction.on_commit(
+            lambda: feed.backfill_timeline(instance.follower_id, instance.following)
+        )
+
+
+@receiver(post_save, sender=Follow)
+def update_suggestions_on_follow(sender, instance, created, **kwargs):
+    """팔로우 시 팔로우 추천 증분 반영"""
+    if created:
+        transaction.on_commit(
+            lambda: suggestions.apply_follow_created(instance.follower_id, instance.following_id)
+        )
+
+
+@receiver(post_delete, sender=Follow)
+def clear_unfollowed_timeline(sender, instance, **kwargs):
+    """언팔로우 시 해당 강사의 영상을 타임라인에서 제거"""
+    feed.remove_from_timeline(instance.follower_id, instance.following_id)
+
+
+@receiver(post_delete, sender=Follow)
+def update_suggestions_on_unfollow(sender, instance, **kwargs):
+    """언팔로우 시 팔로우 추천 증분 반영"""
+    transaction.on_commit(
+        lambda: suggestions.apply_follow_deleted(instance.follower_id, instance.following_id)
+    )
@@ -0,0 +1,178 @@
+"""
+팔로우 추천 (친구의 친구)
+
+전체 계산은 주기 배치(compute_follow_suggestions 커맨드)로 수행합니다.
+Follow 그래프를 CSR 인접 배열(NumPy)로 적재한 뒤, 사용자별로 2단계 이웃을
+공통 이웃 수로 집계해 상위 K명을 FollowSuggestion 테이블에 저장합니다.
+
+배치 사이의 Follow 변경은 apply_follow_created / apply_follow_deleted 로
+해당 팔로워의 추천 행에 증분 반영합니다.
+"""
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import Follow, FollowSuggestion
+
+SAVE_BATCH_SIZE = 1000
+
+
+def get_top_k():
+    return getattr(settings, 'FOLLOW_SUGGESTIONS_TOP_K', 20)
+
+
+class FollowGraph:
+    """CSR 형식의 팔로우 그래프 (follower → following)"""
+
+    def __init__(self, user_ids, indptr, indices):
+        self.user_ids = user_ids    # 밀집 인덱스 → 사용자 ID
+        self.indptr = indptr        # 사용자별 인접 구간 시작 위치
+        self.indices = indices      # 팔로잉 사용자의 밀집 인덱스
+
+    @classmethod
+    def load(cls):
+        """Follow 테이블 전체를 정수 배열로 적재"""
+        edges = np.fromiter(
+            (
+                value
+                for pair in Follow.objects.values_list('follower_id', 'following_id').iterator(chunk_size=10000)
+                for value in pair
+            ),
+            dtype=np.int64
+        ).reshape(-1, 2)
+
+        user_ids, dense = np.unique(edges, return_inverse=True)
+        dense = dense.reshape(-1, 2)
+
+        # follower 기준 정렬 후 행 포인터 계산
+        order = np.lexsort((dense[:, 1], dense[:, 0]))
+        sources = dense[order, 0]
+        indices = dense[order, 1].astype(np.int32)
+        counts = np.bincount(sources, minlength=len(user_ids))
+        indptr = np.zeros(len(user_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+
+        return cls(user_ids, indptr, indices)
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    def neighbors(self, node):
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def top_k_candidates(self, node, k):
+        """2단계 이웃 중 공통 이웃 수 기준 상위 k명 (밀집 인덱스, 점수)"""
+        direct = self.neighbors(node)
+        if len(direct) == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64)
+
+        second = np.concatenate([self.neighbors(v) for v in direct])
+        if len(second) == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int64)
+
+        candidates, scores = np.unique(second, return_counts=True)
+
+        # 본인과 이미 팔로우 중인 사용자 제외
+        mask = ~np.isin(candidates, direct, assume_unique=True) & (candidates != node)
+        candidates, scores = candidates[mask], scores[mask]
+
+        if len(candidates) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[top], scores[top]
+
+        order = np.argsort(-scores, kind='stable')
+        return candidates[order], scores[order]
+
+
+def compute_all(top_k=None):
+    """전체 팔로우 추천 재계산 (배치)"""
+    top_k = top_k or get_top_k()
+    graph = FollowGraph.load()
+
+    rows = []
+    for node in range(len(graph)):
+        candidates, scores = graph.top_k_candidates(node, top_k)
+        user_id = int(graph.user_ids[node])
+        rows.extend(
+            FollowSuggestion(
+                user_id=user_id,
+                suggested_user_id=int(graph.user_ids[candidate]),
+                score=int(score)
+            )
+            for candidate, score in zip(candidates, scores)
+        )
+
+    with transaction.atomic():
+        FollowSuggestion.objects.all().delete()
+        FollowSuggestion.objects.bulk_create(rows, batch_size=SAVE_BATCH_SIZE)
+    return len(rows)
+
+
+def _followed_ids(user_id):
+    return set(Follow.objects.filter(follower_id=user_id).values_list('following_id', flat=True))
+
+
+def apply_follow_created(follower_id, following_id):
+    """
+    follower → following 팔로우 증분 반영
+
+    following 이 팔로우하는 사용자들은 follower 의 2단계 이웃이 되므로 점수를 1 올리고,
+    새로 팔로우한 사용자는 추천에서 제거합니다.
+    (follower 의 팔로워들에게 생기는 추천 변화는 다음 전체 배치에서 반영됩니다.)
+    """
+    FollowSuggestion.objects.filter(user_id=follower_id, suggested_user_id=following_id).delete()
+
+    followed = _followed_ids(follower_id)
+    candidate_ids = set(
+        Follow.objects.filter(follower_id=following_id).values_list('following_id', flat=True)
+    ) - followed - {follower_id}
+    if not candidate_ids:
+        return
+
+    with transaction.atomic():
+        existing = set(
+            FollowSuggestion.objects.filter(
+                user_id=follower_id, suggested_user_id__in=candidate_ids
+            ).values_list('suggested_user_id', flat=True)
+        )
+        FollowSuggestion.objects.filter(
+            user_id=follower_id, suggested_user_id__in=existing
+        ).update(score=F('score') + 1)
+        FollowSuggestion.objects.bulk_create(
+            [
+                FollowSuggestion(user_id=follower_id, suggested_user_id=candidate_id, score=1)
+                for candidate_id in candidate_ids - existing
+            ],
+            ignore_conflicts=True
+        )
+        _trim(follower_id)
+
+
+def _trim(user_id, top_k=None):
+    """사용자의 추천 행을 점수 상위 K개로 유지 (get_suggestions 와 같은 정렬 기준)"""
+    top_k = top_k or get_top_k()
+    keep = FollowSuggestion.objects.filter(user_id=user_id).order_by(
+        '-score', 'suggested_user_id'
+    ).values_list('id', flat=True)[:top_k]
+    FollowSuggestion.objects.filter(user_id=user_id).exclude(id__in=list(keep)).delete()
+
+
+def apply_follow_deleted(follower_id, following_id):
+    """follower → following 언팔로우 증분 반영 (공통 이웃 점수 1 감소)"""
+    candidate_ids = Follow.objects.filter(follower_id=following_id).values_list('following_id', flat=True)
+
+    with transaction.atomic():
+        suggestions = FollowSuggestion.objects.filter(
+            user_id=follower_id, suggested_user_id__in=candidate_ids
+        )
+        suggestions.filter(score__lte=1).delete()
+        suggestions.update(score=F('score') - 1)
+
+
+def get_suggestions(user, limit=None):
+    """사용자의 팔로우 추천 (점수 내림차순)"""
+    limit = limit or get_top_k()
+    return FollowSuggestion.objects.filter(user=user).select_related(
+        'suggested_user'
+    ).order_by('-score', 'suggested_user_id')[:limit]
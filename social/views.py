@@ -1,11 +1,19 @@
+from functools import partial
+
 from rest_framework import viewsets, status, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.exceptions import NotFound
+from rest_framework.utils.urls import replace_query_param
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from django_filters.rest_framework import DjangoFilterBackend
 
 from .models import Comment, VideoRating, Follow
+from .pagination import FollowCursorPagination
+from . import feed
+from .suggestions import get_suggestions
 from .serializers import (
     CommentSerializer,
     CommentCreateSerializer,
@@ -13,7 +21,9 @@ from .serializers import (
     FollowSerializer
 )
 from accounts.models import User
-from accounts.serializers import UserSerializer
+from accounts.serializers import UserCardSerializer, USER_CARD_MODEL_FIELDS
+from videos.serializers import VideoListSerializer
+from notifications import events as notification_events
 
 
 class IsOwnerOrReadOnly(permissions.BasePermission):
@@ -73,7 +83,7 @@ class CommentViewSet(viewsets.ModelViewSet):
         comment = serializer.save(user=request.user)
 
         return Response(
-            CommentSerializer(comment).data,
+            CommentSerializer(comment, context={'request': request}).data,
             status=status.HTTP_201_CREATED
         )
 
@@ -111,8 +121,11 @@ class CommentViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         comment = serializer.save(user=request.user)
 
+        # 원댓글 작성자에게 알림 (이벤트 기록만, 팬아웃은 워커에서)
+        notification_events.comment_replied(comment)
+
         return Response(
-            CommentSerializer(comment).data,
+            CommentSerializer(comment, context={'request': request}).data,
             status=status.HTTP_201_CREATED
         )
 
@@ -185,7 +198,7 @@ class FollowViewSet(viewsets.GenericViewSet):
         return Response(
             {
                 'message': f'{following_user.username}님을 팔로우했습니다.',
-                'follow': FollowSerializer(follow).data
+                'follow': FollowSerializer(follow, context={'request': request}).data
             },
             status=status.HTTP_201_CREATED
         )
@@ -230,9 +243,14 @@ class FollowViewSet(viewsets.GenericViewSet):
             request.user.following_count = Follow.objects.filter(follower=request.user).count()
             request.user.save()
 
+            was_fanout = feed.is_fanout_instructor(following_user)
             following_user.followers_count = Follow.objects.filter(following=following_user).count()
             following_user.save()
 
+            # 팔로워 수가 기준 이하로 줄어 fan-out 으로 바뀌면 최근 영상을 타임라인에 채움
+            if not was_fanout and feed.is_fanout_instructor(following_user):
+                transaction.on_commit(partial(feed.backfill_followers, following_user))
+
             return Response(
                 {'message': f'{following_user.username}님을 언팔로우했습니다.'},
                 status=status.HTTP_200_OK
@@ -243,76 +261,166 @@ class FollowViewSet(viewsets.GenericViewSet):
                 status=status.HTTP_404_NOT_FOUND
             )
 
+    def _get_target_user(self, request):
+        """user_id 파라미터의 사용자 (없으면 현재 로그인한 사용자)"""
+        user_id = request.query_params.get('user_id')
+
+        if not user_id:
+            return request.user
+
+        try:
+            return User.objects.only(
+                'id', 'followers_count', 'following_count'
+            ).get(id=user_id)
+        except (User.DoesNotExist, ValueError):
+            return None
+
+    def _paginated_user_cards(self, request, queryset, user_field, count):
+        """Follow 인덱스 순서로 커서 페이지네이션 후 사용자 카드 반환"""
+        # view의 OrderingFilter 대신 인덱스 순서(-created_at)를 고정으로 사용
+        paginator = FollowCursorPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        users = [getattr(follow, user_field) for follow in page]
+        serializer = UserCardSerializer(users, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data, count=count)
+
     @extend_schema(
         tags=['소셜'],
         summary='팔로워 목록',
-        description='특정 사용자의 팔로워 목록을 조회합니다.',
+        description='특정 사용자의 팔로워 목록을 최신 팔로우 순으로 커서 페이지네이션하여 조회합니다.',
+        parameters=[
+            OpenApiParameter('user_id', int, description='조회할 사용자 ID (생략 시 본인)'),
+            OpenApiParameter('cursor', str, description='다음/이전 페이지 커서'),
+        ],
         responses={
-            200: OpenApiResponse(response=UserSerializer(many=True)),
+            200: OpenApiResponse(response=UserCardSerializer(many=True)),
             404: OpenApiResponse(description='사용자를 찾을 수 없음')
         }
     )
     @action(detail=False, methods=['get'])
     def followers(self, request):
         """팔로워 목록"""
-        user_id = request.query_params.get('user_id')
+        user = self._get_target_user(request)
+        if user is None:
+            return Response(
+                {'error': '사용자를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
 
-        if not user_id:
-            # user_id가 없으면 현재 로그인한 사용자의 팔로워
-            user = request.user
-        else:
-            try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
-                return Response(
-                    {'error': '사용자를 찾을 수 없습니다.'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-
-        # 해당 사용자를 팔로우하는 사람들
-        followers = User.objects.filter(
-            following_relations__following=user
-        ).distinct()
-
-        serializer = UserSerializer(followers, many=True)
-        return Response({
-            'count': followers.count(),
-            'results': serializer.data
-        })
+        # (following, -created_at) 인덱스를 타는 조회
+        follows = Follow.objects.filter(following=user).select_related('follower').only(
+            'id', 'created_at', 'following_id',
+            *[f'follower__{field}' for field in USER_CARD_MODEL_FIELDS]
+        )
+
+        return self._paginated_user_cards(
+            request, follows, 'follower', user.followers_count
+        )
 
     @extend_schema(
         tags=['소셜'],
         summary='팔로잉 목록',
-        description='특정 사용자가 팔로우하는 사용자 목록을 조회합니다.',
+        description='특정 사용자가 팔로우하는 사용자 목록을 최신 팔로우 순으로 커서 페이지네이션하여 조회합니다.',
+        parameters=[
+            OpenApiParameter('user_id', int, description='조회할 사용자 ID (생략 시 본인)'),
+            OpenApiParameter('cursor', str, description='다음/이전 페이지 커서'),
+        ],
         responses={
-            200: OpenApiResponse(response=UserSerializer(many=True)),
+            200: OpenApiResponse(response=UserCardSerializer(many=True)),
             404: OpenApiResponse(description='사용자를 찾을 수 없음')
         }
     )
     @action(detail=False, methods=['get'])
     def following(self, request):
         """팔로잉 목록"""
-        user_id = request.query_params.get('user_id')
+        user = self._get_target_user(request)
+        if user is None:
+            return Response(
+                {'error': '사용자를 찾을 수 없습니다.'},
+                status=status.HTTP_404_NOT_FOUND
+            )
 
-        if not user_id:
-            # user_id가 없으면 현재 로그인한 사용자가 팔로우하는 사람들
-            user = request.user
-        else:
+        # (follower, -created_at) 인덱스를 타는 조회
+        follows = Follow.objects.filter(follower=user).select_related('following').only(
+            'id', 'created_at', 'follower_id',
+            *[f'following__{field}' for field in USER_CARD_MODEL_FIELDS]
+        )
+
+        return self._paginated_user_cards(
+            request, follows, 'following', user.following_count
+        )
+
+    @extend_schema(
+        tags=['소셜'],
+        summary='팔로우 추천',
+        description='내가 팔로우하는 사용자들이 팔로우하는 사용자를 공통 이웃 수 순으로 추천합니다. (배치 계산 결과)',
+        responses={
+            200: OpenApiResponse(response=UserCardSerializer(many=True)),
+            401: OpenApiResponse(description='인증되지 않음')
+        }
+    )
+    @action(detail=False, methods=['get'])
+    def suggestions(self, request):
+        """팔로우 추천"""
+        results = []
+        for suggestion in get_suggestions(request.user):
+            data = UserCardSerializer(suggestion.suggested_user, context={'request': request}).data
+            data['common_count'] = suggestion.score
+            results.append(data)
+        return Response({'results': results})
+
+
+class FeedViewSet(viewsets.GenericViewSet):
+    """홈 피드 ViewSet (팔로우한 강사의 새 영상)"""
+
+    serializer_class = VideoListSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    page_size = 20
+    max_page_size = 50
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params.get('page_size', self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(page_size, self.max_page_size))
+
+    @extend_schema(
+        tags=['소셜'],
+        summary='홈 피드',
+        description='팔로우한 강사의 새 영상을 최신순으로 커서 페이지네이션하여 조회합니다.',
+        parameters=[
+            OpenApiParameter('cursor', str, description='다음 페이지 커서'),
+            OpenApiParameter('page_size', int, description='페이지 크기 (최대 50)'),
+        ],
+        responses={
+            200: OpenApiResponse(response=VideoListSerializer(many=True)),
+            401: OpenApiResponse(description='인증되지 않음'),
+            404: OpenApiResponse(description='잘못된 커서')
+        }
+    )
+    def list(self, request):
+        """홈 피드"""
+        position = None
+        cursor = request.query_params.get('cursor')
+        if cursor:
             try:
-                user = User.objects.get(id=user_id)
-            except User.DoesNotExist:
-                return Response(
-                    {'error': '사용자를 찾을 수 없습니다.'},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-
-        # 해당 사용자가 팔로우하는 사람들
-        following = User.objects.filter(
-            follower_relations__follower=user
-        ).distinct()
-
-        serializer = UserSerializer(following, many=True)
+                position = feed.decode_cursor(cursor)
+            except ValueError:
+                raise NotFound('잘못된 커서입니다.')
+
+        videos, next_position = feed.get_feed_page(
+            request.user, position, self.get_page_size(request)
+        )
+
+        next_link = None
+        if next_position:
+            next_link = replace_query_param(
+                request.build_absolute_uri(), 'cursor', feed.encode_cursor(next_position)
+            )
+
+        serializer = self.get_serializer(videos, many=True)
         return Response({
-            'count': following.count(),
+            'next': next_link,
             'results': serializer.data
         })
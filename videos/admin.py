@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.utils.html import format_html
-from .models import Video, VideoCompletion
+from .models import Video, VideoCompletion, InstructorStats
 
 
 @admin.register(Video)
@@ -15,7 +15,7 @@ class VideoAdmin(admin.ModelAdmin):
     list_filter = ['is_public', 'category', 'created_at']
     search_fields = ['title', 'description', 'instructor__username']
     readonly_fields = [
-        'view_count', 'likes_count', 'comments_count', 'rating_avg',
+        'view_count', 'unique_viewers', 'likes_count', 'comments_count', 'rating_avg',
         'created_at', 'updated_at', 'thumbnail_preview'
     ]
     filter_horizontal = ['tags']
@@ -28,7 +28,7 @@ class VideoAdmin(admin.ModelAdmin):
             'fields': ('video_file', 'thumbnail', 'thumbnail_preview', 'duration')
         }),
         ('통계', {
-            'fields': ('view_count', 'likes_count', 'comments_count', 'rating_avg')
+            'fields': ('view_count', 'unique_viewers', 'likes_count', 'comments_count', 'rating_avg')
         }),
         ('설정', {
             'fields': ('is_public',)
@@ -67,3 +67,12 @@ class VideoCompletionAdmin(admin.ModelAdmin):
     list_filter = ['is_completed', 'completed_at']
     search_fields = ['user__username', 'video__title']
     readonly_fields = ['created_at', 'updated_at']
+
+
+@admin.register(InstructorStats)
+class InstructorStatsAdmin(admin.ModelAdmin):
+    """강사 요약 Admin"""
+
+    list_display = ['instructor', 'videos_count', 'total_views', 'ratings_count', 'rating_avg', 'updated_at']
+    search_fields = ['instructor__username']
+    readonly_fields = ['videos_count', 'total_views', 'ratings_count', 'ratings_sum', 'recent_video_ids', 'updated_at']
@@ -0,0 +1,319 @@
+"""
+카탈로그 패싯 인덱스
+
+공개 영상 중 선택한 카테고리/태그를 만족하는 영상 id 목록과 카테고리/태그별
+영상 수를 메모리 인덱스로 계산합니다. 영상 id 분포가 희소해도 크기가
+영상/태그 연결 수에 비례하도록 다음 구조를 사용합니다.
+
+- 영상 id → 공개 여부 / 카테고리 id: NumPy 배열 (영상 id 로 바로 조회)
+- 태그 id → 정렬된 영상 id 배열 (필터는 작은 배열부터 교집합)
+- 영상 id → 태그 id (역방향): 구성 시 CSR 배열 + 이후 변경분 dict,
+  영상 태그 제거는 그 영상의 태그 배열만 수정
+- 태그별 개수: 필터 결과가 작으면 역방향으로 세고, 크면 전체 태그 배열을 이어 붙인
+  postings 에서 필터 마스크를 한 번에 조회 (postings 는 변경 후 처음 조회 때 다시 만듦)
+- 같은 필터의 결과는 다음 변경 전까지 기억
+
+인덱스 변경과 조회는 모두 _lock 안에서 실행합니다.
+
+프로세스마다 인덱스를 들고 있으며 동기화는 다음과 같습니다.
+- 같은 프로세스의 변경: 시그널(커밋 후)에서 인덱스를 바로 증분 갱신
+- 다른 프로세스의 변경: 공유 캐시의 버전 카운터가 예상보다 많이 올라가 있으면
+  다음 조회 때 전체 재구성 (쿼리 2회)
+- 버전 카운터를 공유하지 못하는 캐시(LocMemCache 등)에서도 FACET_INDEX_MAX_AGE_SECONDS
+  가 지나면 재구성. 재구성 중 다른 요청은 이전 인덱스로 응답합니다.
+"""
+import threading
+import time
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+
+VERSION_KEY = 'facets:version'
+
+# 기억해 두는 필터 결과 수
+RESULT_CACHE_SIZE = 256
+# 필터 결과가 전체 postings 의 1/SPARSE_RATIO 보다 작으면 역방향 맵으로 태그별 개수 계산
+SPARSE_RATIO = 64
+
+_lock = threading.Lock()
+_build_lock = threading.Lock()
+_index = None
+_index_version = None
+_built_at = 0.0
+
+EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _as_ids(values):
+    """영상 id 목록 → 정렬된 고유 id 배열"""
+    return np.unique(np.fromiter(values, dtype=np.int64))
+
+
+class FacetIndex:
+    """카테고리/태그별 영상 id 인덱스"""
+
+    def __init__(self, size=0):
+        self.public = np.zeros(size, dtype=bool)
+        self.category_of = np.full(size, -1, dtype=np.int64)
+        self.tags = {}
+        # 역방향 (영상 id → 태그 id): 구성 시점의 CSR + 이후 바뀐 영상
+        self.tag_ptr = np.zeros(size + 1, dtype=np.int64)
+        self.tag_values = EMPTY
+        self.tag_overrides = {}
+        self._postings = None
+        self._results = {}
+
+    @classmethod
+    def build(cls):
+        """DB 에서 전체 인덱스 구성"""
+        from .models import Video
+
+        videos = np.array(
+            [
+                (video_id, -1 if category_id is None else category_id, is_public)
+                for video_id, category_id, is_public
+                in Video.objects.values_list('id', 'category_id', 'is_public').iterator()
+            ],
+            dtype=np.int64
+        ).reshape(-1, 3)
+        links = np.array(
+            list(Video.tags.through.objects.values_list('video_id', 'tag_id').iterator()),
+            dtype=np.int64
+        ).reshape(-1, 2)
+        return cls.from_arrays(videos, links)
+
+    @classmethod
+    def from_arrays(cls, videos, links):
+        """[[영상 id, 카테고리 id(-1 없음), 공개 여부]], [[영상 id, 태그 id]] 배열로 구성"""
+        size = int(max(videos[:, 0].max(initial=0), links[:, 0].max(initial=0))) + 1
+        index = cls(size)
+        index.public[videos[:, 0]] = videos[:, 2].astype(bool)
+        index.category_of[videos[:, 0]] = videos[:, 1]
+
+        if links.size:
+            video_ids, tag_ids = links[:, 0], links[:, 1]
+            # 태그 → 영상 id 배열
+            order = np.lexsort((video_ids, tag_ids))
+            sorted_tags, sorted_videos = tag_ids[order], video_ids[order]
+            boundaries = np.flatnonzero(np.diff(sorted_tags)) + 1
+            starts = np.concatenate([[0], boundaries])
+            index.tags = {
+                int(sorted_tags[start]): ids
+                for start, ids in zip(starts, np.split(sorted_videos, boundaries))
+            }
+            # 영상 → 태그 id (CSR)
+            order = np.lexsort((tag_ids, video_ids))
+            index.tag_values = tag_ids[order]
+            index.tag_ptr[1:] = np.cumsum(np.bincount(video_ids, minlength=size))
+        return index
+
+    def _grow(self, video_id):
+        size = self.public.size
+        if video_id < size:
+            return
+        new_size = max(video_id + 1, size * 2)
+        self.public = np.concatenate([self.public, np.zeros(new_size - size, dtype=bool)])
+        self.category_of = np.concatenate([self.category_of, np.full(new_size - size, -1, dtype=np.int64)])
+        self.tag_ptr = np.concatenate([self.tag_ptr, np.full(new_size - size, self.tag_ptr[-1], dtype=np.int64)])
+
+    def _changed(self, tags=False):
+        self._results.clear()
+        if tags:
+            self._postings = None
+
+    def video_tags(self, video_id):
+        """영상의 태그 id 목록"""
+        if video_id in self.tag_overrides:
+            return self.tag_overrides[video_id]
+        if video_id + 1 < self.tag_ptr.size:
+            return self.tag_values[self.tag_ptr[video_id]:self.tag_ptr[video_id + 1]].tolist()
+        return []
+
+    # 증분 갱신
+
+    def set_video(self, video_id, category_id, is_public):
+        self._grow(video_id)
+        self.public[video_id] = is_public
+        self.category_of[video_id] = -1 if category_id is None else category_id
+        self._changed()
+
+    def remove_video(self, video_id):
+        if video_id < self.public.size:
+            self.public[video_id] = False
+            self.category_of[video_id] = -1
+        self.clear_video_tags(video_id)
+        self._changed()
+
+    def add_tags(self, video_ids, tag_ids):
+        ids = _as_ids(video_ids)
+        if not ids.size:
+            return
+        self._grow(int(ids[-1]))
+        for tag_id in tag_ids:
+            self.tags[tag_id] = np.union1d(self.tags.get(tag_id, EMPTY), ids)
+        for video_id in ids.tolist():
+            self.tag_overrides[video_id] = sorted(set(self.video_tags(video_id)) | set(tag_ids))
+        self._changed(tags=True)
+
+    def remove_tags(self, video_ids, tag_ids):
+        ids = _as_ids(video_ids)
+        for tag_id in tag_ids:
+            if tag_id in self.tags:
+                remaining = np.setdiff1d(self.tags[tag_id], ids, assume_unique=True)
+                if remaining.size:
+                    self.tags[tag_id] = remaining
+                else:
+                    del self.tags[tag_id]
+        removed = set(tag_ids)
+        for video_id in ids.tolist():
+            self.tag_overrides[video_id] = [pk for pk in self.video_tags(video_id) if pk not in removed]
+        self._changed(tags=True)
+
+    def clear_video_tags(self, video_id):
+        tag_ids = self.video_tags(video_id)
+        if tag_ids:
+            self.remove_tags([video_id], tag_ids)
+
+    def clear_tag(self, tag_id):
+        ids = self.tags.pop(tag_id, EMPTY)
+        for video_id in ids.tolist():
+            self.tag_overrides[video_id] = [pk for pk in self.video_tags(video_id) if pk != tag_id]
+        self._changed(tags=True)
+
+    def clear_category(self, category_id):
+        self.category_of[self.category_of == category_id] = -1
+        self._changed()
+
+    # 조회
+
+    def match(self, category_id=None, tag_ids=()):
+        """공개 영상 중 카테고리 AND 모든 태그를 만족하는 영상 id 배열 (오름차순)"""
+        if tag_ids:
+            arrays = sorted((self.tags.get(tag_id, EMPTY) for tag_id in set(tag_ids)), key=len)
+            ids = arrays[0]
+            for array in arrays[1:]:
+                if not ids.size:
+                    break
+                ids = np.intersect1d(ids, array, assume_unique=True)
+            ids = ids[self.public[ids]]
+            if category_id is not None:
+                ids = ids[self.category_of[ids] == category_id]
+            return ids
+
+        mask = self.public
+        if category_id is not None:
+            mask = mask & (self.category_of == category_id)
+        return np.flatnonzero(mask)
+
+    def _tag_postings(self):
+        """(태그 id 배열, 태그별 시작 위치, 이어 붙인 영상 id 배열)"""
+        if self._postings is None:
+            tag_ids = list(self.tags)
+            lengths = np.fromiter((self.tags[pk].size for pk in tag_ids), dtype=np.int64, count=len(tag_ids))
+            starts = np.concatenate([[0], np.cumsum(lengths)])
+            postings = np.concatenate([self.tags[pk] for pk in tag_ids]) if tag_ids else EMPTY
+            self._postings = (np.asarray(tag_ids, dtype=np.int64), starts, postings)
+        return self._postings
+
+    def counts(self, ids):
+        """필터 결과 기준 카테고리/태그별 영상 수 (0 제외)"""
+        categories = self.category_of[ids]
+        categories = categories[categories >= 0]
+        category_counts = np.bincount(categories)
+        category_ids = np.flatnonzero(category_counts)
+
+        tag_ids, starts, postings = self._tag_postings()
+        if ids.size * SPARSE_RATIO < postings.size:
+            tags = Counter()
+            for video_id in ids.tolist():
+                tags.update(self.video_tags(video_id))
+        else:
+            mask = np.zeros(self.public.size, dtype=bool)
+            mask[ids] = True
+            hits = np.concatenate([[0], np.cumsum(mask[postings])])
+            tag_counts = hits[starts[1:]] - hits[starts[:-1]]
+            nonzero = np.flatnonzero(tag_counts)
+            tags = dict(zip(tag_ids[nonzero].tolist(), tag_counts[nonzero].tolist()))
+
+        return dict(zip(category_ids.tolist(), category_counts[category_ids].tolist())), dict(tags)
+
+    def query(self, category_id=None, tag_ids=()):
+        """필터 → (영상 id 배열, 카테고리별 개수, 태그별 개수), 같은 필터는 다음 변경까지 재사용"""
+        key = (category_id, tuple(sorted(set(tag_ids))))
+        result = self._results.get(key)
+        if result is None:
+            ids = self.match(category_id, key[1])
+            result = (ids, *self.counts(ids))
+            if len(self._results) >= RESULT_CACHE_SIZE:
+                self._results.clear()
+            self._results[key] = result
+        return result
+
+
+def _current_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, 0, timeout=None)
+        version = cache.get(VERSION_KEY, 0)
+    return version
+
+
+def _is_current(version):
+    return (
+        _index is not None
+        and _index_version == version
+        and time.monotonic() - _built_at < settings.FACET_INDEX_MAX_AGE_SECONDS
+    )
+
+
+def get_index():
+    """현재 버전의 패싯 인덱스 (다른 스레드가 재구성 중이면 이전 인덱스)"""
+    global _index, _index_version, _built_at
+
+    if _is_current(_current_version()):
+        return _index
+
+    if not _build_lock.acquire(blocking=_index is None):
+        return _index
+    try:
+        version = _current_version()
+        if not _is_current(version):
+            index = FacetIndex.build()
+            with _lock:
+                _index, _index_version, _built_at = index, version, time.monotonic()
+    finally:
+        _build_lock.release()
+    return _index
+
+
+def query(category_id=None, tag_ids=()):
+    """현재 인덱스에서 필터 조회 (FacetIndex.query 참고)"""
+    index = get_index()
+    with _lock:
+        return index.query(category_id, tag_ids)
+
+
+def apply(method, *args):
+    """
+    커밋된 변경을 로컬 인덱스에 반영하고 버전 카운터 증가
+
+    카운터가 정확히 1 올랐다면 그 사이 다른 프로세스의 변경이 없었으므로
+    로컬 인덱스를 그대로 유지하고, 아니면 다음 조회 때 재구성합니다.
+    """
+    global _index_version
+
+    _current_version()
+    with _lock:
+        if _index is not None:
+            getattr(_index, method)(*args)
+        try:
+            version = cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, 0, timeout=None)
+            version = None
+        if _index_version is not None and version == _index_version + 1:
+            _index_version = version
+        else:
+            _index_version = None
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('videos', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='video',
+            name='unique_viewers',
+            field=models.PositiveIntegerField(default=0, help_text='HyperLogLog 추정값 (주기적으로 갱신)', verbose_name='고유 방문자 수'),
+        ),
+    ]
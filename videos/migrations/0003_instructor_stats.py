@@ -0,0 +1,67 @@
+# Generated by Django 5.0.1 on 2026-10-19 08:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def backfill_instructor_stats(apps, schema_editor):
+    """공개 영상이 있는 강사의 요약 행 생성"""
+    Video = apps.get_model('videos', 'Video')
+    VideoRating = apps.get_model('social', 'VideoRating')
+    InstructorStats = apps.get_model('videos', 'InstructorStats')
+
+    public = Video.objects.filter(is_public=True)
+    totals = public.values('instructor_id').annotate(videos_count=Count('id'), total_views=Sum('view_count'))
+    ratings = {
+        row['video__instructor_id']: row
+        for row in VideoRating.objects.filter(video__is_public=True).values('video__instructor_id').annotate(
+            ratings_count=Count('id'), ratings_sum=Sum('rating')
+        )
+    }
+
+    rows = []
+    for row in totals:
+        instructor_id = row['instructor_id']
+        rating = ratings.get(instructor_id, {})
+        rows.append(InstructorStats(
+            instructor_id=instructor_id,
+            videos_count=row['videos_count'],
+            total_views=row['total_views'] or 0,
+            ratings_count=rating.get('ratings_count', 0),
+            ratings_sum=rating.get('ratings_sum') or 0,
+            recent_video_ids=list(
+                public.filter(instructor_id=instructor_id).order_by('-created_at').values_list('id', flat=True)[:5]
+            ),
+        ))
+    InstructorStats.objects.bulk_create(rows, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('videos', '0002_video_unique_viewers'),
+        ('social', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='InstructorStats',
+            fields=[
+                ('instructor', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='instructor_stats', serialize=False, to=settings.AUTH_USER_MODEL, verbose_name='강사')),
+                ('videos_count', models.PositiveIntegerField(default=0, verbose_name='공개 영상 수')),
+                ('total_views', models.PositiveBigIntegerField(default=0, verbose_name='총 조회수')),
+                ('ratings_count', models.PositiveIntegerField(default=0, verbose_name='평가 수')),
+                ('ratings_sum', models.PositiveIntegerField(default=0, verbose_name='평점 합계')),
+                ('recent_video_ids', models.JSONField(default=list, help_text='최근 공개 영상 ID (최신순)', verbose_name='최근 업로드')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일')),
+            ],
+            options={
+                'verbose_name': '강사 요약',
+                'verbose_name_plural': '강사 요약 목록',
+            },
+        ),
+        migrations.RunPython(backfill_instructor_stats, migrations.RunPython.noop),
+    ]
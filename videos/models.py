@@ -76,6 +76,11 @@ class Video(models.Model):
         default=0,
         verbose_name='조회수'
     )
+    unique_viewers = models.PositiveIntegerField(
+        default=0,
+        help_text='HyperLogLog 추정값 (주기적으로 갱신)',
+        verbose_name='고유 방문자 수'
+    )
     likes_count = models.PositiveIntegerField(
         default=0,
         verbose_name='좋아요 수'
@@ -111,6 +116,9 @@ class Video(models.Model):
             models.Index(fields=['-rating_avg']),
         ]
 
+    # 조회 시 F() / 주기 작업으로만 갱신되는 통계 필드
+    DENORMALIZED_FIELDS = ('view_count', 'unique_viewers')
+
     def __str__(self):
         return self.title
 
@@ -132,6 +140,13 @@ class Video(models.Model):
 
     def save(self, *args, **kwargs):
         self.full_clean()
+
+        # 조회 통계 필드는 오래된 인스턴스 값으로 덮어쓰지 않음
+        if not self._state.adding and kwargs.get('update_fields') is None:
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
         super().save(*args, **kwargs)
 
 
@@ -171,3 +186,56 @@ class VideoCompletion(models.Model):
     def __str__(self):
         status = "완강" if self.is_completed else "미완강"
         return f"{self.user.username} - {self.video.title} ({status})"
+
+
+class InstructorStats(models.Model):
+    """
+    강사 요약 (공개 영상 기준)
+
+    영상 생성/조회/평가 시 증분 갱신하고, 공개 여부 변경이나 삭제 시에는
+    해당 강사 행만 다시 집계합니다. (videos.stats)
+    """
+
+    # 프로필에 보여줄 최근 업로드 수
+    RECENT_VIDEOS = 5
+
+    instructor = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='instructor_stats',
+        verbose_name='강사'
+    )
+    videos_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='공개 영상 수'
+    )
+    total_views = models.PositiveBigIntegerField(
+        default=0,
+        verbose_name='총 조회수'
+    )
+    ratings_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='평가 수'
+    )
+    ratings_sum = models.PositiveIntegerField(
+        default=0,
+        verbose_name='평점 합계'
+    )
+    recent_video_ids = models.JSONField(
+        default=list,
+        help_text='최근 공개 영상 ID (최신순)',
+        verbose_name='최근 업로드'
+    )
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일')
+
+    class Meta:
+        verbose_name = '강사 요약'
+        verbose_name_plural = '강사 요약 목록'
+
+    def __str__(self):
+        return f"{self.instructor_id}: 영상 {self.videos_count}개"
+
+    @property
+    def rating_avg(self):
+        return round(self.ratings_sum / self.ratings_count, 2) if self.ratings_count else 0
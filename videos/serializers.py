@@ -2,6 +2,12 @@ from rest_framework import serializers
 from .models import Video, VideoCompletion
 from categories.models import Category, Tag
 from accounts.serializers import UserSerializer
+from django.utils.text import slugify
+
+# 영상 하나에 지정할 수 있는 최대 태그 수
+MAX_TAGS_PER_VIDEO = 20
+# 태그 슬러그 최대 길이 (태그명 검증용)
+TAG_SLUG_MAX_LENGTH = Tag._meta.get_field('slug').max_length
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -32,7 +38,7 @@ class VideoListSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'thumbnail',
             'instructor', 'category', 'tags',
-            'duration', 'view_count', 'likes_count',
+            'duration', 'view_count', 'unique_viewers', 'likes_count',
             'comments_count', 'rating_avg', 'is_public',
             'created_at', 'updated_at'
         ]
@@ -50,7 +56,7 @@ class VideoDetailSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'title', 'description', 'video_file', 'thumbnail',
             'instructor', 'category', 'tags',
-            'duration', 'view_count', 'likes_count',
+            'duration', 'view_count', 'unique_viewers', 'likes_count',
             'comments_count', 'rating_avg', 'is_public',
             'created_at', 'updated_at'
         ]
@@ -64,12 +70,19 @@ class VideoCreateSerializer(serializers.ModelSerializer):
         queryset=Tag.objects.all(),
         required=False
     )
+    tag_names = serializers.ListField(
+        child=serializers.CharField(min_length=2, max_length=30),
+        max_length=MAX_TAGS_PER_VIDEO,
+        required=False,
+        write_only=True,
+        help_text='태그 이름 목록 (없는 태그는 자동 생성)'
+    )
 
     class Meta:
         model = Video
         fields = [
             'title', 'description', 'video_file', 'thumbnail',
-            'category', 'tags', 'duration', 'is_public'
+            'category', 'tags', 'tag_names', 'duration', 'is_public'
         ]
 
     def validate_title(self, value):
@@ -84,9 +97,44 @@ class VideoCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('설명은 10자 이상이어야 합니다.')
         return value
 
+    def validate_tag_names(self, value):
+        """태그 이름 검증 (공백 정리, 중복 제거)"""
+        names = []
+        for name in value:
+            name = ' '.join(name.split())
+            if len(name) < 2:
+                raise serializers.ValidationError('태그명은 2자 이상이어야 합니다.')
+            slug = slugify(name, allow_unicode=True)
+            if not slug:
+                raise serializers.ValidationError(f'"{name}" 은(는) 태그명으로 사용할 수 없습니다.')
+            # 슬러그는 NFKC 정규화로 이름보다 길어질 수 있음 (bulk_create 는 길이를 검사하지 않음)
+            if len(slug) > TAG_SLUG_MAX_LENGTH:
+                raise serializers.ValidationError(f'"{name}" 은(는) 너무 깁니다. (슬러그 {TAG_SLUG_MAX_LENGTH}자 이하)')
+            if name not in names:
+                names.append(name)
+        return names
+
+    def validate(self, attrs):
+        """태그 수 검증 (ID + 이름 합계)"""
+        count = len(attrs.get('tags', [])) + len(attrs.get('tag_names', []))
+        if count > MAX_TAGS_PER_VIDEO:
+            raise serializers.ValidationError({'tags': f'태그는 최대 {MAX_TAGS_PER_VIDEO}개까지 지정할 수 있습니다.'})
+        return attrs
+
+    def _pop_tags(self, validated_data):
+        """태그 ID/이름을 태그 목록으로 변환 (이름은 조회 1회 + 없는 태그 일괄 생성)"""
+        tags = validated_data.pop('tags', None)
+        tag_names = validated_data.pop('tag_names', None)
+        if tag_names is None:
+            return tags
+
+        tags = list(tags or [])
+        tags += [tag for tag in Tag.bulk_get_or_create(tag_names) if tag not in tags]
+        return tags
+
     def create(self, validated_data):
         """영상 생성"""
-        tags_data = validated_data.pop('tags', [])
+        tags_data = self._pop_tags(validated_data)
 
         # instructor는 현재 로그인한 사용자
         video = Video.objects.create(
@@ -102,7 +150,7 @@ class VideoCreateSerializer(serializers.ModelSerializer):
 
     def update(self, instance, validated_data):
         """영상 수정"""
-        tags_data = validated_data.pop('tags', None)
+        tags_data = self._pop_tags(validated_data)
 
         # 필드 업데이트
         for attr, value in validated_data.items():
@@ -0,0 +1,118 @@
+"""
+패싯 인덱스 / 강사 요약 동기화
+
+Video 저장/삭제와 Video.tags 변경을 커밋 후 패싯 인덱스에 반영하고,
+영상/평가 변경을 강사 요약(InstructorStats)에 반영합니다.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from categories.models import Category, Tag
+from social.models import VideoRating
+from .models import Video
+from . import facets, stats
+
+
+def _on_commit(method, *args):
+    transaction.on_commit(partial(facets.apply, method, *args))
+
+
+@receiver(post_save, sender=Video)
+def index_video(sender, instance, created, **kwargs):
+    """영상 공개 여부/카테고리 반영 (바뀐 경우만, 평점 등 다른 필드 저장은 무시)"""
+    previous = (getattr(instance, '_previous_is_public', None), getattr(instance, '_previous_category_id', None))
+    if created or previous != (instance.is_public, instance.category_id):
+        _on_commit('set_video', instance.pk, instance.category_id, instance.is_public)
+
+
+@receiver(post_delete, sender=Video)
+def unindex_video(sender, instance, **kwargs):
+    """삭제된 영상 제거"""
+    _on_commit('remove_video', instance.pk)
+
+
+@receiver(m2m_changed, sender=Video.tags.through)
+def index_video_tags(sender, instance, action, reverse, pk_set, **kwargs):
+    """영상 태그 추가/제거 반영 (없는 비트를 지우는 것은 무해하므로 pk_set 그대로 사용)"""
+    if reverse:
+        # tag.videos.add(...) 처럼 Tag 쪽에서 변경하는 경우
+        if action == 'post_add':
+            _on_commit('add_tags', list(pk_set), [instance.pk])
+        elif action == 'post_remove':
+            _on_commit('remove_tags', list(pk_set), [instance.pk])
+        elif action == 'post_clear':
+            _on_commit('clear_tag', instance.pk)
+        return
+
+    if action == 'post_add':
+        _on_commit('add_tags', [instance.pk], list(pk_set))
+    elif action == 'post_remove':
+        _on_commit('remove_tags', [instance.pk], list(pk_set))
+    elif action == 'post_clear':
+        _on_commit('clear_video_tags', instance.pk)
+
+
+@receiver(post_delete, sender=Tag)
+def unindex_tag(sender, instance, **kwargs):
+    _on_commit('clear_tag', instance.pk)
+
+
+@receiver(post_delete, sender=Category)
+def unindex_category(sender, instance, **kwargs):
+    """카테고리 삭제 시 영상 카테고리는 SET_NULL (시그널 없는 UPDATE) 되므로 인덱스에서 직접 제거"""
+    _on_commit('clear_category', instance.pk)
+
+
+@receiver(pre_save, sender=Video)
+def remember_previous_visibility(sender, instance, **kwargs):
+    """수정 전 공개 여부/카테고리 기억"""
+    instance._previous_is_public = instance._previous_category_id = None
+    if instance.pk and not instance._state.adding:
+        previous = Video.objects.filter(pk=instance.pk).values_list('is_public', 'category_id').first()
+        if previous is not None:
+            instance._previous_is_public, instance._previous_category_id = previous
+
+
+@receiver(post_save, sender=Video)
+def update_instructor_stats(sender, instance, created, **kwargs):
+    """공개 영상 업로드는 증분 반영, 공개 여부 변경은 강사 행 재집계"""
+    if created:
+        if instance.is_public:
+            stats.video_created(instance)
+    elif getattr(instance, '_previous_is_public', None) not in (None, instance.is_public):
+        stats.rebuild(instance.instructor_id)
+
+
+@receiver(post_delete, sender=Video)
+def release_instructor_stats(sender, instance, **kwargs):
+    if instance.is_public:
+        stats.rebuild(instance.instructor_id)
+
+
+@receiver(pre_save, sender=VideoRating)
+def remember_previous_rating(sender, instance, **kwargs):
+    """수정 전 평점 기억"""
+    instance._previous_rating = None
+    if instance.pk and not instance._state.adding:
+        instance._previous_rating = VideoRating.objects.filter(
+            pk=instance.pk
+        ).values_list('rating', flat=True).first()
+
+
+@receiver(post_save, sender=VideoRating)
+def update_rating_stats(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_previous_rating', None)
+    if created:
+        stats.rating_changed(instance.video, int(instance.rating), 1)
+    elif previous is not None and previous != int(instance.rating):
+        stats.rating_changed(instance.video, int(instance.rating) - previous, 0)
+
+
+@receiver(post_delete, sender=VideoRating)
+def release_rating_stats(sender, instance, **kwargs):
+    video = Video.objects.filter(pk=instance.video_id).first()
+    if video is not None:
+        stats.rating_changed(video, -instance.rating, -1)
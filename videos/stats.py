@@ -0,0 +1,82 @@
+"""
+강사 요약(InstructorStats) 갱신
+
+- 공개 영상 생성: 영상 수 +1, 최근 업로드 앞에 추가
+- 공개 영상 조회: 총 조회수 +1 (F() UPDATE, 프로필 캐시는 TTL 로 반영)
+- 공개 영상 평가 등록/수정/삭제: 평점 합계/개수 증감
+- 공개 여부 변경, 영상 삭제: 해당 강사 행 재집계
+
+구조적인 변경(조회수 제외)은 커밋 후 프로필 캐시를 무효화합니다.
+"""
+from functools import partial
+
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import Coalesce
+
+from accounts.profiles import invalidate_profile
+from .models import InstructorStats, Video
+
+
+def _invalidate(instructor_id):
+    transaction.on_commit(partial(invalidate_profile, instructor_id))
+
+
+def rebuild(instructor_id):
+    """강사 행 전체 재집계 (강사 영상 인덱스 범위만 조회)"""
+    from social.models import VideoRating
+
+    videos = Video.objects.filter(instructor_id=instructor_id, is_public=True)
+    totals = videos.aggregate(
+        videos_count=Count('id'),
+        total_views=Coalesce(Sum('view_count'), 0)
+    )
+    ratings = VideoRating.objects.filter(video__in=videos).aggregate(
+        ratings_count=Count('id'),
+        ratings_sum=Coalesce(Sum('rating'), 0)
+    )
+    recent = list(
+        videos.order_by('-created_at').values_list('id', flat=True)[:InstructorStats.RECENT_VIDEOS]
+    )
+    InstructorStats.objects.update_or_create(
+        instructor_id=instructor_id,
+        defaults=dict(totals, **ratings, recent_video_ids=recent)
+    )
+    _invalidate(instructor_id)
+
+
+def video_created(video):
+    """공개 영상 업로드"""
+    with transaction.atomic():
+        stats, created = InstructorStats.objects.select_for_update().get_or_create(
+            instructor_id=video.instructor_id
+        )
+        if created and Video.objects.filter(instructor_id=video.instructor_id).exclude(pk=video.pk).exists():
+            # 요약 행이 없던 기존 강사는 한 번 전체 집계
+            rebuild(video.instructor_id)
+            return
+
+        stats.videos_count = F('videos_count') + 1
+        stats.recent_video_ids = [video.pk] + stats.recent_video_ids[:InstructorStats.RECENT_VIDEOS - 1]
+        stats.save(update_fields=['videos_count', 'recent_video_ids', 'updated_at'])
+    _invalidate(video.instructor_id)
+
+
+def video_viewed(video):
+    """공개 영상 조회수 증가"""
+    if video.is_public:
+        InstructorStats.objects.filter(pk=video.instructor_id).update(total_views=F('total_views') + 1)
+
+
+def rating_changed(video, rating_delta, count_delta):
+    """공개 영상 평가 증감"""
+    if not video.is_public:
+        return
+    updated = InstructorStats.objects.filter(pk=video.instructor_id).update(
+        ratings_sum=F('ratings_sum') + rating_delta,
+        ratings_count=F('ratings_count') + count_delta
+    )
+    if not updated:
+        rebuild(video.instructor_id)
+        return
+    _invalidate(video.instructor_id)
@@ -4,7 +4,7 @@ from rest_framework.response import Response
 from django.utils import timezone
 from django.db.models import F
 from django.http import FileResponse, Http404, HttpResponse
-from drf_spectacular.utils import extend_schema, OpenApiResponse
+from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
 import os
@@ -19,6 +19,15 @@ from .serializers import (
 )
 from social.models import VideoRating
 from social.serializers import VideoRatingSerializer
+from analytics.viewers import record_view
+from analytics import rollups
+from categories import taxonomy
+from categories.models import Category
+from . import facets, stats
+
+
+# 패싯 응답의 영상 ID 최대 개수
+FACET_IDS_MAX_LIMIT = 1000
 
 
 class IsInstructorOrReadOnly(permissions.BasePermission):
@@ -55,6 +64,8 @@ class VideoViewSet(viewsets.ModelViewSet):
     search_fields = ['title', 'description', 'instructor__username']
     ordering_fields = ['created_at', 'view_count', 'rating_avg', 'likes_count']
     ordering = ['-created_at']
+    # 읽기 요청은 토큰 클레임 사용자로 인증 (사용자 조회 쿼리 없음)
+    claims_user_on_read = True
 
     def get_serializer_class(self):
         """액션별 Serializer 선택"""
@@ -68,6 +79,14 @@ class VideoViewSet(viewsets.ModelViewSet):
         """쿼리셋 필터링"""
         queryset = super().get_queryset()
 
+        # 카테고리 하위 트리 필터 (경로 인덱스 범위 조회)
+        category_tree = self.request.query_params.get('category_tree')
+        if category_tree:
+            category = taxonomy.get_snapshot()['categories_by_slug'].get(category_tree)
+            if category is None:
+                return queryset.none()
+            queryset = queryset.filter(Category.subtree_lookup(category['path'], prefix='category__'))
+
         # 로그인하지 않은 사용자는 공개 영상만 조회
         if not self.request.user.is_authenticated:
             return queryset.filter(is_public=True)
@@ -77,21 +96,37 @@ class VideoViewSet(viewsets.ModelViewSet):
             return queryset.filter(
                 is_public=True
             ) | queryset.filter(
-                instructor=self.request.user
+                instructor_id=self.request.user.pk
             )
 
         return queryset
 
+    @extend_schema(
+        tags=['영상'],
+        summary='영상 목록 조회',
+        parameters=[
+            OpenApiParameter('category_tree', str, description='카테고리 슬러그 (하위 카테고리 영상 포함)'),
+        ],
+        responses={
+            200: OpenApiResponse(response=VideoListSerializer(many=True))
+        }
+    )
+    def list(self, request, *args, **kwargs):
+        return super().list(request, *args, **kwargs)
+
     def retrieve(self, request, *args, **kwargs):
         """영상 상세 조회 (조회수 증가)"""
         instance = self.get_object()
 
-        # 조회수 증가 (강사 본인 제외)
+        # 조회수 증가 및 고유 방문자 스케치 기록 (강사 본인 제외)
         if request.user != instance.instructor:
             Video.objects.filter(pk=instance.pk).update(
                 view_count=F('view_count') + 1
             )
             instance.refresh_from_db()
+            record_view('video', instance.pk, request)
+            rollups.record_view(instance.pk)
+            stats.video_viewed(instance)
 
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
@@ -126,7 +161,7 @@ class VideoViewSet(viewsets.ModelViewSet):
         return Response(
             {
                 'message': '완강 처리되었습니다.',
-                'completion': VideoCompletionSerializer(completion).data
+                'completion': VideoCompletionSerializer(completion, context={'request': request}).data
             },
             status=status.HTTP_200_OK
         )
@@ -177,18 +212,66 @@ class VideoViewSet(viewsets.ModelViewSet):
     def my_completed(self, request):
         """내가 완강한 영상 목록"""
         completed_videos = Video.objects.filter(
-            completions__user=request.user,
+            completions__user_id=request.user.pk,
             completions__is_completed=True
         ).select_related('instructor', 'category').prefetch_related('tags')
 
         page = self.paginate_queryset(completed_videos)
         if page is not None:
-            serializer = VideoListSerializer(page, many=True)
+            serializer = VideoListSerializer(page, many=True, context={'request': request})
             return self.get_paginated_response(serializer.data)
 
-        serializer = VideoListSerializer(completed_videos, many=True)
+        serializer = VideoListSerializer(completed_videos, many=True, context={'request': request})
         return Response(serializer.data)
 
+    @extend_schema(
+        tags=['영상'],
+        summary='카탈로그 패싯',
+        description=(
+            '공개 영상 중 선택한 카테고리와 태그(모두 포함)를 만족하는 영상 수, '
+            '카테고리/태그별 영상 수, 영상 ID 목록(최신순)을 반환합니다.'
+        ),
+        parameters=[
+            OpenApiParameter('category', int, description='카테고리 ID'),
+            OpenApiParameter('tags', str, description='태그 ID 목록 (쉼표 구분, 모두 포함)'),
+            OpenApiParameter('limit', int, description=f'영상 ID 개수 (기본값: 100, 최대 {FACET_IDS_MAX_LIMIT})'),
+        ],
+        responses={
+            200: OpenApiResponse(description='패싯 조회 성공'),
+            400: OpenApiResponse(description='잘못된 요청')
+        }
+    )
+    @action(detail=False, methods=['get'], permission_classes=[permissions.AllowAny])
+    def facets(self, request):
+        """카탈로그 패싯 (메모리 비트맵 기반)"""
+        try:
+            category_id = request.query_params.get('category')
+            category_id = int(category_id) if category_id else None
+            tag_ids = [int(pk) for pk in request.query_params.get('tags', '').split(',') if pk.strip()]
+            limit = min(int(request.query_params.get('limit', 100)), FACET_IDS_MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {'error': 'category, tags, limit 은 숫자여야 합니다.'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        matched, category_counts, tag_counts = facets.query(category_id, tag_ids)
+        ids = matched[::-1][:max(limit, 0)]
+
+        snapshot = taxonomy.get_snapshot()
+        return Response({
+            'count': int(matched.size),
+            'ids': ids.tolist(),
+            'categories': [
+                {'id': item['id'], 'name': item['name'], 'slug': item['slug'], 'count': category_counts[item['id']]}
+                for item in snapshot['categories'] if item['id'] in category_counts
+            ],
+            'tags': [
+                {'id': item['id'], 'name': item['name'], 'slug': item['slug'], 'count': tag_counts[item['id']]}
+                for item in snapshot['tags'] if item['id'] in tag_counts
+            ],
+        })
+
     @extend_schema(
         tags=['영상'],
         summary='영상 스트리밍',
@@ -300,7 +383,7 @@ class VideoViewSet(viewsets.ModelViewSet):
         return Response(
             {
                 'message': message,
-                'rating': VideoRatingSerializer(rating).data
+                'rating': VideoRatingSerializer(rating, context={'request': request}).data
             },
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
         )